@@ -81,6 +81,7 @@ ARGS_HYPEROPT = [
     "disableparamexport",
     "hyperopt_ignore_missing_space",
     "analyze_per_epoch",
+    "stream_epochs",
     "early_stop",
 ]
 
@@ -266,9 +267,17 @@ ARGS_LOOKAHEAD_ANALYSIS = [
     "targeted_trade_amount",
     "lookahead_analysis_exportfilename",
     "lookahead_allow_limit_orders",
+    "analysis_jobs",
 ]
 
-ARGS_RECURSIVE_ANALYSIS = ["timeframe", "timerange", "dataformat_ohlcv", "pairs", "startup_candle"]
+ARGS_RECURSIVE_ANALYSIS = [
+    "timeframe",
+    "timerange",
+    "dataformat_ohlcv",
+    "pairs",
+    "startup_candle",
+    "analysis_jobs",
+]
 
 # Command level configs - keep at the bottom of the above definitions
 NO_CONF_REQURIED = [
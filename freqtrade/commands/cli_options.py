@@ -305,6 +305,13 @@ AVAILABLE_CLI_OPTIONS = {
         action="store_true",
         default=False,
     ),
+    "stream_epochs": Arg(
+        "--stream-epochs",
+        help="Hand a new epoch to each worker as soon as it is free, "
+        "instead of running epochs in batches of `-j` epochs.",
+        action="store_true",
+        default=False,
+    ),
     "print_all": Arg(
         "--print-all",
         help="Print all results, not only the best ones.",
@@ -814,6 +821,13 @@ AVAILABLE_CLI_OPTIONS = {
         help="Specify startup candles to be checked (`199`, `499`, `999`, `1999`).",
         nargs="+",
     ),
+    "analysis_jobs": Arg(
+        "--analysis-jobs",
+        help="Number of worker processes to run the backtests of the analysis in. "
+        "If -1, all CPUs are used. Default: 1 (no parallel computing).",
+        type=int,
+        metavar="JOBS",
+    ),
     "lookahead_allow_limit_orders": Arg(
         "--allow-limit-orders",
         help=(
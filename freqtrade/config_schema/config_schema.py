@@ -105,6 +105,15 @@ CONF_SCHEMA = {
             "description": "Process only new candles.",
             "type": "boolean",
         },
+        "analyze_workers": {
+            "description": (
+                "Number of threads analyzing pairs concurrently. "
+                "1 analyzes pairs one after the other."
+            ),
+            "type": "integer",
+            "minimum": 1,
+            "default": 1,
+        },
         "minimal_roi": {
             "description": f"Minimum return on investment. {__IN_STRATEGY}",
             "type": "object",
@@ -217,6 +226,16 @@ CONF_SCHEMA = {
             "uniqueItems": True,
             "default": [199, 399, 499, 999, 1999],
         },
+        "analysis_jobs": {
+            "description": (
+                "Number of worker processes for the backtests of lookahead and recursive "
+                "analysis. -1 uses all CPUs. 1 runs them in the main process."
+            ),
+            "type": "integer",
+            "minimum": -1,
+            "not": {"enum": [0]},
+            "default": 1,
+        },
         "liquidation_buffer": {
             "description": "Buffer ratio for liquidation.",
             "type": "number",
@@ -228,6 +247,14 @@ CONF_SCHEMA = {
             "type": "array",
             "items": {"type": "string", "enum": BACKTEST_BREAKDOWNS},
         },
+        "backtest_array_data": {
+            "description": (
+                "Keep backtest candles in numpy arrays and skip candles without "
+                "entry signal or open trade."
+            ),
+            "type": "boolean",
+            "default": False,
+        },
         "bot_name": {
             "description": "Name of the trading bot. Passed via API to a client.",
             "type": "string",
@@ -1102,6 +1129,24 @@ CONF_SCHEMA = {
                     "type": "boolean",
                     "default": False,
                 },
+                "train_workers": {
+                    "description": (
+                        "Number of threads training pairs concurrently in dry/live. "
+                        "Pairs are prioritized by open trade exposure and model age."
+                    ),
+                    "type": "integer",
+                    "minimum": 1,
+                    "default": 1,
+                },
+                "backtest_parallel_workers": {
+                    "description": (
+                        "Number of processes training backtesting windows in parallel. "
+                        "0 or 1 trains them serially."
+                    ),
+                    "type": "integer",
+                    "minimum": 0,
+                    "default": 0,
+                },
                 "fit_live_predictions_candles": {
                     "description": (
                         "Number of historical candles to use for computing target (label) "
@@ -1172,6 +1217,14 @@ CONF_SCHEMA = {
                             "type": "integer",
                             "default": 0,
                         },
+                        "incremental_features": {
+                            "description": (
+                                "Only populate features of new candles in dry/live, reusing "
+                                "the features populated on previous candles."
+                            ),
+                            "type": "boolean",
+                            "default": False,
+                        },
                         "DI_threshold": {
                             "description": (
                                 "Activates the use of the Dissimilarity Index for "
@@ -1180,6 +1233,16 @@ CONF_SCHEMA = {
                             "type": "number",
                             "default": 0,
                         },
+                        "DI_index": {
+                            "description": (
+                                "How the Dissimilarity Index finds the nearest training point. "
+                                "`pairwise` computes the distance to every training point, "
+                                "`kd_tree` and `ball_tree` query a tree built when training."
+                            ),
+                            "type": "string",
+                            "enum": ["pairwise", "kd_tree", "ball_tree"],
+                            "default": "pairwise",
+                        },
                         "weight_factor": {
                             "description": (
                                 "Weight training data points according to their recency."
@@ -343,6 +343,7 @@ class Configuration:
             ("epochs", "Parameter --epochs detected ... Will run Hyperopt with for {} epochs ..."),
             ("spaces", "Parameter -s/--spaces detected: {}"),
             ("analyze_per_epoch", "Parameter --analyze-per-epoch detected."),
+            ("stream_epochs", "Parameter --stream-epochs detected."),
             ("print_all", "Parameter --print-all detected ..."),
         ]
         self._args_to_config_loop(config, configurations)
@@ -447,6 +448,7 @@ class Configuration:
             ("minimum_trade_amount", "Minimum Trade amount: {}"),
             ("lookahead_analysis_exportfilename", "Path to store lookahead-analysis-results: {}"),
             ("startup_candle", "Startup candle to be used on recursive analysis: {}"),
+            ("analysis_jobs", "Parallel analysis jobs: {}"),
         ]
         self._args_to_config_loop(config, configurations)
 
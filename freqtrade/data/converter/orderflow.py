@@ -5,6 +5,8 @@ Functions to convert orderflow data from public_trades
 import logging
 import time
 from datetime import datetime
+from itertools import pairwise
+from typing import Any
 
 import numpy as np
 import pandas as pd
@@ -76,116 +78,329 @@ def _calculate_ohlcv_candle_start_and_end(df: pd.DataFrame, timeframe: str):
         df.drop(columns=["datetime"], inplace=True)
 
 
+def _first_positions(dates: pd.Series, lookup: pd.Index) -> np.ndarray:
+    """
+    Position of the first row of `dates` matching each entry of `lookup`, -1 if not found.
+    """
+    date_index = pd.Index(dates)
+    first_rows = np.flatnonzero(~date_index.duplicated())
+    positions = date_index[first_rows].get_indexer(lookup)
+    return np.where(positions >= 0, first_rows[positions], -1)
+
+
+def _to_ms(date: datetime) -> int:
+    # naive dates are UTC, as the candle starts calculated from trades
+    return int(pd.Timestamp(date).timestamp() * 1000)
+
+
+class OrderflowState:
+    """
+    Orderflow of one pair, kept between refreshes.
+    Holds the orderflow columns of the most recent candles keyed by candle start, and the
+    trades of the open (latest) candle. Each refresh only processes the trades which
+    arrived since the previous one, folding them into the open candle.
+    """
+
+    def __init__(self) -> None:
+        self.candles: dict[pd.Timestamp, dict[str, Any]] = {}
+        self.open_trades: pd.DataFrame | None = None
+        # newest processed trade, with the ids of all trades of that timestamp
+        self.last_timestamp: int | None = None
+        self.last_ids: set[str] = set()
+
+    def continues(self, trades: pd.DataFrame) -> bool:
+        """
+        Whether `trades` continue the processed trades. False for a different trades
+        history (e.g. another backtest) or if trades were missed between refreshes.
+        """
+        return self.last_timestamp is None or (
+            trades["timestamp"].iat[0] <= self.last_timestamp <= trades["timestamp"].iat[-1]
+        )
+
+    def new_trades(self, trades: pd.DataFrame, start_ms: int) -> pd.DataFrame:
+        """
+        Trades not processed yet, from start_ms on.
+        :param trades: Trades sorted by timestamp
+        """
+        if self.last_timestamp is not None:
+            start_ms = max(start_ms, self.last_timestamp)
+        new = trades.iloc[np.searchsorted(trades["timestamp"].to_numpy(), start_ms) :]
+        if self.last_ids:
+            new = new.loc[
+                ~((new["timestamp"] == self.last_timestamp) & new["id"].isin(self.last_ids))
+            ]
+        return new
+
+    def update(self, trades: pd.DataFrame, config: Config) -> None:
+        """
+        Fold new trades into the open candle, finishing it if trades of later candles
+        arrived. All candles touched are (re-)calculated.
+        :param trades: Trades returned by `new_trades`
+        """
+        if trades.empty:
+            return
+        trades = trades.copy()
+        _calculate_ohlcv_candle_start_and_end(trades, config["timeframe"])
+        if self.open_trades is not None:
+            trades = pd.concat([self.open_trades, trades], ignore_index=True)
+        candle_codes, candle_starts = pd.factorize(trades["candle_start"], sort=True)
+        self.candles.update(
+            _orderflow_by_candle(trades, candle_codes, candle_starts, config["orderflow"])
+        )
+        self.open_trades = trades.loc[candle_codes == len(candle_starts) - 1]
+        self.last_timestamp = int(trades["timestamp"].max())
+        self.last_ids = set(trades.loc[trades["timestamp"] == self.last_timestamp, "id"])
+
+    def trim(self, cache_size: int) -> None:
+        """
+        Only keep the latest `cache_size` candles, candles are stored in date order.
+        """
+        for candle_start in list(self.candles)[: max(len(self.candles) - cache_size, 0)]:
+            del self.candles[candle_start]
+
+
+def _orderflow_by_candle(
+    trades: pd.DataFrame, candle_codes: np.ndarray, candle_starts: pd.Index, config_orderflow
+) -> dict[pd.Timestamp, dict[str, Any]]:
+    orderflow = trades_to_orderflow_per_candle(trades, candle_codes, config_orderflow)
+    return {
+        candle_start: {col: orderflow[col][i] for col in ORDERFLOW_ADDED_COLUMNS}
+        for i, candle_start in enumerate(candle_starts)
+    }
+
+
+def _uncached_orderflow(
+    state: OrderflowState, config: Config, trades: pd.DataFrame, start_ms: int
+) -> dict[pd.Timestamp, dict[str, Any]]:
+    """
+    Calculate candles from start_ms which are older than the candles held by `state`.
+    Only happens if the cache is smaller than the number of candles to populate.
+    """
+    end_ms = _to_ms(next(iter(state.candles))) if state.candles else None
+    if end_ms is None or end_ms <= start_ms:
+        return {}
+    timestamps = trades["timestamp"].to_numpy()
+    trades = trades.iloc[
+        np.searchsorted(timestamps, start_ms) : np.searchsorted(timestamps, end_ms)
+    ].copy()
+    if trades.empty:
+        return {}
+    _calculate_ohlcv_candle_start_and_end(trades, config["timeframe"])
+    candle_codes, candle_starts = pd.factorize(trades["candle_start"], sort=True)
+    return _orderflow_by_candle(trades, candle_codes, candle_starts, config["orderflow"])
+
+
 def populate_dataframe_with_trades(
-    cached_grouped_trades: pd.DataFrame | None,
+    state: OrderflowState | None,
     config: Config,
     dataframe: pd.DataFrame,
     trades: pd.DataFrame,
-) -> tuple[pd.DataFrame, pd.DataFrame]:
+) -> tuple[pd.DataFrame, OrderflowState | None]:
     """
     Populates a dataframe with trades
+    :param state: Orderflow state of the pair from the previous call, or None
     :param dataframe: Dataframe to populate
     :param trades: Trades to populate with
-    :return: Dataframe with trades populated
+    :return: Dataframe with trades populated and the updated orderflow state
     """
 
-    timeframe = config["timeframe"]
     config_orderflow = config["orderflow"]
 
     # create columns for trades
     _init_dataframe_with_trades_columns(dataframe)
     if trades is None or trades.empty:
-        return dataframe, cached_grouped_trades
+        return dataframe, state
 
     try:
         start_time = time.time()
-        # calculate ohlcv candle start and end
-        _calculate_ohlcv_candle_start_and_end(trades, timeframe)
+        if not trades["timestamp"].is_monotonic_increasing:
+            trades = trades.sort_values("timestamp", kind="stable")
+        if state is None or not state.continues(trades):
+            state = OrderflowState()
 
         # get date of earliest max_candles candle
         max_candles = config_orderflow["max_candles"]
-        start_date = dataframe.tail(max_candles).date.iat[0]
-        # slice of trades that are before current ohlcv candles to make groupby faster
-        trades = trades.loc[trades["candle_start"] >= start_date]
-        trades.reset_index(inplace=True, drop=True)
-
-        # group trades by candle start
-        trades_grouped_by_candle_start = trades.groupby("candle_start", group_keys=False)
-
-        candle_start: datetime
-        for candle_start, trades_grouped_df in trades_grouped_by_candle_start:
-            is_between = candle_start == dataframe["date"]
-            if is_between.any():
-                # there can only be one row with the same date
-                index = dataframe.index[is_between][0]
-
-                if (
-                    cached_grouped_trades is not None
-                    and (candle_start == cached_grouped_trades["date"]).any()
-                ):
-                    # Check if the trades are already in the cache
-                    cache_idx = cached_grouped_trades.index[
-                        cached_grouped_trades["date"] == candle_start
-                    ][0]
-                    for col in ORDERFLOW_ADDED_COLUMNS:
-                        dataframe.at[index, col] = cached_grouped_trades.at[cache_idx, col]
-                    continue
-
-                dataframe.at[index, "trades"] = trades_grouped_df.drop(
-                    columns=["candle_start", "candle_end"]
-                ).to_dict(orient="records")
-
-                # Calculate orderflow for each candle
-                orderflow = trades_to_volumeprofile_with_total_delta_bid_ask(
-                    trades_grouped_df, scale=config_orderflow["scale"]
-                )
-                dataframe.at[index, "orderflow"] = orderflow.to_dict(orient="index")
-                # orderflow_series.loc[[index]] = [orderflow.to_dict(orient="index")]
-                # Calculate imbalances for each candle's orderflow
-                imbalances = trades_orderflow_to_imbalances(
-                    orderflow,
-                    imbalance_ratio=config_orderflow["imbalance_ratio"],
-                    imbalance_volume=config_orderflow["imbalance_volume"],
+        first_row = max(len(dataframe) - max_candles, 0)
+        start_ms = _to_ms(dataframe["date"].iat[first_row])
+
+        state.update(state.new_trades(trades, start_ms), config)
+        candles = _uncached_orderflow(state, config, trades, start_ms) | state.candles
+
+        # there can only be one row with the same date
+        rows = _first_positions(dataframe["date"], pd.Index(list(candles)))
+        in_window = rows >= first_row
+        if in_window.any():
+            window_candles = [
+                c for c, keep in zip(candles.values(), in_window, strict=True) if keep
+            ]
+            for col in ORDERFLOW_ADDED_COLUMNS:
+                values = dataframe[col].to_numpy(copy=True)
+                values[rows[in_window]] = np.fromiter(
+                    (candle[col] for candle in window_candles),
+                    dtype=object,
+                    count=len(window_candles),
                 )
-                dataframe.at[index, "imbalances"] = imbalances.to_dict(orient="index")
-
-                stacked_imbalance_range = config_orderflow["stacked_imbalance_range"]
-                dataframe.at[index, "stacked_imbalances_bid"] = stacked_imbalance(
-                    imbalances, label="bid", stacked_imbalance_range=stacked_imbalance_range
-                )
-
-                dataframe.at[index, "stacked_imbalances_ask"] = stacked_imbalance(
-                    imbalances, label="ask", stacked_imbalance_range=stacked_imbalance_range
-                )
-
-                bid = np.where(
-                    trades_grouped_df["side"].str.contains("sell"), trades_grouped_df["amount"], 0
-                )
-
-                ask = np.where(
-                    trades_grouped_df["side"].str.contains("buy"), trades_grouped_df["amount"], 0
-                )
-                deltas_per_trade = ask - bid
-                dataframe.at[index, "max_delta"] = deltas_per_trade.cumsum().max()
-                dataframe.at[index, "min_delta"] = deltas_per_trade.cumsum().min()
-
-                dataframe.at[index, "bid"] = bid.sum()
-                dataframe.at[index, "ask"] = ask.sum()
-                dataframe.at[index, "delta"] = (
-                    dataframe.at[index, "ask"] - dataframe.at[index, "bid"]
-                )
-                dataframe.at[index, "total_trades"] = len(trades_grouped_df)
+                dataframe[col] = values
 
         logger.debug(f"trades.groups_keys in {time.time() - start_time} seconds")
 
-        # Cache the entire dataframe
-        cached_grouped_trades = dataframe.tail(config_orderflow["cache_size"]).copy()
+        state.trim(config_orderflow["cache_size"])
 
     except Exception as e:
         logger.exception("Error populating dataframe with trades")
         raise DependencyException(e)
 
-    return dataframe, cached_grouped_trades
+    return dataframe, state
+
+
+def trades_to_orderflow_per_candle(
+    trades: pd.DataFrame, candle_codes: np.ndarray, config_orderflow: dict
+) -> dict[str, list]:
+    """
+    Calculate the orderflow columns of many candles at once.
+    Trades are grouped to candles and to (candle, price level) bins in one pass each,
+    all per candle values are computed in bulk and only converted to the per candle
+    dicts / lists stored in the dataframe at the end.
+    :param trades: Trades of all candles to calculate (not empty)
+    :param candle_codes: Candle of each trade, numbered 0..n_candles - 1 in date order
+    :param config_orderflow: orderflow configuration
+    :return: dict of ORDERFLOW_ADDED_COLUMNS, each a list with one value per candle
+    """
+    # Trades of a candle must be contiguous, in their original order
+    order = np.argsort(candle_codes, kind="stable")
+    candle_codes = np.asarray(candle_codes)[order]
+    trades = trades.iloc[order]
+    n_candles = int(candle_codes[-1]) + 1
+    bounds = np.searchsorted(candle_codes, np.arange(n_candles + 1)).tolist()
+
+    is_bid = trades["side"].str.contains("sell").to_numpy(dtype=bool)
+    is_ask = trades["side"].str.contains("buy").to_numpy(dtype=bool)
+    amount = trades["amount"].to_numpy(dtype=np.float64)
+    per_trade = pd.DataFrame(
+        {
+            "bid_amount": np.where(is_bid, amount, 0),
+            "ask_amount": np.where(is_ask, amount, 0),
+        }
+    )
+    per_trade["delta"] = per_trade["ask_amount"] - per_trade["bid_amount"]
+    per_trade["cumulative_delta"] = per_trade["delta"].groupby(candle_codes).cumsum()
+    per_candle = per_trade.groupby(candle_codes).agg(
+        bid=("bid_amount", "sum"),
+        ask=("ask_amount", "sum"),
+        max_delta=("cumulative_delta", "max"),
+        min_delta=("cumulative_delta", "min"),
+    )
+
+    result = _orderflow_levels_per_candle(
+        candle_codes,
+        trades["price"].to_numpy(dtype=np.float64),
+        is_bid,
+        is_ask,
+        per_trade,
+        config_orderflow,
+    )
+    trade_records = trades.drop(columns=["candle_start", "candle_end"]).to_dict(orient="records")
+    result["trades"] = [trade_records[s:e] for s, e in pairwise(bounds)]
+    result["max_delta"] = per_candle["max_delta"].tolist()
+    result["min_delta"] = per_candle["min_delta"].tolist()
+    result["bid"] = per_candle["bid"].tolist()
+    result["ask"] = per_candle["ask"].tolist()
+    result["delta"] = (per_candle["ask"] - per_candle["bid"]).tolist()
+    result["total_trades"] = np.diff(bounds).tolist()
+    return result
+
+
+def _orderflow_levels_per_candle(
+    candle_codes: np.ndarray,
+    price: np.ndarray,
+    is_bid: np.ndarray,
+    is_ask: np.ndarray,
+    per_trade: pd.DataFrame,
+    config_orderflow: dict,
+) -> dict[str, list]:
+    """
+    Volume profile, imbalances and stacked imbalances of each candle.
+    Bulk version of `trades_to_volumeprofile_with_total_delta_bid_ask`,
+    `trades_orderflow_to_imbalances` and `stacked_imbalance`.
+    """
+    scale = config_orderflow["scale"]
+    # round the prices to the nearest multiple of the scale
+    levels = np.round(price / scale)
+    min_level = levels.min()
+    level_offsets = (levels - min_level).astype(np.int64)
+    n_levels = int(level_offsets.max()) + 1
+
+    # one bin per (candle, price level), sorted by candle and price
+    bin_keys, bin_codes = np.unique(
+        candle_codes.astype(np.int64) * n_levels + level_offsets, return_inverse=True
+    )
+    bin_candles = bin_keys // n_levels
+    bin_prices = ((bin_keys % n_levels) + min_level) * scale
+    bin_bounds = np.searchsorted(bin_candles, np.arange(bin_candles[-1] + 2))
+
+    volume = pd.DataFrame(
+        {
+            "bid": is_bid.astype(np.int64),
+            "ask": is_ask.astype(np.int64),
+            "delta": per_trade["delta"].to_numpy(),
+            "bid_amount": per_trade["bid_amount"].to_numpy(),
+            "ask_amount": per_trade["ask_amount"].to_numpy(),
+        }
+    )
+    volume["total_volume"] = volume["ask_amount"] + volume["bid_amount"]
+    volume["total_trades"] = volume["ask"] + volume["bid"]
+    bins = volume.groupby(bin_codes).sum()
+
+    # compares bid and ask diagonally, within the same candle
+    bid = bins["bid"].to_numpy(dtype=np.float64)
+    next_ask = np.full(len(bins), np.nan)
+    next_ask[:-1] = np.where(bin_candles[1:] == bin_candles[:-1], bins["ask"].iloc[1:], np.nan)
+    enough_volume = bins["total_volume"].to_numpy() >= config_orderflow["imbalance_volume"]
+    imbalance_ratio = config_orderflow["imbalance_ratio"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bid_imbalance = ((bid / next_ask) > imbalance_ratio) & enough_volume
+        ask_imbalance = ((next_ask / bid) > imbalance_ratio) & enough_volume
+
+    prices = bin_prices.tolist()
+    bin_rows = bins.to_dict(orient="records")
+    imbalance_rows = [
+        {"bid_imbalance": b, "ask_imbalance": a}
+        for b, a in zip(bid_imbalance.tolist(), ask_imbalance.tolist(), strict=True)
+    ]
+    candle_bins = list(pairwise(bin_bounds.tolist()))
+    stacked_range = config_orderflow["stacked_imbalance_range"]
+    return {
+        "orderflow": [dict(zip(prices[s:e], bin_rows[s:e], strict=True)) for s, e in candle_bins],
+        "imbalances": [
+            dict(zip(prices[s:e], imbalance_rows[s:e], strict=True)) for s, e in candle_bins
+        ],
+        "stacked_imbalances_bid": _stacked_imbalances_per_candle(
+            bid_imbalance, bin_prices, bin_bounds, stacked_range
+        ),
+        "stacked_imbalances_ask": _stacked_imbalances_per_candle(
+            ask_imbalance, bin_prices, bin_bounds, stacked_range
+        ),
+    }
+
+
+def _stacked_imbalances_per_candle(
+    imbalance: np.ndarray, prices: np.ndarray, bin_bounds: np.ndarray, stacked_imbalance_range: int
+) -> list[list[float]]:
+    """
+    Bulk version of `stacked_imbalance`, runs of imbalances don't continue across candles.
+    :return: Start price of each stacked_imbalance_range consecutive imbalances, per candle
+    """
+    continues_run = np.zeros_like(imbalance)
+    continues_run[1:] = imbalance[:-1]
+    continues_run[bin_bounds[:-1]] = False
+    run_start = imbalance & ~continues_run
+    run_lengths = np.arange(len(imbalance)) + 1
+    if run_start.any():
+        run_lengths -= np.flatnonzero(run_start)[np.cumsum(run_start) - 1]
+    stacked = np.flatnonzero(imbalance & (run_lengths >= stacked_imbalance_range))
+    stack_prices = prices[stacked - (stacked_imbalance_range - 1)].tolist()
+    split_at = np.searchsorted(stacked, bin_bounds).tolist()
+    return [stack_prices[s:e] for s, e in pairwise(split_at)]
 
 
 def trades_to_volumeprofile_with_total_delta_bid_ask(
@@ -177,6 +177,7 @@ class DataProvider:
         timeframe: str,
         candle_type: CandleType,
         producer_name: str = "default",
+        delta: bool = False,
     ) -> tuple[bool, int]:
         """
         Append a candle to the existing external dataframe. The incoming dataframe
@@ -185,6 +186,8 @@ class DataProvider:
         :param pair: pair to get the data for
         :param timeframe: Timeframe to get data for
         :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :param delta: The incoming dataframe only holds candles since our last one,
+                      whatever its length
         :returns: False if the candle could not be appended, or the int number of missing candles.
         """
         pair_key = (pair, timeframe, candle_type)
@@ -193,7 +196,7 @@ class DataProvider:
             # The incoming dataframe must have at least 1 candle
             return (False, 0)
 
-        if len(dataframe) >= FULL_DATAFRAME_THRESHOLD:
+        if len(dataframe) >= FULL_DATAFRAME_THRESHOLD and not delta:
             # This is likely a full dataframe
             # Add the dataframe to the dataprovider
             self._replace_external_df(
@@ -225,7 +228,7 @@ class DataProvider:
         incoming_first: Timestamp = dataframe.iloc[0]["date"]
 
         # Remove existing candles that are newer than the incoming first candle
-        existing_df1 = existing_df[existing_df["date"] < incoming_first]
+        existing_df1 = existing_df.iloc[: existing_df["date"].searchsorted(incoming_first)]
 
         candle_difference = (incoming_first - local_last) / timeframe_delta
 
@@ -252,6 +255,19 @@ class DataProvider:
         )
         return (True, 0)
 
+    def _get_producer_last_candles(self, producer_name: str) -> dict[str, int]:
+        """
+        Get the date of the last candle held per pair from a producer.
+
+        :param producer_name: Name of the producer
+        :returns: Dict of pair to the timestamp (in ms) of its last candle
+        """
+        return {
+            pair: int(df["date"].iloc[-1].timestamp() * 1000)
+            for (pair, _, _), (df, _) in self.__producer_pairs_df.get(producer_name, {}).items()
+            if not df.empty
+        }
+
     def get_producer_df(
         self,
         pair: str,
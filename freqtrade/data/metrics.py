@@ -1,5 +1,6 @@
 import logging
 import math
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -253,6 +254,24 @@ def calculate_max_drawdown(
     )
 
 
+def calculate_max_drawdown_abs(profits: Iterable[float]) -> float:
+    """
+    Absolute max drawdown of a sequence of trade profits, in the order given.
+    Plain single pass equivalent of `calculate_max_drawdown(...).drawdown_abs`,
+    for callers which evaluate it frequently (e.g. protections).
+    :param profits: Profits (ratio or absolute) sorted by close date
+    :return: Max drawdown as positive value
+    """
+    cumulative = 0.0
+    high_value = 0.0
+    drawdown = 0.0
+    for profit in profits:
+        cumulative += profit
+        high_value = max(high_value, cumulative)
+        drawdown = min(drawdown, cumulative - high_value)
+    return abs(drawdown)
+
+
 def calculate_csum(trades: pd.DataFrame, starting_balance: float = 0) -> tuple[float, float]:
     """
     Calculate min/max cumsum of trades, to show if the wallet/stake amount ratio is sane
@@ -5,7 +5,6 @@ from enum import Enum
 
 import gymnasium as gym
 import numpy as np
-import pandas as pd
 from gymnasium import spaces
 from gymnasium.utils import seeding
 from pandas import DataFrame
@@ -121,6 +120,9 @@ class BaseEnvironment(gym.Env):
         """
         self.signal_features: DataFrame = df
         self.prices: DataFrame = prices
+        # steps read features and prices from arrays rather than through pandas
+        self._features: np.ndarray = np.ascontiguousarray(df.to_numpy(dtype=np.float32))
+        self._open_prices: np.ndarray = prices["open"].to_numpy(dtype=np.float64)
         self.window_size: int = window_size
         self.starting_point: bool = starting_point
         self.rr: float = reward_kwargs["rr"]
@@ -132,6 +134,8 @@ class BaseEnvironment(gym.Env):
         else:
             self.total_features = self.signal_features.shape[1]
         self.shape = (window_size, self.total_features)
+        # observations with state info are assembled in this buffer, then copied
+        self._observation: np.ndarray = np.zeros(self.shape, dtype=np.float32)
         self.set_action_space()
         self.observation_space = spaces.Box(low=-1, high=1, shape=self.shape, dtype=np.float32)
 
@@ -250,26 +254,26 @@ class BaseEnvironment(gym.Env):
         """
         return
 
-    def _get_observation(self):
+    def _get_observation(self) -> np.ndarray:
         """
         This may or may not be independent of action types, user can inherit
         this in their custom "MyRLEnv"
+        The feature window is a view onto the feature array. With `add_state_info`, the
+        window and the state are assembled in a buffer reused by every step, and a copy
+        of it is returned so observations kept by the caller (e.g. the terminal
+        observation of the vectorized environments) are not overwritten by the next step.
         """
-        features_window = self.signal_features[
+        features_window = self._features[
             (self._current_tick - self.window_size) : self._current_tick
         ]
         if self.add_state_info:
-            features_and_state = DataFrame(
-                np.zeros((len(features_window), 3)),
-                columns=["current_profit_pct", "position", "trade_duration"],
-                index=features_window.index,
-            )
-
-            features_and_state["current_profit_pct"] = self.get_unrealized_profit()
-            features_and_state["position"] = self._position.value
-            features_and_state["trade_duration"] = self.get_trade_duration()
-            features_and_state = pd.concat([features_window, features_and_state], axis=1)
-            return features_and_state
+            n_features = features_window.shape[1]
+            observation = self._observation[: len(features_window)]
+            observation[:, :n_features] = features_window
+            observation[:, n_features] = self.get_unrealized_profit()
+            observation[:, n_features + 1] = self._position.value
+            observation[:, n_features + 2] = self.get_trade_duration()
+            return observation.copy()
         else:
             return features_window
 
@@ -292,12 +296,12 @@ class BaseEnvironment(gym.Env):
         if self._position == Positions.Neutral:
             return 0.0
         elif self._position == Positions.Short:
-            current_price = self.add_entry_fee(self.prices.iloc[self._current_tick].open)
-            last_trade_price = self.add_exit_fee(self.prices.iloc[self._last_trade_tick].open)
+            current_price = self.add_entry_fee(self._open_prices[self._current_tick])
+            last_trade_price = self.add_exit_fee(self._open_prices[self._last_trade_tick])
             return (last_trade_price - current_price) / last_trade_price
         elif self._position == Positions.Long:
-            current_price = self.add_exit_fee(self.prices.iloc[self._current_tick].open)
-            last_trade_price = self.add_entry_fee(self.prices.iloc[self._last_trade_tick].open)
+            current_price = self.add_exit_fee(self._open_prices[self._current_tick])
+            last_trade_price = self.add_entry_fee(self._open_prices[self._last_trade_tick])
             return (current_price - last_trade_price) / last_trade_price
         else:
             return 0.0
@@ -373,7 +377,7 @@ class BaseEnvironment(gym.Env):
             self._total_profit += pnl
 
     def current_price(self) -> float:
-        return self.prices.iloc[self._current_tick].open
+        return float(self._open_prices[self._current_tick])
 
     def get_actions(self) -> type[Enum]:
         """
@@ -35,6 +35,8 @@ torch.multiprocessing.set_sharing_strategy("file_system")
 
 SB3_MODELS = ["PPO", "A2C", "DQN"]
 SB3_CONTRIB_MODELS = ["TRPO", "ARS", "RecurrentPPO", "MaskablePPO", "QRDQN"]
+# observation windows passed to the policy per predict call
+RL_PREDICT_BATCH_SIZE = 1024
 
 
 class BaseReinforcementLearningModel(IFreqaiModel):
@@ -49,6 +51,12 @@ class BaseReinforcementLearningModel(IFreqaiModel):
             max(int(self.max_system_threads / 2), 1),
         )
         th.set_num_threads(self.max_threads)
+        if self.train_workers > 1:
+            logger.warning(
+                "Reinforcement learning models keep their training environments on the model, "
+                "setting train_workers to 1."
+            )
+            self.train_workers = 1
         self.reward_params = self.freqai_info["rl_config"]["model_reward_parameters"]
         self.train_env: VecMonitor | SubprocVecEnv | gym.Env = gym.Env()
         self.eval_env: VecMonitor | SubprocVecEnv | gym.Env = gym.Env()
@@ -282,19 +290,44 @@ class BaseReinforcementLearningModel(IFreqaiModel):
     ) -> DataFrame:
         """
         A helper function to make predictions in the Reinforcement learning module.
+        The observation windows of all candles are strided views over the features, passed
+        to the policy in batches. Rows without a full window are left as NaN.
         :param dataframe: DataFrame = the dataframe of features to make the predictions on
         :param dk: FreqaiDatakitchen = data kitchen for the current pair
         :param model: Any = the trained model used to inference the features.
         """
+        if self.live and self.rl_config.get("add_state_info", False):
+            return self._rl_model_predict_with_state(dataframe, dk, model)
+
+        predictions = np.full(len(dataframe), np.nan)
+        if len(dataframe) >= self.CONV_WIDTH:
+            features = np.ascontiguousarray(dataframe.to_numpy(dtype=np.float32))
+            # (n_windows, CONV_WIDTH, n_features) view, window i ends on row i + CONV_WIDTH - 1
+            windows = np.lib.stride_tricks.sliding_window_view(
+                features, self.CONV_WIDTH, axis=0
+            ).transpose(0, 2, 1)
+            for start in range(0, len(windows), RL_PREDICT_BATCH_SIZE):
+                batch = windows[start : start + RL_PREDICT_BATCH_SIZE]
+                actions, _ = model.predict(batch, deterministic=True)
+                offset = start + self.CONV_WIDTH - 1
+                predictions[offset : offset + len(batch)] = np.asarray(actions).reshape(-1)
+
+        return pd.DataFrame(predictions, columns=dk.label_list)
+
+    def _rl_model_predict_with_state(
+        self, dataframe: DataFrame, dk: FreqaiDataKitchen, model: Any
+    ) -> DataFrame:
+        """
+        Predict row by row, adding the current trade state to each observation.
+        """
         output = pd.DataFrame(np.zeros(len(dataframe)), columns=dk.label_list)
 
         def _predict(window):
             observations = dataframe.iloc[window.index]
-            if self.live and self.rl_config.get("add_state_info", False):
-                market_side, current_profit, trade_duration = self.get_state_info(dk.pair)
-                observations["current_profit_pct"] = current_profit
-                observations["position"] = market_side
-                observations["trade_duration"] = trade_duration
+            market_side, current_profit, trade_duration = self.get_state_info(dk.pair)
+            observations["current_profit_pct"] = current_profit
+            observations["position"] = market_side
+            observations["trade_duration"] = trade_duration
             res, _ = model.predict(observations, deterministic=True)
             return res
 
@@ -76,17 +76,14 @@ class BasePyTorchClassifier(BasePyTorchModel):
             dk.data_dictionary["prediction_features"], outlier_check=True
         )
 
-        x = self.data_convertor.convert_x(
-            dk.data_dictionary["prediction_features"], device=self.device
+        # chunks are moved to the device by the inference engine
+        x = self.data_convertor.convert_x(dk.data_dictionary["prediction_features"], device="cpu")
+        probs = self.get_inference_engine(dk.pair).predict(
+            x, postprocess=lambda logits: F.softmax(logits, dim=-1)
         )
-        self.model.model.eval()
-        logits = self.model.model(x)
-        probs = F.softmax(logits, dim=-1)
-        predicted_classes = torch.argmax(probs, dim=-1)
+        predicted_classes = probs.argmax(axis=-1)
         predicted_classes_str = self.decode_class_names(predicted_classes)
-        # used .tolist to convert probs into an iterable, in this way Tensors
-        # are automatically moved to the CPU first if necessary.
-        pred_df_prob = DataFrame(probs.detach().tolist(), columns=class_names)
+        pred_df_prob = DataFrame(probs, columns=class_names)
         pred_df = DataFrame(predicted_classes_str, columns=[dk.label_list[0]])
         pred_df = pd.concat([pred_df, pred_df_prob], axis=1)
 
@@ -127,12 +124,12 @@ class BasePyTorchClassifier(BasePyTorchModel):
                 f"expecting labels: {class_names}",
             )
 
-    def decode_class_names(self, class_ints: torch.Tensor) -> list[str]:
+    def decode_class_names(self, class_ints: torch.Tensor | np.ndarray) -> list[str]:
         """
         decode class name, int -> str
         """
-
-        return list(map(lambda x: self.index_to_class_name[x.item()], class_ints))
+        # .tolist() converts both tensors and arrays to python ints in one go
+        return [self.index_to_class_name[i] for i in class_ints.tolist()]
 
     def init_class_names_to_index_mapping(self, class_names):
         self.class_name_to_index = {s: i for i, s in enumerate(class_names)}
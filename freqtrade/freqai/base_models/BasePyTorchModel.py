@@ -5,6 +5,7 @@ import torch
 
 from freqtrade.freqai.freqai_interface import IFreqaiModel
 from freqtrade.freqai.torch.PyTorchDataConvertor import PyTorchDataConvertor
+from freqtrade.freqai.torch.PyTorchInferenceEngine import PyTorchInferenceEngine
 
 
 logger = logging.getLogger(__name__)
@@ -28,6 +29,23 @@ class BasePyTorchModel(IFreqaiModel, ABC):
         test_size = self.freqai_info.get("data_split_parameters", {}).get("test_size")
         self.splits = ["train", "test"] if test_size != 0 else ["train"]
         self.window_size = self.freqai_info.get("conv_width", 1)
+        self.inference_kwargs: dict = self.freqai_info.get("model_training_parameters", {}).get(
+            "inference_kwargs", {}
+        )
+        self._inference_engines: dict[str, PyTorchInferenceEngine] = {}
+
+    def get_inference_engine(self, pair: str) -> PyTorchInferenceEngine:
+        """
+        Inference engine for the current model of `pair`, rebuilt once the model is retrained.
+        Configured through `model_training_parameters.inference_kwargs`.
+        """
+        engine = self._inference_engines.get(pair)
+        if engine is None or engine.model is not self.model.model:
+            engine = PyTorchInferenceEngine(
+                self.model.model, device=self.device, **self.inference_kwargs
+            )
+            self._inference_engines[pair] = engine
+        return engine
 
     @property
     @abstractmethod
@@ -44,12 +44,10 @@ class BasePyTorchRegressor(BasePyTorchModel):
             dk.data_dictionary["prediction_features"], outlier_check=True
         )
 
-        x = self.data_convertor.convert_x(
-            dk.data_dictionary["prediction_features"], device=self.device
-        )
-        self.model.model.eval()
-        y = self.model.model(x)
-        pred_df = DataFrame(y.detach().tolist(), columns=[dk.label_list[0]])
+        # chunks are moved to the device by the inference engine
+        x = self.data_convertor.convert_x(dk.data_dictionary["prediction_features"], device="cpu")
+        y = self.get_inference_engine(dk.pair).predict(x)
+        pred_df = DataFrame(y, columns=[dk.label_list[0]])
         pred_df, _, _ = dk.label_pipeline.inverse_transform(pred_df)
 
         if dk.feature_pipeline["di"]:
@@ -4,7 +4,6 @@ import logging
 import re
 import shutil
 import threading
-import warnings
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any, TypedDict
@@ -23,6 +22,10 @@ from freqtrade.data.history import load_pair_history
 from freqtrade.enums import CandleType
 from freqtrade.exceptions import OperationalException
 from freqtrade.freqai.data_kitchen import FreqaiDataKitchen
+from freqtrade.freqai.historic_predictions import (
+    HISTORIC_PREDICTIONS_ARROW,
+    HistoricPredictions,
+)
 from freqtrade.strategy.interface import IStrategy
 
 
@@ -78,12 +81,16 @@ class FreqaiDataDrawer:
         self.meta_data_dictionary: dict[str, dict[str, Any]] = {}
         self.model_return_values: dict[str, DataFrame] = {}
         self.historic_data: dict[str, dict[str, DataFrame]] = {}
-        self.historic_predictions: dict[str, DataFrame] = {}
+        # populated features per (pair, timeframe), reused by incremental feature population
+        self.feature_cache: dict[tuple[str, str], DataFrame] = {}
         self.full_path = full_path
-        self.historic_predictions_path = Path(self.full_path / "historic_predictions.pkl")
+        self.historic_predictions_path = Path(self.full_path / "historic_predictions")
+        # cloudpickle files written by earlier versions, only read for migration
+        self.historic_predictions_pkl_path = Path(self.full_path / "historic_predictions.pkl")
         self.historic_predictions_bkp_path = Path(
             self.full_path / "historic_predictions.backup.pkl"
         )
+        self.historic_predictions = {}
         self.pair_dictionary_path = Path(self.full_path / "pair_dictionary.json")
         self.global_metadata_path = Path(self.full_path / "global_metadata.json")
         self.metric_tracker_path = Path(self.full_path / "metric_tracker.json")
@@ -95,7 +102,10 @@ class FreqaiDataDrawer:
         self.history_lock = threading.Lock()
         self.save_lock = threading.Lock()
         self.pair_dict_lock = threading.Lock()
+        self.purge_lock = threading.Lock()
         self.metric_tracker_lock = threading.Lock()
+        # disabled in parallel backtesting workers, the parent process saves the pair_dict
+        self.save_drawer = True
         self.old_DBSCAN_eps: dict[str, float] = {}
         self.empty_pair_dict: pair_info = {
             "model_filename": "",
@@ -105,6 +115,16 @@ class FreqaiDataDrawer:
         }
         self.model_type = self.freqai_info.get("model_save_type", "joblib")
 
+    @property
+    def historic_predictions(self) -> HistoricPredictions:
+        return self._historic_predictions
+
+    @historic_predictions.setter
+    def historic_predictions(self, predictions: dict[str, DataFrame]) -> None:
+        self._historic_predictions = HistoricPredictions(
+            self.historic_predictions_path, predictions
+        )
+
     def update_metric_tracker(self, metric: str, value: float, pair: str) -> None:
         """
         General utility for adding and updating custom metrics. Typically used
@@ -171,19 +191,17 @@ class FreqaiDataDrawer:
 
     def load_historic_predictions_from_disk(self):
         """
-        Locate and load a previously saved historic predictions.
+        Locate and load previously saved historic predictions. Segment files are memory-mapped,
+        a cloudpickle file left by an earlier version is converted on the next save (if pyarrow
+        is installed).
         :return: bool - whether or not the drawer was located
         """
-        exists = self.historic_predictions_path.is_file()
-        if exists:
+        exists = self.historic_predictions.load()
+        if not exists and self.historic_predictions_pkl_path.is_file():
+            exists = True
             try:
-                with self.historic_predictions_path.open("rb") as fp:
+                with self.historic_predictions_pkl_path.open("rb") as fp:
                     self.historic_predictions = cloudpickle.load(fp)
-                logger.info(
-                    f"Found existing historic predictions at {self.full_path}, but beware "
-                    "that statistics may be inaccurate if the bot has been offline for "
-                    "an extended period of time."
-                )
             except EOFError:
                 logger.warning(
                     "Historical prediction file was corrupted. Trying to load backup file."
@@ -192,6 +210,12 @@ class FreqaiDataDrawer:
                     self.historic_predictions = cloudpickle.load(fp)
                 logger.warning("FreqAI successfully loaded the backup historical predictions file.")
 
+        if exists:
+            logger.info(
+                f"Found existing historic predictions at {self.full_path}, but beware "
+                "that statistics may be inaccurate if the bot has been offline for "
+                "an extended period of time."
+            )
         else:
             logger.info("Could not find existing historic_predictions, starting from scratch")
 
@@ -199,13 +223,20 @@ class FreqaiDataDrawer:
 
     def save_historic_predictions_to_disk(self):
         """
-        Save historic predictions pickle to disk
+        Append the historic predictions made since the last save to disk. Without pyarrow,
+        all historic predictions are pickled to disk instead, along with a backup copy.
         """
-        with self.historic_predictions_path.open("wb") as fp:
-            cloudpickle.dump(self.historic_predictions, fp, protocol=cloudpickle.DEFAULT_PROTOCOL)
+        if HISTORIC_PREDICTIONS_ARROW:
+            self.historic_predictions.save()
+            return
+
+        with self.historic_predictions_pkl_path.open("wb") as fp:
+            cloudpickle.dump(
+                dict(self.historic_predictions), fp, protocol=cloudpickle.DEFAULT_PROTOCOL
+            )
 
         # create a backup
-        shutil.copy(self.historic_predictions_path, self.historic_predictions_bkp_path)
+        shutil.copy(self.historic_predictions_pkl_path, self.historic_predictions_bkp_path)
 
     def save_metric_tracker_to_disk(self):
         """
@@ -224,6 +255,8 @@ class FreqaiDataDrawer:
         """
         Save data drawer full of all pair model metadata in present model folder.
         """
+        if not self.save_drawer:
+            return
         with self.save_lock:
             with self.pair_dictionary_path.open("w") as fp:
                 rapidjson.dump(
@@ -298,15 +331,15 @@ class FreqaiDataDrawer:
         columns_to_nan = new_pred.columns.difference(["date_pred", "date"])
         new_pred[columns_to_nan] = None
 
-        hist_preds = self.historic_predictions[pair].copy()
+        hist_dates = self.historic_predictions[pair][["date_pred"]].copy()
 
         # ensure both dataframes have the same date format so they can be merged
         new_pred["date_pred"] = pd.to_datetime(new_pred["date_pred"])
-        hist_preds["date_pred"] = pd.to_datetime(hist_preds["date_pred"])
+        hist_dates["date_pred"] = pd.to_datetime(hist_dates["date_pred"])
 
         # find the closest common date between new_pred and historic predictions
         # and cut off the new_pred dataframe at that date
-        common_dates = pd.merge(new_pred, hist_preds, on="date_pred", how="inner")
+        common_dates = pd.merge(new_pred, hist_dates, on="date_pred", how="inner")
         if len(common_dates.index) > 0:
             new_pred = new_pred.iloc[len(common_dates) :]
         else:
@@ -316,19 +349,10 @@ class FreqaiDataDrawer:
                 f"for more than {len(dataframe.index)} candles."
             )
 
-        # Pandas warns that its keeping dtypes of non NaN columns...
-        # yea we know and we already want that behavior. Ignoring.
-        with warnings.catch_warnings():
-            warnings.filterwarnings("ignore", category=FutureWarning)
-            # reindex new_pred columns to match the historic predictions dataframe
-            new_pred_reindexed = new_pred.reindex(columns=hist_preds.columns)
-            df_concat = pd.concat([hist_preds, new_pred_reindexed], ignore_index=True)
-
         # any missing values will get zeroed out so users can see the exact
         # downtime in FreqUI
-        df_concat = df_concat.fillna(0)
-        self.historic_predictions[pair] = df_concat
-        self.model_return_values[pair] = df_concat.tail(len(dataframe.index)).reset_index(drop=True)
+        self.historic_predictions.extend(pair, new_pred[["date_pred"]])
+        self.model_return_values[pair] = self.historic_predictions.tail(pair, len(dataframe.index))
 
     def append_model_predictions(
         self,
@@ -347,55 +371,35 @@ class FreqaiDataDrawer:
         """
 
         len_df = len(strat_df)
-        index = self.historic_predictions[pair].index[-1:]
-        columns = self.historic_predictions[pair].columns
-
-        zeros_df = pd.DataFrame(np.zeros((1, len(columns))), index=index, columns=columns)
-        self.historic_predictions[pair] = pd.concat(
-            [self.historic_predictions[pair], zeros_df], ignore_index=True, axis=0
-        )
-        df = self.historic_predictions[pair]
+        hist_preds = self.historic_predictions.buffer(pair)
+        row: dict[str, Any] = {}
 
         # model outputs and associated statistics
         for label in predictions.columns:
-            label_loc = df.columns.get_loc(label)
-            pred_label_loc = predictions.columns.get_loc(label)
-            df.iloc[-1, label_loc] = predictions.iloc[-1, pred_label_loc]
-            if df[label].dtype == object:
+            row[label] = predictions[label].iloc[-1]
+            if hist_preds.is_object(label):
                 continue
-            label_mean_loc = df.columns.get_loc(f"{label}_mean")
-            label_std_loc = df.columns.get_loc(f"{label}_std")
-            df.iloc[-1, label_mean_loc] = dk.data["labels_mean"][label]
-            df.iloc[-1, label_std_loc] = dk.data["labels_std"][label]
+            row[f"{label}_mean"] = dk.data["labels_mean"][label]
+            row[f"{label}_std"] = dk.data["labels_std"][label]
 
         # outlier indicators
-        do_predict_loc = df.columns.get_loc("do_predict")
-        df.iloc[-1, do_predict_loc] = do_preds[-1]
+        row["do_predict"] = do_preds[-1]
         if self.freqai_info["feature_parameters"].get("DI_threshold", 0) > 0:
-            DI_values_loc = df.columns.get_loc("DI_values")
-            df.iloc[-1, DI_values_loc] = dk.DI_values[-1]
+            row["DI_values"] = dk.DI_values[-1]
 
         # extra values the user added within custom prediction model
         if dk.data["extra_returns_per_train"]:
             rets = dk.data["extra_returns_per_train"]
             for return_str in rets:
-                return_loc = df.columns.get_loc(return_str)
-                df.iloc[-1, return_loc] = rets[return_str]
-
-        high_price_loc = df.columns.get_loc("high_price")
-        high_loc = strat_df.columns.get_loc("high")
-        df.iloc[-1, high_price_loc] = strat_df.iloc[-1, high_loc]
-        low_price_loc = df.columns.get_loc("low_price")
-        low_loc = strat_df.columns.get_loc("low")
-        df.iloc[-1, low_price_loc] = strat_df.iloc[-1, low_loc]
-        close_price_loc = df.columns.get_loc("close_price")
-        close_loc = strat_df.columns.get_loc("close")
-        df.iloc[-1, close_price_loc] = strat_df.iloc[-1, close_loc]
-        date_pred_loc = df.columns.get_loc("date_pred")
-        date_loc = strat_df.columns.get_loc("date")
-        df.iloc[-1, date_pred_loc] = strat_df.iloc[-1, date_loc]
-
-        self.model_return_values[pair] = df.tail(len_df).reset_index(drop=True)
+                row[return_str] = rets[return_str]
+
+        row["high_price"] = strat_df["high"].iloc[-1]
+        row["low_price"] = strat_df["low"].iloc[-1]
+        row["close_price"] = strat_df["close"].iloc[-1]
+        row["date_pred"] = strat_df["date"].iloc[-1]
+
+        self.historic_predictions.append(pair, row)
+        self.model_return_values[pair] = self.historic_predictions.tail(pair, len_df)
 
     def attach_return_values_to_return_dataframe(
         self, pair: str, dataframe: DataFrame
@@ -444,6 +448,10 @@ class FreqaiDataDrawer:
         elif isinstance(num_keep, bool):
             num_keep = 2
 
+        with self.purge_lock:
+            self._purge_old_models(num_keep)
+
+    def _purge_old_models(self, num_keep: int) -> None:
         model_folders = [x for x in self.full_path.iterdir() if x.is_dir()]
 
         pattern = re.compile(r"sub-train-(\w+)_(\d{10})")
@@ -501,11 +509,16 @@ class FreqaiDataDrawer:
 
         return
 
-    def save_data(self, model: Any, coin: str, dk: FreqaiDataKitchen) -> None:
+    def save_data(
+        self, model: Any, coin: str, dk: FreqaiDataKitchen, trained_timestamp: int | None = None
+    ) -> None:
         """
-        Saves all data associated with a model for a single sub-train time range
+        Saves all data associated with a model for a single sub-train time range and publishes
+        it for inferencing. The model, its metadata and the pair_dict entry are swapped in
+        together, so that `load_data` never mixes a new model with stale metadata.
         :param model: User trained model which can be reused for inferencing to generate
                       predictions
+        :param trained_timestamp: end of the training timerange, stored in the pair_dict
         """
 
         if not dk.data_path.is_dir():
@@ -546,15 +559,18 @@ class FreqaiDataDrawer:
             save_path / f"{dk.model_filename}_trained_dates_df.pkl"
         )
 
-        self.model_dictionary[coin] = model
-        self.pair_dict[coin]["model_filename"] = dk.model_filename
-        self.pair_dict[coin]["data_path"] = str(dk.data_path)
-
-        if coin not in self.meta_data_dictionary:
-            self.meta_data_dictionary[coin] = {}
-        self.meta_data_dictionary[coin][METADATA] = dk.data
-        self.meta_data_dictionary[coin][FEATURE_PIPELINE] = dk.feature_pipeline
-        self.meta_data_dictionary[coin][LABEL_PIPELINE] = dk.label_pipeline
+        meta_data = {
+            METADATA: dk.data,
+            FEATURE_PIPELINE: dk.feature_pipeline,
+            LABEL_PIPELINE: dk.label_pipeline,
+        }
+        with self.pair_dict_lock:
+            self.model_dictionary[coin] = model
+            self.meta_data_dictionary[coin] = meta_data
+            if trained_timestamp is not None:
+                self.pair_dict[coin]["trained_timestamp"] = trained_timestamp
+            self.pair_dict[coin]["model_filename"] = dk.model_filename
+            self.pair_dict[coin]["data_path"] = str(dk.data_path)
         self.save_drawer_to_disk()
 
         return
@@ -576,17 +592,23 @@ class FreqaiDataDrawer:
         :model: User trained model which can be inferenced for new predictions
         """
 
-        if not self.pair_dict[coin]["model_filename"]:
+        # snapshot the published model, trainings running on the scheduler swap it in save_data
+        with self.pair_dict_lock:
+            pair_dict = self.pair_dict[coin].copy()
+            meta_data = self.meta_data_dictionary.get(coin)
+            model = self.model_dictionary.get(coin)
+
+        if not pair_dict["model_filename"]:
             return None
 
         if dk.live:
-            dk.model_filename = self.pair_dict[coin]["model_filename"]
-            dk.data_path = Path(self.pair_dict[coin]["data_path"])
+            dk.model_filename = pair_dict["model_filename"]
+            dk.data_path = Path(pair_dict["data_path"])
 
-        if coin in self.meta_data_dictionary:
-            dk.data = self.meta_data_dictionary[coin][METADATA]
-            dk.feature_pipeline = self.meta_data_dictionary[coin][FEATURE_PIPELINE]
-            dk.label_pipeline = self.meta_data_dictionary[coin][LABEL_PIPELINE]
+        if meta_data is not None:
+            dk.data = meta_data[METADATA]
+            dk.feature_pipeline = meta_data[FEATURE_PIPELINE]
+            dk.label_pipeline = meta_data[LABEL_PIPELINE]
         else:
             with (dk.data_path / f"{dk.model_filename}_{METADATA}.json").open("r") as fp:
                 dk.data = rapidjson.load(fp, number_mode=METADATA_NUMBER_MODE)
@@ -600,23 +622,24 @@ class FreqaiDataDrawer:
         dk.label_list = dk.data["label_list"]
 
         # try to access model in memory instead of loading object from disk to save time
-        if dk.live and coin in self.model_dictionary:
-            model = self.model_dictionary[coin]
-        elif self.model_type == "joblib":
-            with (dk.data_path / f"{dk.model_filename}_model.joblib").open("rb") as fp:
-                model = cloudpickle.load(fp)
-        elif "stable_baselines" in self.model_type or "sb3_contrib" == self.model_type:
-            mod = importlib.import_module(
-                self.model_type, self.freqai_info["rl_config"]["model_type"]
-            )
-            MODELCLASS = getattr(mod, self.freqai_info["rl_config"]["model_type"])
-            model = MODELCLASS.load(dk.data_path / f"{dk.model_filename}_model")
-        elif self.model_type == "pytorch":
-            import torch
+        if not dk.live or model is None:
+            if self.model_type == "joblib":
+                with (dk.data_path / f"{dk.model_filename}_model.joblib").open("rb") as fp:
+                    model = cloudpickle.load(fp)
+            elif "stable_baselines" in self.model_type or "sb3_contrib" == self.model_type:
+                mod = importlib.import_module(
+                    self.model_type, self.freqai_info["rl_config"]["model_type"]
+                )
+                MODELCLASS = getattr(mod, self.freqai_info["rl_config"]["model_type"])
+                model = MODELCLASS.load(dk.data_path / f"{dk.model_filename}_model")
+            elif self.model_type == "pytorch":
+                import torch
 
-            zipfile = torch.load(dk.data_path / f"{dk.model_filename}_model.zip", weights_only=False)
-            model = zipfile["pytrainer"]
-            model = model.load_from_checkpoint(zipfile)
+                zipfile = torch.load(
+                    dk.data_path / f"{dk.model_filename}_model.zip", weights_only=False
+                )
+                model = zipfile["pytrainer"]
+                model = model.load_from_checkpoint(zipfile)
 
         if not model:
             raise OperationalException(
@@ -624,8 +647,9 @@ class FreqaiDataDrawer:
             )
 
         # load it into ram if it was loaded from disk
-        if coin not in self.model_dictionary:
-            self.model_dictionary[coin] = model
+        with self.pair_dict_lock:
+            if coin not in self.model_dictionary:
+                self.model_dictionary[coin] = model
 
         return model
 
@@ -741,7 +765,7 @@ class FreqaiDataDrawer:
         Returns timerange information based on historic predictions file
         :return: timerange calculated from saved live data
         """
-        if not self.historic_predictions_path.is_file():
+        if not (self.historic_predictions.exists() or self.historic_predictions_pkl_path.is_file()):
             raise OperationalException(
                 "Historic predictions not found. Historic predictions data is required "
                 "to run backtest with the freqai-backtest-live-models option "
@@ -725,6 +725,7 @@ class FreqaiDataKitchen:
         corr_dataframes: dict,
         base_dataframes: dict,
         is_corr_pairs: bool = False,
+        feature_cache: dict[tuple[str, str], DataFrame] | None = None,
     ) -> DataFrame:
         """
         Use the user defined strategy functions for populating features
@@ -734,46 +735,126 @@ class FreqaiDataKitchen:
         :param corr_dataframes: dict = dict containing the df pair dataframes
         :param base_dataframes: dict = dict containing the current pair dataframes
         :param is_corr_pairs: bool = whether the pair is a corr pair or not
+        :param feature_cache: dict = previously populated features per (pair, tf), only
+                              recomputed for new candles (see `populate_features_incremental`)
         :return: dataframe = populated dataframe
         """
         tfs: list[str] = self.freqai_config["feature_parameters"].get("include_timeframes")
 
         for tf in tfs:
-            metadata = {"pair": pair, "tf": tf}
             informative_df = self.get_pair_data_for_features(
                 pair, tf, strategy, corr_dataframes, base_dataframes, is_corr_pairs
             )
-            informative_copy = informative_df.copy()
 
             logger.debug(f"Populating features for {pair} {tf}")
 
-            for t in self.freqai_config["feature_parameters"]["indicator_periods_candles"]:
-                df_features = strategy.feature_engineering_expand_all(
-                    informative_copy.copy(), t, metadata=metadata
+            if feature_cache is not None:
+                informative_df = self.populate_features_incremental(
+                    informative_df, pair, tf, strategy, feature_cache
+                )
+            else:
+                informative_df = self.populate_informative_features(
+                    informative_df, pair, tf, strategy
                 )
-                suffix = f"{t}"
-                informative_df = self.merge_features(informative_df, df_features, tf, tf, suffix)
 
-            generic_df = strategy.feature_engineering_expand_basic(
-                informative_copy.copy(), metadata=metadata
+            dataframe = self.merge_features(
+                dataframe.copy(), informative_df, self.config["timeframe"], tf, f"{pair}_{tf}"
             )
-            suffix = "gen"
 
-            informative_df = self.merge_features(informative_df, generic_df, tf, tf, suffix)
+        return dataframe
 
-            indicators = [col for col in informative_df if col.startswith("%")]
-            for n in range(self.freqai_config["feature_parameters"]["include_shifted_candles"] + 1):
-                if n == 0:
-                    continue
-                df_shift = informative_df[indicators].shift(n)
-                df_shift = df_shift.add_suffix("_shift-" + str(n))
-                informative_df = pd.concat((informative_df, df_shift), axis=1)
+    def populate_informative_features(
+        self, informative_df: DataFrame, pair: str, tf: str, strategy: IStrategy
+    ) -> DataFrame:
+        """
+        Run the expand_all and expand_basic feature engineering of the strategy on the
+        candles of a single pair and timeframe, and add the shifted candles.
+        :param informative_df: DataFrame = candles of the pair in timeframe `tf`
+        :param pair: str = pair to populate
+        :param tf: str = timeframe of `informative_df`
+        :param strategy: IStrategy = user defined strategy object
+        :return: dataframe = candles with the features of the pair/timeframe
+        """
+        metadata = {"pair": pair, "tf": tf}
+        informative_copy = informative_df.copy()
 
-            dataframe = self.merge_features(
-                dataframe.copy(), informative_df, self.config["timeframe"], tf, f"{pair}_{tf}"
+        for t in self.freqai_config["feature_parameters"]["indicator_periods_candles"]:
+            df_features = strategy.feature_engineering_expand_all(
+                informative_copy.copy(), t, metadata=metadata
             )
+            suffix = f"{t}"
+            informative_df = self.merge_features(informative_df, df_features, tf, tf, suffix)
 
-        return dataframe
+        generic_df = strategy.feature_engineering_expand_basic(
+            informative_copy.copy(), metadata=metadata
+        )
+        suffix = "gen"
+
+        informative_df = self.merge_features(informative_df, generic_df, tf, tf, suffix)
+
+        indicators = [col for col in informative_df if col.startswith("%")]
+        for n in range(self.freqai_config["feature_parameters"]["include_shifted_candles"] + 1):
+            if n == 0:
+                continue
+            df_shift = informative_df[indicators].shift(n)
+            df_shift = df_shift.add_suffix("_shift-" + str(n))
+            informative_df = pd.concat((informative_df, df_shift), axis=1)
+
+        return informative_df
+
+    def populate_features_incremental(
+        self,
+        informative_df: DataFrame,
+        pair: str,
+        tf: str,
+        strategy: IStrategy,
+        feature_cache: dict[tuple[str, str], DataFrame],
+    ) -> DataFrame:
+        """
+        Populate the features of a pair/timeframe reusing the features cached on the previous
+        call. Only candles newer than the cache are computed, on a tail of the candles
+        holding `startup_candle_count` + `include_shifted_candles` candles of lookback.
+        Falls back to populating all candles if the cache does not line up with the candles
+        (first call, gaps, reloaded data) or the strategy does not declare a lookback.
+        :param informative_df: DataFrame = candles of the pair in timeframe `tf`
+        :param pair: str = pair to populate
+        :param tf: str = timeframe of `informative_df`
+        :param strategy: IStrategy = user defined strategy object
+        :param feature_cache: dict = populated features per (pair, tf), updated in place
+        :return: dataframe = candles with the features of the pair/timeframe
+        """
+        cached = feature_cache.get((pair, tf))
+        lookback = (
+            strategy.startup_candle_count
+            + self.freqai_config["feature_parameters"]["include_shifted_candles"]
+        )
+        features = None
+        if cached is not None and not informative_df.empty and strategy.startup_candle_count:
+            dates = informative_df["date"]
+            kept = cached.loc[cached["date"] >= dates.iloc[0]]
+            n_new = len(informative_df) - len(kept)
+            if (
+                not kept.empty
+                and n_new >= 0
+                and kept["date"].iloc[0] == dates.iloc[0]
+                and kept["date"].iloc[-1] == dates.iloc[len(kept) - 1]
+            ):
+                if n_new == 0:
+                    features = kept.reset_index(drop=True)
+                else:
+                    tail = informative_df.iloc[-(n_new + lookback) :].reset_index(drop=True)
+                    new_rows = self.populate_informative_features(tail, pair, tf, strategy)
+                    if list(new_rows.columns) == list(kept.columns):
+                        features = pd.concat(
+                            [kept, new_rows.iloc[-n_new:]], axis=0, ignore_index=True
+                        )
+
+        if features is None:
+            features = self.populate_informative_features(
+                informative_df.reset_index(drop=True), pair, tf, strategy
+            )
+        feature_cache[(pair, tf)] = features
+        return features
 
     def use_strategy_to_populate_indicators(  # noqa: C901
         self,
@@ -783,6 +864,7 @@ class FreqaiDataKitchen:
         pair: str = "",
         prediction_dataframe: DataFrame | None = None,
         do_corr_pairs: bool = True,
+        feature_cache: dict[tuple[str, str], DataFrame] | None = None,
     ) -> DataFrame:
         """
         Use the user defined strategy for populating indicators during retrain
@@ -795,6 +877,8 @@ class FreqaiDataKitchen:
         :param prediction_dataframe: DataFrame = dataframe containing the pair data
         used for prediction
         :param do_corr_pairs: bool = whether to populate corr pairs or not
+        :param feature_cache: dict = previously populated features per (pair, tf), enables
+                              incremental feature population for new candles
         :return:
         dataframe: DataFrame = dataframe containing populated indicators
         """
@@ -841,7 +925,12 @@ class FreqaiDataKitchen:
             "include_corr_pairlist", []
         )
         dataframe = self.populate_features(
-            dataframe.copy(), pair, strategy, corr_dataframes, base_dataframes
+            dataframe.copy(),
+            pair,
+            strategy,
+            corr_dataframes,
+            base_dataframes,
+            feature_cache=feature_cache,
         )
         metadata = {"pair": pair}
         dataframe = strategy.feature_engineering_standard(dataframe.copy(), metadata=metadata)
@@ -851,7 +940,13 @@ class FreqaiDataKitchen:
                 continue  # dont repeat anything from whitelist
             if corr_pairs and do_corr_pairs:
                 dataframe = self.populate_features(
-                    dataframe.copy(), corr_pair, strategy, corr_dataframes, base_dataframes, True
+                    dataframe.copy(),
+                    corr_pair,
+                    strategy,
+                    corr_dataframes,
+                    base_dataframes,
+                    True,
+                    feature_cache=feature_cache,
                 )
 
         if self.live:
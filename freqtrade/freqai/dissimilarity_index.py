@@ -0,0 +1,89 @@
+import logging
+
+import numpy as np
+from datasieve.transforms import DissimilarityIndex
+from datasieve.utils import remove_outliers
+from sklearn.metrics import pairwise_distances_chunked
+from sklearn.neighbors import NearestNeighbors
+
+
+logger = logging.getLogger(__name__)
+
+
+class TreeDissimilarityIndex(DissimilarityIndex):
+    """
+    Dissimilarity Index backed by a nearest neighbour tree (KD-tree or ball tree).
+    The tree is built once when fitting and pickled along with the feature pipeline, so
+    transforming a prediction point is a single nearest neighbour query instead of
+    computing its distance to every training point.
+    The distance to the nearest training point is exact, `di_values` are the same as the
+    ones of `DissimilarityIndex`. On training sets larger than `max_samples`, the average
+    mean distance is estimated from a random sample of `max_samples` training points.
+    """
+
+    def __init__(
+        self,
+        di_threshold: float = 1,
+        n_jobs=-1,
+        backend="loky",
+        algorithm: str = "ball_tree",
+        leaf_size: int = 40,
+        max_samples: int = 10000,
+        **kwargs,
+    ):
+        super().__init__(di_threshold=di_threshold, n_jobs=n_jobs, backend=backend, **kwargs)
+        self.algorithm = algorithm
+        self.leaf_size = leaf_size
+        self.max_samples = max_samples
+        self.neighbors: NearestNeighbors | None = None
+
+    def fit(self, X, y=None, sample_weight=None, feature_list=None, **kwargs):
+        """
+        Build the nearest neighbour tree and compute the average mean distance
+        """
+        self.neighbors = NearestNeighbors(
+            n_neighbors=1, algorithm=self.algorithm, leaf_size=self.leaf_size, n_jobs=self.n_jobs
+        ).fit(X)
+        self.avg_mean_dist = self._avg_mean_distance(np.asarray(X, dtype=float))
+
+        return X, y, sample_weight, feature_list
+
+    def _avg_mean_distance(self, X: np.ndarray) -> float:
+        """
+        Mean distance between distinct training points, computed in row chunks to keep
+        memory bounded.
+        """
+        if len(X) > self.max_samples:
+            rng = np.random.default_rng(0)
+            X = X[rng.choice(len(X), self.max_samples, replace=False)]
+        # distances of points to themselves are 0 and don't add to the total
+        total = sum(chunk.sum() for chunk in pairwise_distances_chunked(X, n_jobs=self.n_jobs))
+        n_pairs = len(X) * (len(X) - 1)
+        return total / n_pairs if n_pairs else np.nan
+
+    def transform(
+        self, X, y=None, sample_weight=None, feature_list=None, outlier_check=False, **kwargs
+    ):
+        """
+        Query the distance from each prediction point to its nearest training point, use it
+        to estimate the Dissimilarity Index (DI) and avoid making predictions on any points
+        that are too far away from the training data set.
+        """
+        if self.neighbors is None:
+            raise ValueError("TreeDissimilarityIndex must be fitted before transforming.")
+        distance, _ = self.neighbors.kneighbors(X, n_neighbors=1)
+
+        self.di_values = distance[:, 0] / self.avg_mean_dist
+        y_pred = np.where(self.di_values < self.di_threshold, 1, 0)
+
+        if not outlier_check:
+            X, y, sample_weight = remove_outliers(X, y, sample_weight, y_pred)
+        else:
+            y += y_pred
+            y -= 1
+
+        num_tossed = len(y_pred) - len(X)
+        if num_tossed > 0:
+            logger.info(f"DI tossed {num_tossed} predictions for being too far from training data.")
+
+        return X, y, sample_weight, feature_list
@@ -3,6 +3,15 @@ import threading
 import time
 from abc import ABC, abstractmethod
 from collections import deque
+from collections.abc import Collection, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Literal
@@ -25,7 +34,9 @@ from freqtrade.exceptions import OperationalException
 from freqtrade.exchange import timeframe_to_seconds
 from freqtrade.freqai.data_drawer import FreqaiDataDrawer
 from freqtrade.freqai.data_kitchen import FreqaiDataKitchen
+from freqtrade.freqai.dissimilarity_index import TreeDissimilarityIndex
 from freqtrade.freqai.utils import get_tb_logger, plot_feature_importance, record_params
+from freqtrade.persistence import Trade
 from freqtrade.strategy.interface import IStrategy
 
 
@@ -33,6 +44,31 @@ pd.options.mode.chained_assignment = None
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class BacktestingWindow:
+    """
+    A single (pair, window) backtesting training job of `start_backtesting_parallel`.
+    """
+
+    pair: str
+    model_id: int
+    trained_timestamp: int
+    dataframe_train: DataFrame
+    dataframe_backtest: DataFrame
+    can_short: bool
+
+
+class _BacktestingDataframeCaptured(Exception):
+    """
+    Raised by `IFreqaiModel.start` to hand the dataframe passed by the strategy back to
+    `start_backtesting_parallel`.
+    """
+
+    def __init__(self, dataframe: DataFrame) -> None:
+        super().__init__()
+        self.dataframe = dataframe
+
+
 class IFreqaiModel(ABC):
     """
     Class containing all tools for training and prediction in the strategy.
@@ -57,6 +93,10 @@ class IFreqaiModel(ABC):
     """
 
     def __init__(self, config: Config) -> None:
+        # model, data kitchen and tensorboard logger of the training/inference running on
+        # each thread (trainings run on the scheduler threads, inference may run on the
+        # analysis threads of the strategy)
+        self._thread_state = threading.local()
         self.config = config
         self.assert_config(self.config)
         self.freqai_info: dict[str, Any] = config["freqai"]
@@ -79,6 +119,8 @@ class IFreqaiModel(ABC):
         self.current_candle: datetime = datetime.fromtimestamp(637887600, tz=UTC)
         self.dd.current_candle = self.current_candle
         self.scanning = False
+        # set by start_backtesting_parallel while it collects the strategy dataframes
+        self._capture_backtesting_dataframe = False
         self.ft_params = self.freqai_info["feature_parameters"]
         self.corr_pairlist: list[str] = self.ft_params.get("include_corr_pairlist", [])
         self.keras: bool = self.freqai_info.get("keras", False)
@@ -92,10 +134,16 @@ class IFreqaiModel(ABC):
         self.pair_it_train = 0
         self.total_pairs = len(self.config.get("exchange", {}).get("pair_whitelist"))
         self.train_queue = self._set_train_queue()
+        self.train_workers: int = max(int(self.freqai_info.get("train_workers", 1)), 1)
+        self.train_queue_depth = 0
+        # pair -> time of its last training attempt which did not produce a new model
+        self.train_backoff: dict[str, float] = {}
+        self._train_timer_lock = threading.Lock()
         self.inference_time: float = 0
         self.train_time: float = 0
-        self.begin_time: float = 0
-        self.begin_time_train: float = 0
+        self.begin_time: dict[str, float] = {}
+        self._inference_timer_lock = threading.Lock()
+        self.begin_time_train: dict[str, float] = {}
         self.base_tf_seconds = timeframe_to_seconds(self.config["timeframe"])
         self.continual_learning = self.freqai_info.get("continual_learning", False)
         self.plot_features = self.ft_params.get("plot_feature_importances", 0)
@@ -103,17 +151,20 @@ class IFreqaiModel(ABC):
         # get_corr_dataframes is controlling the caching of corr_dataframes
         # for improved performance. Careful with this boolean.
         self.get_corr_dataframes: bool = True
+        # guards the corr_dataframes cache while pairs are analyzed concurrently
+        self._corr_cache_lock = threading.Lock()
         self._threads: list[threading.Thread] = []
         self._stop_event = threading.Event()
         self.metadata: dict[str, Any] = self.dd.load_global_metadata_from_disk()
         self.data_provider: DataProvider | None = None
         self.max_system_threads = max(int(psutil.cpu_count() * 2 - 2), 1)
         self.can_short = True  # overridden in start() with strategy.can_short
-        self.model: Any = None
+        self.model = None
         if self.ft_params.get("principal_component_analysis", False) and self.continual_learning:
             self.ft_params.update({"principal_component_analysis": False})
             logger.warning("User tried to use PCA with continual learning. Deactivating PCA.")
         self.activate_tensorboard: bool = self.freqai_info.get("activate_tensorboard", True)
+        self.incremental_features: bool = self.ft_params.get("incremental_features", False)
 
         record_params(config, self.full_path)
 
@@ -123,6 +174,40 @@ class IFreqaiModel(ABC):
         """
         return {}
 
+    @property
+    def model(self) -> Any:
+        """
+        Model of the training or prediction running on the current thread.
+        """
+        return getattr(self._thread_state, "model", None)
+
+    @model.setter
+    def model(self, model: Any) -> None:
+        self._thread_state.model = model
+
+    @property
+    def dk(self) -> FreqaiDataKitchen:
+        """
+        Data kitchen of the pair processed on the current thread.
+        """
+        return getattr(self._thread_state, "dk", None)
+
+    @dk.setter
+    def dk(self, dk: FreqaiDataKitchen) -> None:
+        self._thread_state.dk = dk
+
+    @property
+    def tb_logger(self) -> Any:
+        """
+        Tensorboard logger of the training running on the current thread, so that
+        concurrent trainings of the scheduler do not share a logger.
+        """
+        return getattr(self._thread_state, "tb_logger", None)
+
+    @tb_logger.setter
+    def tb_logger(self, tb_logger: Any) -> None:
+        self._thread_state.tb_logger = tb_logger
+
     def assert_config(self, config: Config) -> None:
         if not config.get("freqai", {}):
             raise OperationalException("No freqai parameters found in configuration file.")
@@ -138,13 +223,16 @@ class IFreqaiModel(ABC):
         :param metadata: pair metadata coming from strategy.
         :param strategy: Strategy to train on
         """
+        if self._capture_backtesting_dataframe:
+            raise _BacktestingDataframeCaptured(dataframe)
+
         self.live = strategy.dp.runmode in (RunMode.DRY_RUN, RunMode.LIVE)
         self.dd.set_pair_dict_info(metadata)
         self.data_provider = strategy.dp
         self.can_short = strategy.can_short
 
         if self.live:
-            self.inference_timer("start")
+            self.inference_timer("start", metadata["pair"])
             self.dk = FreqaiDataKitchen(self.config, self.live, metadata["pair"])
             dk = self.start_live(dataframe, metadata, strategy, self.dk)
             dataframe = dk.remove_features_from_df(dk.return_dataframe)
@@ -220,51 +308,147 @@ class IFreqaiModel(ABC):
 
     def _start_scanning(self, strategy: IStrategy) -> None:
         """
-        Function designed to constantly scan pairs for retraining on a separate thread (intracandle)
-        to improve model youth. This function is agnostic to data preparation/collection/storage,
-        it simply trains on what ever data is available in the self.dd.
+        Training scheduler designed to constantly scan pairs for retraining on a separate thread
+        (intracandle) to improve model youth. Pairs due for a retrain are ranked by
+        `get_training_priority` and handed to a pool of `train_workers` threads, so that up to
+        `train_workers` pairs are trained concurrently. This function is agnostic to data
+        preparation/collection/storage, it simply trains on what ever data is available in
+        the self.dd.
         :param strategy: IStrategy = The user defined strategy class
         """
-        while not self._stop_event.is_set():
-            time.sleep(1)
-            pair = self.train_queue[0]
+        running: dict[str, tuple[Future, int]] = {}
+        with ThreadPoolExecutor(
+            max_workers=self.train_workers, thread_name_prefix="freqai_train"
+        ) as executor:
+            while not self._stop_event.is_set():
+                time.sleep(1)
+                for pair in [pair for pair, (future, _) in running.items() if future.done()]:
+                    _, trained_timestamp = running.pop(pair)
+                    if self.dd.get_pair_dict_info(pair)[1] == trained_timestamp:
+                        # the training failed or returned early, let the other due pairs go first
+                        self.train_backoff[pair] = time.monotonic()
+                    else:
+                        self.train_backoff.pop(pair, None)
+                    # move the pair to the back of the queue, the queue order breaks ties
+                    if pair in self.train_queue:
+                        self.train_queue.remove(pair)
+                        self.train_queue.append(pair)
+                free_workers = self.train_workers - len(running)
+                if free_workers <= 0:
+                    continue
+
+                due = self.get_pairs_due_for_training(strategy, exclude=running)
+                self.train_queue_depth = len(due)
+                if len(due) > free_workers:
+                    exposure = self.get_open_trade_exposure()
+                    due.sort(
+                        key=lambda p: self.get_training_priority(
+                            p[1], exposure.get(p[0], 0), self.train_backoff.get(p[0], 0)
+                        )
+                    )
 
-            # ensure pair is available in dp
-            if pair not in strategy.dp.current_whitelist():
-                self.train_queue.popleft()
+                for pair, trained_timestamp in due[:free_workers]:
+                    if self.freqai_info.get("write_metrics_to_disk", False):
+                        self.dd.update_metric_tracker("train_queue_depth", len(due), pair)
+                        if trained_timestamp:
+                            model_age = datetime.now(UTC).timestamp() - trained_timestamp
+                            self.dd.update_metric_tracker("model_age", model_age, pair)
+                    running[pair] = (
+                        executor.submit(self._train_pair, pair, strategy),
+                        trained_timestamp,
+                    )
+
+    def get_pairs_due_for_training(
+        self, strategy: IStrategy, exclude: Collection[str] = ()
+    ) -> list[tuple[str, int]]:
+        """
+        Collect the whitelisted pairs whose model needs to be (re)trained, in train queue order.
+        Pairs which left the whitelist are removed from the train queue, pairs which joined it
+        are added to its front.
+        :param strategy: IStrategy = The user defined strategy class
+        :param exclude: pairs currently training
+        :return: list of (pair, trained_timestamp) tuples
+        """
+        whitelist = strategy.dp.current_whitelist()
+        for pair in list(self.train_queue):
+            if pair not in whitelist:
+                self.train_queue.remove(pair)
                 logger.warning(f"{pair} not in current whitelist, removing from train queue.")
+        for pair in whitelist:
+            if pair not in self.train_queue:
+                self.train_queue.appendleft(pair)
+
+        dk = FreqaiDataKitchen(self.config, self.live)
+        due = []
+        for pair in self.train_queue:
+            if pair in exclude:
                 continue
-
             (_, trained_timestamp) = self.dd.get_pair_dict_info(pair)
+            (retrain, _, _) = dk.check_if_new_training_required(trained_timestamp)
+            if retrain:
+                due.append((pair, trained_timestamp))
+        return due
 
-            dk = FreqaiDataKitchen(self.config, self.live, pair)
-            (
-                retrain,
-                new_trained_timerange,
-                data_load_timerange,
-            ) = dk.check_if_new_training_required(trained_timestamp)
+    def get_open_trade_exposure(self) -> dict[str, float]:
+        """
+        Stake currently held in open trades, per pair.
+        """
+        exposure: dict[str, float] = {}
+        for trade in Trade.get_open_trades():
+            exposure[trade.pair] = exposure.get(trade.pair, 0) + trade.stake_amount
+        return exposure
+
+    def get_training_priority(
+        self, trained_timestamp: int, exposure: float, failed_attempt: float = 0
+    ) -> tuple[float, float, int]:
+        """
+        Sort key of a pair waiting for training, lower values train first. Pairs whose last
+        training attempt did not produce a model go last (longest ago first), so a failing
+        pair cannot hold up the others. Then pairs holding open trades come first (largest
+        stake first) since their predictions drive exits, remaining ties go to the oldest
+        model. Pairs never trained have a timestamp of 0.
+        Override to customize the scheduling of trainings.
+        :param trained_timestamp: int = timestamp the current model of the pair was trained
+        :param exposure: float = stake held in open trades of the pair
+        :param failed_attempt: float = monotonic time of the last training attempt of the pair
+                               which did not produce a model, 0 if there is none
+        """
+        return (failed_attempt, -exposure, trained_timestamp)
 
-            if retrain:
-                self.train_timer("start")
-                dk.set_paths(pair, new_trained_timerange.stopts)
-                try:
-                    self.extract_data_and_train_model(
-                        new_trained_timerange, pair, strategy, dk, data_load_timerange
-                    )
-                except Exception as msg:
-                    logger.exception(
-                        f"Training {pair} raised exception {msg.__class__.__name__}. "
-                        f"Message: {msg}, skipping."
-                    )
+    def _train_pair(self, pair: str, strategy: IStrategy) -> None:
+        """
+        Train a single pair on a worker thread of the training scheduler.
+        :param pair: str = pair to train
+        :param strategy: IStrategy = The user defined strategy class
+        """
+        (_, trained_timestamp) = self.dd.get_pair_dict_info(pair)
+
+        dk = FreqaiDataKitchen(self.config, self.live, pair)
+        (
+            retrain,
+            new_trained_timerange,
+            data_load_timerange,
+        ) = dk.check_if_new_training_required(trained_timestamp)
+        if not retrain:
+            return
 
-                self.train_timer("stop", pair)
+        self.train_timer("start", pair)
+        dk.set_paths(pair, new_trained_timerange.stopts)
+        try:
+            self.extract_data_and_train_model(
+                new_trained_timerange, pair, strategy, dk, data_load_timerange
+            )
+        except Exception as msg:
+            logger.exception(
+                f"Training {pair} raised exception {msg.__class__.__name__}. "
+                f"Message: {msg}, skipping."
+            )
 
-                # only rotate the queue after the first has been trained.
-                self.train_queue.rotate(-1)
+        self.train_timer("stop", pair)
 
-                self.dd.save_historic_predictions_to_disk()
-                if self.freqai_info.get("write_metrics_to_disk", False):
-                    self.dd.save_metric_tracker_to_disk()
+        self.dd.save_historic_predictions_to_disk()
+        if self.freqai_info.get("write_metrics_to_disk", False):
+            self.dd.save_metric_tracker_to_disk()
 
     def start_backtesting(
         self, dataframe: DataFrame, metadata: dict, dk: FreqaiDataKitchen, strategy: IStrategy
@@ -341,63 +525,284 @@ class IFreqaiModel(ABC):
                     )
                     populate_indicators = False
 
-                dataframe_base_train = dataframe.loc[dataframe["date"] < tr_train.stopdt, :]
-                dataframe_base_train = strategy.set_freqai_targets(
-                    dataframe_base_train, metadata=metadata
+                dataframe_train, dataframe_backtest = self.slice_backtesting_window(
+                    dataframe, metadata, dk, strategy, tr_train, tr_backtest
                 )
-                dataframe_base_backtest = dataframe.loc[dataframe["date"] < tr_backtest.stopdt, :]
-                dataframe_base_backtest = strategy.set_freqai_targets(
-                    dataframe_base_backtest, metadata=metadata
+                append_df = self.train_and_predict_backtesting_window(
+                    dataframe_train, dataframe_backtest, pair, int(tr_train.stopts), dk
                 )
+                dk.append_predictions(append_df)
 
-                tr_train = dk.buffer_timerange(tr_train)
+        self.backtesting_fit_live_predictions(dk)
+        dk.fill_predictions(dataframe)
 
-                dataframe_train = dk.slice_dataframe(tr_train, dataframe_base_train)
-                dataframe_backtest = dk.slice_dataframe(tr_backtest, dataframe_base_backtest)
+        return dk
 
-                dataframe_train = dk.remove_special_chars_from_feature_names(dataframe_train)
-                dataframe_backtest = dk.remove_special_chars_from_feature_names(dataframe_backtest)
-                dk.get_unique_classes_from_labels(dataframe_train)
+    def slice_backtesting_window(
+        self,
+        dataframe: DataFrame,
+        metadata: dict,
+        dk: FreqaiDataKitchen,
+        strategy: IStrategy,
+        tr_train: TimeRange,
+        tr_backtest: TimeRange,
+    ) -> tuple[DataFrame, DataFrame]:
+        """
+        Set the targets and cut the train and backtest dataframes of one sliding window
+        out of the populated dataframe of a pair. `tr_train` is buffered in place.
+        :param dataframe: DataFrame = dataframe with all features populated
+        :param metadata: Dict = pair metadata
+        :param dk: FreqaiDataKitchen = Data management/analysis tool associated to present pair only
+        :param strategy: Strategy to train on
+        :param tr_train: TimeRange = training timerange of the window
+        :param tr_backtest: TimeRange = backtesting timerange of the window
+        :return: tuple of train and backtest dataframes
+        """
+        dataframe_base_train = dataframe.loc[dataframe["date"] < tr_train.stopdt, :]
+        dataframe_base_train = strategy.set_freqai_targets(dataframe_base_train, metadata=metadata)
+        dataframe_base_backtest = dataframe.loc[dataframe["date"] < tr_backtest.stopdt, :]
+        dataframe_base_backtest = strategy.set_freqai_targets(
+            dataframe_base_backtest, metadata=metadata
+        )
 
-                if not self.model_exists(dk):
-                    dk.find_features(dataframe_train)
-                    dk.find_labels(dataframe_train)
+        tr_train = dk.buffer_timerange(tr_train)
 
-                    try:
-                        self.tb_logger = get_tb_logger(
-                            self.dd.model_type, dk.data_path, self.activate_tensorboard
-                        )
-                        self.model = self.train(dataframe_train, pair, dk)
-                        self.tb_logger.close()
-                    except Exception as msg:
-                        logger.warning(
-                            f"Training {pair} raised exception {msg.__class__.__name__}. "
-                            f"Message: {msg}, skipping.",
-                            exc_info=True,
-                        )
-                        self.model = None
-
-                    self.dd.pair_dict[pair]["trained_timestamp"] = int(tr_train.stopts)
-                    if self.plot_features and self.model is not None:
-                        plot_feature_importance(self.model, pair, dk, self.plot_features)
-                    if self.save_backtest_models and self.model is not None:
-                        logger.info("Saving backtest model to disk.")
-                        self.dd.save_data(self.model, pair, dk)
-                    else:
-                        logger.info("Saving metadata to disk.")
-                        self.dd.save_metadata(dk)
-                else:
-                    self.model = self.dd.load_data(pair, dk)
+        dataframe_train = dk.slice_dataframe(tr_train, dataframe_base_train)
+        dataframe_backtest = dk.slice_dataframe(tr_backtest, dataframe_base_backtest)
 
-                pred_df, do_preds = self.predict(dataframe_backtest, dk)
-                append_df = dk.get_predictions_to_append(pred_df, do_preds, dataframe_backtest)
-                dk.append_predictions(append_df)
-                dk.save_backtesting_prediction(append_df)
+        dataframe_train = dk.remove_special_chars_from_feature_names(dataframe_train)
+        dataframe_backtest = dk.remove_special_chars_from_feature_names(dataframe_backtest)
+        return dataframe_train, dataframe_backtest
 
-        self.backtesting_fit_live_predictions(dk)
-        dk.fill_predictions(dataframe)
+    def train_and_predict_backtesting_window(
+        self,
+        dataframe_train: DataFrame,
+        dataframe_backtest: DataFrame,
+        pair: str,
+        trained_timestamp: int,
+        dk: FreqaiDataKitchen,
+    ) -> DataFrame:
+        """
+        Train (or load, if it exists on disk) the model of one sliding window, predict its
+        backtesting slice and save the predictions to `dk.backtesting_results_path`.
+        :param dataframe_train: DataFrame = training slice of the window
+        :param dataframe_backtest: DataFrame = backtesting slice of the window
+        :param pair: str = pair of the window
+        :param trained_timestamp: int = end of the training timerange
+        :param dk: FreqaiDataKitchen = Data management/analysis tool associated to present pair only
+        :return: DataFrame of the predictions to append
+        """
+        dk.get_unique_classes_from_labels(dataframe_train)
 
-        return dk
+        if not self.model_exists(dk):
+            dk.find_features(dataframe_train)
+            dk.find_labels(dataframe_train)
+
+            try:
+                self.tb_logger = get_tb_logger(
+                    self.dd.model_type, dk.data_path, self.activate_tensorboard
+                )
+                self.model = self.train(dataframe_train, pair, dk)
+                self.tb_logger.close()
+            except Exception as msg:
+                logger.warning(
+                    f"Training {pair} raised exception {msg.__class__.__name__}. "
+                    f"Message: {msg}, skipping.",
+                    exc_info=True,
+                )
+                self.model = None
+
+            self.dd.pair_dict[pair]["trained_timestamp"] = trained_timestamp
+            if self.plot_features and self.model is not None:
+                plot_feature_importance(self.model, pair, dk, self.plot_features)
+            if self.save_backtest_models and self.model is not None:
+                logger.info("Saving backtest model to disk.")
+                self.dd.save_data(self.model, pair, dk)
+            else:
+                logger.info("Saving metadata to disk.")
+                self.dd.save_metadata(dk)
+        else:
+            self.model = self.dd.load_data(pair, dk)
+
+        pred_df, do_preds = self.predict(dataframe_backtest, dk)
+        append_df = dk.get_predictions_to_append(pred_df, do_preds, dataframe_backtest)
+        dk.save_backtesting_prediction(append_df)
+        return append_df
+
+    def start_backtesting_parallel(self, data: dict[str, DataFrame], strategy: IStrategy) -> None:
+        """
+        Opt-in process pool variant of the sliding window training of `start_backtesting`,
+        enabled by setting `backtest_parallel_workers` above 1. Features of each pair are
+        populated once, then every (pair, window) without a valid backtesting prediction file
+        is trained and predicted in a worker process, which saves the predictions to the
+        `backtesting_results_path` of the window. The pair dictionary updates of the workers
+        are merged and saved once. `start_backtesting`, called afterwards from the strategy,
+        finds all predictions on disk and only assembles them, windows which failed here are
+        trained there.
+        :param data: dict of pair: dataframe of candles, as passed to `advise_all_indicators`
+        :param strategy: Strategy to train on
+        """
+        workers = int(self.freqai_info.get("backtest_parallel_workers", 0))
+        self.live = False
+        self.data_provider = strategy.dp
+        self.can_short = strategy.can_short
+
+        logger.info(f"Training backtesting windows on {workers} processes.")
+        submitted = trained = 0
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_backtesting_worker,
+            initargs=(self.config,),
+        ) as executor:
+            pending: set[Future] = set()
+            for window in self._get_backtesting_windows(data, strategy):
+                # bound the number of windows (and dataframe slices) held in memory
+                if len(pending) >= 2 * workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    trained += self._check_backtesting_windows(done)
+                pending.add(executor.submit(_train_backtesting_window, window))
+                submitted += 1
+            trained += self._check_backtesting_windows(wait(pending).done)
+
+        if trained:
+            self.dd.save_drawer_to_disk()
+        logger.info(f"Trained {trained}/{submitted} backtesting windows in parallel.")
+
+    def _get_backtesting_windows(
+        self, data: dict[str, DataFrame], strategy: IStrategy
+    ) -> Iterator[BacktestingWindow]:
+        """
+        Yield every (pair, window) that misses a valid backtesting prediction file. A pair
+        whose windows can't be prepared is left to the serial `start_backtesting`.
+        """
+        for pair, pair_data in data.items():
+            try:
+                yield from self._get_pair_backtesting_windows(pair, pair_data, strategy)
+            except Exception as msg:
+                logger.warning(
+                    f"Preparing the backtesting windows of {pair} raised exception "
+                    f"{msg.__class__.__name__}. Message: {msg}, they will be trained serially.",
+                    exc_info=True,
+                )
+
+    def _get_pair_backtesting_windows(
+        self, pair: str, pair_data: DataFrame, strategy: IStrategy
+    ) -> Iterator[BacktestingWindow]:
+        """
+        Yield the windows of a pair that miss a valid backtesting prediction file. Features
+        of a pair are only populated if at least one of its windows needs training.
+        """
+        metadata = {"pair": pair}
+        self.dd.set_pair_dict_info(metadata)
+        dk = FreqaiDataKitchen(self.config, self.live, pair)
+        dataframe = None
+        for tr_train, tr_backtest in zip(
+            dk.training_timeranges, dk.backtesting_timeranges, strict=False
+        ):
+            len_backtest_df = len(
+                pair_data.loc[
+                    (pair_data["date"] >= tr_backtest.startdt)
+                    & (pair_data["date"] < tr_backtest.stopdt),
+                    :,
+                ]
+            )
+            if not len_backtest_df:
+                continue
+            timestamp_model_id = int(tr_train.stopts)
+            dk.set_paths(pair, timestamp_model_id)
+            dk.set_new_model_names(pair, timestamp_model_id)
+            if dk.check_if_backtest_prediction_is_valid(len_backtest_df):
+                continue
+
+            if dataframe is None:
+                dataframe = self._get_strategy_backtesting_dataframe(pair, pair_data, strategy)
+                if dataframe is None:
+                    logger.warning(
+                        f"{pair} did not reach freqai.start(), its backtesting windows will "
+                        "be trained serially."
+                    )
+                    return
+                dataframe = dk.use_strategy_to_populate_indicators(
+                    strategy, prediction_dataframe=dataframe, pair=pair
+                )
+            dataframe_train, dataframe_backtest = self.slice_backtesting_window(
+                dataframe, metadata, dk, strategy, tr_train, tr_backtest
+            )
+            yield BacktestingWindow(
+                pair=pair,
+                model_id=timestamp_model_id,
+                trained_timestamp=int(tr_train.stopts),
+                dataframe_train=dataframe_train,
+                dataframe_backtest=dataframe_backtest,
+                can_short=self.can_short,
+            )
+
+    def _get_strategy_backtesting_dataframe(
+        self, pair: str, pair_data: DataFrame, strategy: IStrategy
+    ) -> DataFrame | None:
+        """
+        Run the indicator population of the strategy for a pair up to its `freqai.start()`
+        call, so the windows are cut from the same dataframe `start_backtesting` works on
+        (including orderflow and any indicators calculated before `freqai.start()`).
+        :return: the dataframe passed to `freqai.start()`, None if it was not called
+        """
+        self._capture_backtesting_dataframe = True
+        try:
+            strategy.advise_indicators(pair_data.copy(), {"pair": pair})
+        except _BacktestingDataframeCaptured as captured:
+            return captured.dataframe
+        finally:
+            self._capture_backtesting_dataframe = False
+        return None
+
+    def _check_backtesting_windows(self, futures: set[Future]) -> int:
+        """
+        Merge the pair dictionary entries of the windows trained in a worker, keeping the
+        latest window of each pair. Windows that failed are retrained by `start_backtesting`.
+        :return: number of windows trained successfully
+        """
+        trained = 0
+        for future in futures:
+            try:
+                pair, pair_dict = future.result()
+            except Exception as msg:
+                logger.warning(
+                    f"Parallel backtesting window raised exception {msg.__class__.__name__}. "
+                    f"Message: {msg}, it will be trained serially."
+                )
+                continue
+            trained += 1
+            current = self.dd.pair_dict.get(pair)
+            if not current or pair_dict["trained_timestamp"] >= current["trained_timestamp"]:
+                self.dd.pair_dict[pair] = pair_dict
+        return trained
+
+    def train_backtesting_window(self, window: BacktestingWindow) -> tuple[str, dict[str, Any]]:
+        """
+        Train and predict a single backtesting window inside a worker process of
+        `start_backtesting_parallel`. The pair dictionary is not saved by the worker, its
+        entry of the window's pair is returned to be merged by the parent process.
+        :param window: BacktestingWindow = the window to train
+        :return: tuple of the pair and its pair dictionary entry
+        """
+        self.live = False
+        self.can_short = window.can_short
+        pair = window.pair
+        self.dd.set_pair_dict_info({"pair": pair})
+        dk = FreqaiDataKitchen(self.config, self.live, pair)
+        dk.set_paths(pair, window.model_id)
+        dk.set_new_model_names(pair, window.model_id)
+        # sets dk.backtesting_results_path
+        dk.check_if_backtest_prediction_is_valid(len(window.dataframe_backtest))
+        self.train_and_predict_backtesting_window(
+            window.dataframe_train,
+            window.dataframe_backtest,
+            pair,
+            window.trained_timestamp,
+            dk,
+        )
+        self.model = None
+        return pair, dict(self.dd.pair_dict[pair])
 
     def start_live(
         self, dataframe: DataFrame, metadata: dict, strategy: IStrategy, dk: FreqaiDataKitchen
@@ -445,13 +850,20 @@ class IFreqaiModel(ABC):
         # load the model and associated data into the data kitchen
         self.model = self.dd.load_data(metadata["pair"], dk)
 
+        # read once, other pairs analyzed concurrently may flip it meanwhile
+        do_corr_pairs = self.get_corr_dataframes
         dataframe = dk.use_strategy_to_populate_indicators(
             strategy,
             prediction_dataframe=dataframe,
             pair=metadata["pair"],
-            do_corr_pairs=self.get_corr_dataframes,
+            do_corr_pairs=do_corr_pairs,
+            feature_cache=self.dd.feature_cache if self.incremental_features else None,
         )
 
+        # fill the cache even without a model, so the following pairs can use it
+        if self.corr_pairlist and (self.model or do_corr_pairs):
+            dataframe = self.cache_corr_pairlist_dfs(dataframe, dk, do_corr_pairs)
+
         if not self.model:
             logger.warning(
                 f"No model ready for {metadata['pair']}, returning null values to strategy."
@@ -459,9 +871,6 @@ class IFreqaiModel(ABC):
             self.dd.return_null_values_to_strategy(dataframe, dk)
             return dk
 
-        if self.corr_pairlist:
-            dataframe = self.cache_corr_pairlist_dfs(dataframe, dk)
-
         dk.find_labels(dataframe)
 
         self.build_strategy_return_arrays(dataframe, dk, metadata["pair"], trained_timestamp)
@@ -544,7 +953,16 @@ class IFreqaiModel(ABC):
 
         di = ft_params.get("DI_threshold", 0)
         if di:
-            pipe_steps.append(("di", ds.DissimilarityIndex(di_threshold=di, n_jobs=threads)))
+            di_index = ft_params.get("DI_index", "pairwise")
+            if di_index == "pairwise":
+                pipe_steps.append(("di", ds.DissimilarityIndex(di_threshold=di, n_jobs=threads)))
+            else:
+                pipe_steps.append(
+                    (
+                        "di",
+                        TreeDissimilarityIndex(di_threshold=di, n_jobs=threads, algorithm=di_index),
+                    )
+                )
 
         if ft_params.get("use_DBSCAN_to_remove_outliers", False):
             pipe_steps.append(("dbscan", ds.DBSCAN(n_jobs=threads)))
@@ -630,9 +1048,8 @@ class IFreqaiModel(ABC):
         model = self.train(unfiltered_dataframe, pair, dk)
         self.tb_logger.close()
 
-        self.dd.pair_dict[pair]["trained_timestamp"] = trained_timestamp
         dk.set_new_model_names(pair, trained_timestamp)
-        self.dd.save_data(model, pair, dk)
+        self.dd.save_data(model, pair, dk, trained_timestamp)
 
         if self.plot_features:
             plot_feature_importance(model, pair, dk, self.plot_features)
@@ -666,8 +1083,7 @@ class IFreqaiModel(ABC):
         :param strat_df: DataFrame = dataframe coming from strategy
         """
 
-        self.dd.historic_predictions[pair] = pred_df
-        hist_preds_df = self.dd.historic_predictions[pair]
+        hist_preds_df = pred_df
 
         self.set_start_dry_live_date(strat_df)
 
@@ -689,6 +1105,7 @@ class IFreqaiModel(ABC):
         hist_preds_df["low_price"] = strat_df["low"]
         hist_preds_df["close_price"] = strat_df["close"]
         hist_preds_df["date_pred"] = strat_df["date"]
+        self.dd.historic_predictions[pair] = hist_preds_df
 
     def fit_live_predictions(self, dk: FreqaiDataKitchen, pair: str) -> None:
         """
@@ -701,10 +1118,11 @@ class IFreqaiModel(ABC):
 
         num_candles = self.freqai_info.get("fit_live_predictions_candles", 100)
         dk.data["labels_mean"], dk.data["labels_std"] = {}, {}
+        hist_preds = self.dd.historic_predictions.buffer(dk.pair)
         for label in full_labels:
-            if self.dd.historic_predictions[dk.pair][label].dtype == object:
+            if hist_preds.is_object(label):
                 continue
-            f = spy.stats.norm.fit(self.dd.historic_predictions[dk.pair][label].tail(num_candles))
+            f = spy.stats.norm.fit(hist_preds.column_tail(label, num_candles))
             dk.data["labels_mean"][label], dk.data["labels_std"][label] = f[0], f[1]
 
         return
@@ -716,20 +1134,22 @@ class IFreqaiModel(ABC):
         of a single candle, and if so, it will warn the user of degraded performance
         """
         if do == "start":
-            self.pair_it += 1
-            self.begin_time = time.time()
+            with self._inference_timer_lock:
+                self.pair_it += 1
+                self.begin_time[pair] = time.time()
         elif do == "stop":
             end = time.time()
-            time_spent = end - self.begin_time
+            time_spent = end - self.begin_time.pop(pair, end)
             if self.freqai_info.get("write_metrics_to_disk", False):
                 self.dd.update_metric_tracker("inference_time", time_spent, pair)
-            self.inference_time += time_spent
-            if self.pair_it == self.total_pairs:
-                logger.info(
-                    f"Total time spent inferencing pairlist {self.inference_time:.2f} seconds"
-                )
-                self.pair_it = 0
-                self.inference_time = 0
+            with self._inference_timer_lock:
+                self.inference_time += time_spent
+                if self.pair_it >= self.total_pairs:
+                    logger.info(
+                        f"Total time spent inferencing pairlist {self.inference_time:.2f} seconds"
+                    )
+                    self.pair_it = 0
+                    self.inference_time = 0
         return
 
     def train_timer(self, do: Literal["start", "stop"] = "start", pair: str = ""):
@@ -738,19 +1158,21 @@ class IFreqaiModel(ABC):
         FreqAI.
         """
         if do == "start":
-            self.pair_it_train += 1
-            self.begin_time_train = time.time()
+            with self._train_timer_lock:
+                self.pair_it_train += 1
+                self.begin_time_train[pair] = time.time()
         elif do == "stop":
             end = time.time()
-            time_spent = end - self.begin_time_train
+            time_spent = end - self.begin_time_train.pop(pair, end)
             if self.freqai_info.get("write_metrics_to_disk", False):
                 self.dd.collect_metrics(time_spent, pair)
 
-            self.train_time += time_spent
-            if self.pair_it_train == self.total_pairs:
-                logger.info(f"Total time spent training pairlist {self.train_time:.2f} seconds")
-                self.pair_it_train = 0
-                self.train_time = 0
+            with self._train_timer_lock:
+                self.train_time += time_spent
+                if self.pair_it_train >= self.total_pairs:
+                    logger.info(f"Total time spent training pairlist {self.train_time:.2f} seconds")
+                    self.pair_it_train = 0
+                    self.train_time = 0
         return
 
     def get_init_model(self, pair: str) -> Any:
@@ -790,27 +1212,38 @@ class IFreqaiModel(ABC):
         )
         return best_queue
 
-    def cache_corr_pairlist_dfs(self, dataframe: DataFrame, dk: FreqaiDataKitchen) -> DataFrame:
+    def cache_corr_pairlist_dfs(
+        self, dataframe: DataFrame, dk: FreqaiDataKitchen, do_corr_pairs: bool | None = None
+    ) -> DataFrame:
         """
         Cache the corr_pairlist dfs to speed up performance for subsequent pairs during the
         current candle.
         :param dataframe: strategy fed dataframe
         :param dk: datakitchen object for current asset
+        :param do_corr_pairs: whether the corr pair features were populated on `dataframe`,
+                              defaults to the current `get_corr_dataframes`
         :return: dataframe to attach/extract cached corr_pair dfs to/from.
         """
+        if do_corr_pairs is None:
+            do_corr_pairs = self.get_corr_dataframes
 
-        if self.get_corr_dataframes:
-            self.corr_dataframes = dk.extract_corr_pair_columns_from_populated_indicators(dataframe)
-            if not self.corr_dataframes:
+        if do_corr_pairs:
+            corr_dataframes = dk.extract_corr_pair_columns_from_populated_indicators(dataframe)
+            if not corr_dataframes:
                 logger.warning(
                     "Couldn't cache corr_pair dataframes for improved performance. "
                     "Consider ensuring that the full coin/stake, e.g. XYZ/USD, "
                     "is included in the column names when you are creating features "
                     "in `feature_engineering_*` functions."
                 )
-            self.get_corr_dataframes = not bool(self.corr_dataframes)
-        elif self.corr_dataframes:
-            dataframe = dk.attach_corr_pair_columns(dataframe, self.corr_dataframes, dk.pair)
+            with self._corr_cache_lock:
+                self.corr_dataframes = corr_dataframes
+                self.get_corr_dataframes = not bool(corr_dataframes)
+        else:
+            with self._corr_cache_lock:
+                corr_dataframes = self.corr_dataframes
+            if corr_dataframes:
+                dataframe = dk.attach_corr_pair_columns(dataframe, corr_dataframes, dk.pair)
 
         return dataframe
 
@@ -822,7 +1255,8 @@ class IFreqaiModel(ABC):
         counter.
         """
         if self.dd.current_candle > self.current_candle:
-            self.get_corr_dataframes = True
+            with self._corr_cache_lock:
+                self.get_corr_dataframes = True
             self.pair_it = 1
             self.current_candle = self.dd.current_candle
 
@@ -866,9 +1300,11 @@ class IFreqaiModel(ABC):
 
     def backtesting_fit_live_predictions(self, dk: FreqaiDataKitchen):
         """
-        Apply fit_live_predictions function in backtesting with a dummy historic_predictions
-        The loop is required to simulate dry/live operation, as it is not possible to predict
-        the type of logic implemented by the user.
+        Apply fit_live_predictions function in backtesting with a dummy historic_predictions.
+        Each candle is fitted on the `fit_live_predictions_candles` predictions before it.
+        The default fit (and custom ones implementing `fit_live_predictions_rolling`) run for
+        all candles in one vectorized pass. Otherwise, a loop is required to simulate dry/live
+        operation, as it is not possible to predict the type of logic implemented by the user.
         :param dk: datakitchen object
         """
         fit_live_predictions_candles = self.freqai_info.get("fit_live_predictions_candles", 0)
@@ -885,6 +1321,12 @@ class IFreqaiModel(ABC):
                 )
             ]
 
+            if self._fits_live_predictions_rolling():
+                self._backtesting_fit_live_predictions_rolling(
+                    dk, label_columns, fit_live_predictions_candles
+                )
+                return
+
             for index in range(len(dk.full_df)):
                 if index >= fit_live_predictions_candles:
                     self.dd.historic_predictions[self.dk.pair] = dk.full_df.iloc[
@@ -908,6 +1350,76 @@ class IFreqaiModel(ABC):
 
         return
 
+    def _fits_live_predictions_rolling(self) -> bool:
+        """
+        The rolling fit is used unless `fit_live_predictions` is overridden by a class
+        which doesn't (re)implement `fit_live_predictions_rolling` as well.
+        """
+        mro = type(self).__mro__
+        fit_owner = next(c for c in mro if "fit_live_predictions" in c.__dict__)
+        rolling_owner = next(c for c in mro if "fit_live_predictions_rolling" in c.__dict__)
+        return mro.index(rolling_owner) <= mro.index(fit_owner)
+
+    def _backtesting_fit_live_predictions_rolling(
+        self, dk: FreqaiDataKitchen, label_columns: list[str], num_candles: int
+    ) -> None:
+        numeric_labels = [label for label in label_columns if dk.full_df[label].dtype != object]
+        fitted = self.fit_live_predictions_rolling(dk, dk.full_df[numeric_labels], num_candles)
+        if len(dk.full_df) <= num_candles:
+            return
+        rows = dk.full_df.index[num_candles:]
+        for col in fitted.columns:
+            dk.full_df.loc[rows, col] = fitted[col].to_numpy()[num_candles:]
+        for extra_col, value in self.dk.data["extra_returns_per_train"].items():
+            if extra_col not in fitted.columns:
+                dk.full_df.loc[rows, extra_col] = value
+
+    def fit_live_predictions_rolling(
+        self, dk: FreqaiDataKitchen, predictions: DataFrame, num_candles: int
+    ) -> DataFrame:
+        """
+        Batched `fit_live_predictions` used in backtesting: fit the labels of every candle with
+        a gaussian distribution of the `num_candles` predictions before it.
+        Mean and standard deviation come from cumulative sums, in one pass over all candles.
+        Custom `fit_live_predictions` implementations can override this method to opt into
+        the batched backtesting path.
+        :param dk: datakitchen object
+        :param predictions: Numeric label columns of the predictions, one row per candle
+        :param num_candles: Number of previous candles to fit each candle on
+        :return: Dataframe indexed like `predictions` with the `{label}_mean` and `{label}_std`
+            columns (and any extra returns) to set. Only rows from `num_candles` on are used.
+        """
+        n_rows = len(predictions)
+        values = predictions.to_numpy(dtype=float, na_value=np.nan)
+        finite = np.isfinite(values)
+        # centering the values keeps the cumulative sum of squares precise
+        offset = np.where(finite, values, 0).sum(axis=0) / np.maximum(finite.sum(axis=0), 1)
+        centered = np.where(finite, values - offset, 0)
+        zeros = np.zeros((1, values.shape[1]))
+        sums, sq_sums, n_invalid = (
+            np.concatenate([zeros, arr.cumsum(axis=0)]) for arr in (centered, centered**2, ~finite)
+        )
+
+        mean = np.full(values.shape, np.nan)
+        std = np.full(values.shape, np.nan)
+        if n_rows > num_candles:
+            # the window of row i holds rows [i - num_candles, i)
+            cur, prev = slice(num_candles, n_rows), slice(0, n_rows - num_candles)
+            window_mean = (sums[cur] - sums[prev]) / num_candles
+            window_sq = (sq_sums[cur] - sq_sums[prev]) / num_candles
+            # a non-finite prediction cannot be fitted
+            valid = n_invalid[cur] == n_invalid[prev]
+            mean[num_candles:] = np.where(valid, window_mean + offset, np.nan)
+            std[num_candles:] = np.where(
+                valid, np.sqrt(np.maximum(window_sq - window_mean**2, 0)), np.nan
+            )
+
+        fitted = {}
+        for i, label in enumerate(predictions.columns):
+            fitted[f"{label}_mean"] = mean[:, i]
+            fitted[f"{label}_std"] = std[:, i]
+        return DataFrame(fitted, index=predictions.index)
+
     def update_metadata(self, metadata: dict[str, Any]):
         """
         Update global metadata and save the updated json file
@@ -1038,3 +1550,22 @@ class IFreqaiModel(ABC):
             dk.DI_values = np.zeros(outliers.shape[0])
         dk.do_predict = outliers
         return
+
+
+# FreqAI model of a `start_backtesting_parallel` worker process
+_backtesting_model: IFreqaiModel | None = None
+
+
+def _init_backtesting_worker(config: Config) -> None:
+    global _backtesting_model
+    from freqtrade.resolvers.freqaimodel_resolver import FreqaiModelResolver
+
+    _backtesting_model = FreqaiModelResolver.load_freqaimodel(config)
+    # the parent process merges the pair dictionaries of all workers and saves it once
+    _backtesting_model.dd.save_drawer = False
+
+
+def _train_backtesting_window(window: BacktestingWindow) -> tuple[str, dict[str, Any]]:
+    if _backtesting_model is None:
+        raise OperationalException("Backtesting worker was not initialized.")
+    return _backtesting_model.train_backtesting_window(window)
@@ -0,0 +1,301 @@
+import logging
+import shutil
+import threading
+from collections.abc import Iterator, Mapping, MutableMapping
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+
+try:
+    import pyarrow as pa
+    from pyarrow import feather
+except ImportError:  # pragma: no cover
+    pa = None
+
+
+logger = logging.getLogger(__name__)
+
+# without pyarrow (e.g. on armv7l), historic predictions are pickled by the data drawer
+HISTORIC_PREDICTIONS_ARROW = pa is not None
+
+SEGMENT_SUFFIX = ".arrow"
+PAIR_METADATA_KEY = b"freqai_pair"
+# segments of a pair are rewritten into a single one on the next save past this count
+MAX_SEGMENTS_PER_PAIR = 64
+MIN_CAPACITY = 256
+
+
+class PairPredictionBuffer:
+    """
+    Preallocated, growable column buffer holding the historic predictions of a single pair.
+    Numeric columns are stored as float64, datetime columns as datetime64[ns] (timezone kept
+    aside) and anything else as object, so appending a candle is an amortized O(1) write
+    of one value per column.
+
+    Buffers created from a dataframe keep a reference to it and only convert it to
+    columns once a row is appended, which keeps assigning slices (as done by
+    `backtesting_fit_live_predictions`) cheap.
+    """
+
+    def __init__(self, df: DataFrame):
+        self.columns: list[str] = list(df.columns)
+        self.n_rows = len(df)
+        # rows [0, n_saved) are already persisted in segment files
+        self.n_saved = 0
+        self._source: DataFrame | None = df
+        self._data: dict[str, np.ndarray] = {}
+        self._tz: dict[str, Any] = {}
+        self._frame: DataFrame | None = None
+
+    @property
+    def capacity(self) -> int:
+        if self._source is not None:
+            return self.n_rows
+        return len(self._data[self.columns[0]]) if self.columns else 0
+
+    def is_object(self, column: str) -> bool:
+        if self._source is not None:
+            return self._source[column].dtype == np.dtype(object)
+        return self._data[column].dtype == np.dtype(object)
+
+    def materialize(self) -> None:
+        if self._source is None:
+            return
+        for col in self.columns:
+            self._data[col] = self._column_array(col, self._source[col])
+        self._source = None
+
+    def _column_array(self, column: str, series: pd.Series) -> np.ndarray:
+        dtype = series.dtype
+        if isinstance(dtype, pd.DatetimeTZDtype):
+            self._tz[column] = dtype.tz
+            return series.to_numpy(dtype="datetime64[ns]")
+        if pd.api.types.is_datetime64_dtype(dtype):
+            return series.to_numpy(dtype="datetime64[ns]")
+        if pd.api.types.is_numeric_dtype(dtype):
+            return series.to_numpy(dtype=np.float64, na_value=np.nan)
+        return series.to_numpy(dtype=object)
+
+    def _fill_value(self, column: str) -> Any:
+        kind = self._data[column].dtype.kind
+        return np.datetime64("NaT") if kind == "M" else 0
+
+    def _coerce(self, column: str, value: Any) -> Any:
+        if self._data[column].dtype.kind == "M" and value is not None:
+            return pd.Timestamp(value).to_datetime64()
+        return value
+
+    def _reserve(self, n_rows: int) -> None:
+        self.materialize()
+        if n_rows <= self.capacity:
+            return
+        new_capacity = max(n_rows, 2 * self.capacity, MIN_CAPACITY)
+        for col, arr in self._data.items():
+            grown = np.empty(new_capacity, dtype=arr.dtype)
+            grown[: self.n_rows] = arr[: self.n_rows]
+            self._data[col] = grown
+
+    def append(self, row: Mapping[str, Any]) -> None:
+        """
+        Append a single row. Columns missing from `row` are zero filled (NaT for dates),
+        keys that are not columns of the buffer are ignored.
+        """
+        self._reserve(self.n_rows + 1)
+        for col, arr in self._data.items():
+            arr[self.n_rows] = self._coerce(col, row.get(col, self._fill_value(col)))
+        self.n_rows += 1
+        self._frame = None
+
+    def extend(self, df: DataFrame) -> None:
+        """
+        Append all rows of `df`, zero filling columns it does not hold.
+        """
+        if df.empty:
+            return
+        self._reserve(self.n_rows + len(df))
+        stop = self.n_rows + len(df)
+        for col, arr in self._data.items():
+            if col in df.columns:
+                values = df[col]
+                if arr.dtype.kind == "M":
+                    values = pd.to_datetime(values)
+                    if isinstance(values.dtype, pd.DatetimeTZDtype):
+                        values = values.dt.tz_convert(None)
+                arr[self.n_rows : stop] = values.to_numpy(dtype=arr.dtype)
+            else:
+                arr[self.n_rows : stop] = self._fill_value(col)
+        self.n_rows = stop
+        self._frame = None
+
+    def _column(self, column: str, start: int, stop: int) -> Any:
+        values = self._data[column][start:stop]
+        if column in self._tz:
+            return pd.array(values, dtype=pd.DatetimeTZDtype(tz=self._tz[column]))
+        return values
+
+    def frame(self, start: int = 0, stop: int | None = None) -> DataFrame:
+        """
+        Dataframe of rows [start, stop). Numeric and object columns are views onto the
+        buffer and must be treated as read-only.
+        """
+        stop = self.n_rows if stop is None else stop
+        if self._source is not None:
+            return self._source.iloc[start:stop].reset_index(drop=True)
+        return DataFrame(
+            {col: self._column(col, start, stop) for col in self.columns},
+            columns=self.columns,
+            copy=False,
+        )
+
+    def to_frame(self) -> DataFrame:
+        if self._source is not None:
+            return self._source
+        if self._frame is None:
+            self._frame = self.frame()
+        return self._frame
+
+    def tail(self, n_rows: int) -> DataFrame:
+        return self.frame(max(self.n_rows - n_rows, 0))
+
+    def column_tail(self, column: str, n_rows: int) -> pd.Series:
+        start = max(self.n_rows - n_rows, 0)
+        if self._source is not None:
+            return self._source[column].iloc[start:]
+        return pd.Series(self._column(column, start, self.n_rows), name=column, copy=False)
+
+
+class HistoricPredictions(MutableMapping[str, DataFrame]):
+    """
+    Historic predictions of every pair, indexed by pair. Reading a pair returns a
+    dataframe, appends go through `append`/`extend` and only the rows added since the
+    last save are written to disk, as a new Arrow IPC (feather v2) segment per pair.
+    """
+
+    def __init__(self, path: Path, data: Mapping[str, DataFrame] | None = None):
+        """
+        :param path: Folder holding one sub-folder of segment files per pair.
+        :param data: Initial dataframes per pair.
+        """
+        self.path = path
+        self._buffers: dict[str, PairPredictionBuffer] = {}
+        self._segments: dict[str, int] = {}
+        self._lock = threading.Lock()
+        # serializes savers, e.g. concurrent trainings of the scheduler
+        self._save_lock = threading.Lock()
+        for pair, df in (data or {}).items():
+            self[pair] = df
+
+    def __getitem__(self, pair: str) -> DataFrame:
+        return self._buffers[pair].to_frame()
+
+    def __setitem__(self, pair: str, df: DataFrame) -> None:
+        # replacing the dataframe invalidates what was saved, n_saved == 0 forces a rewrite
+        self._buffers[pair] = PairPredictionBuffer(df)
+
+    def __delitem__(self, pair: str) -> None:
+        del self._buffers[pair]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._buffers)
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    def buffer(self, pair: str) -> PairPredictionBuffer:
+        return self._buffers[pair]
+
+    def append(self, pair: str, row: Mapping[str, Any]) -> None:
+        with self._lock:
+            self._buffers[pair].append(row)
+
+    def extend(self, pair: str, df: DataFrame) -> None:
+        with self._lock:
+            self._buffers[pair].extend(df)
+
+    def tail(self, pair: str, n_rows: int) -> DataFrame:
+        return self._buffers[pair].tail(n_rows)
+
+    def exists(self) -> bool:
+        return self.path.is_dir() and any(self.path.glob(f"*/*{SEGMENT_SUFFIX}"))
+
+    def _pair_path(self, pair: str) -> Path:
+        return self.path / pair.replace("/", "_").replace(":", "_")
+
+    def save(self) -> None:
+        """
+        Write the rows appended since the last save of each pair as a new segment.
+        Segments are written to a temporary file first and then renamed into place.
+        """
+        with self._save_lock:
+            self._save()
+
+    def _save(self) -> None:
+        with self._lock:
+            snapshots = []
+            for pair, buffer in self._buffers.items():
+                # persist the column types appended rows will have
+                buffer.materialize()
+                snapshots.append((pair, buffer, buffer.n_saved, buffer.n_rows))
+        for pair, buffer, n_saved, n_rows in snapshots:
+            pair_path = self._pair_path(pair)
+            if n_saved == 0:
+                shutil.rmtree(pair_path, ignore_errors=True)
+                self._segments[pair] = 0
+            if n_rows == n_saved:
+                continue
+            table = self._to_table(pair, buffer.frame(n_saved, n_rows))
+            pair_path.mkdir(parents=True, exist_ok=True)
+            segment = pair_path / f"{self._segments.get(pair, 0):08d}{SEGMENT_SUFFIX}"
+            tmp_segment = segment.with_suffix(".tmp")
+            feather.write_feather(table, tmp_segment, compression="uncompressed")
+            tmp_segment.replace(segment)
+            self._segments[pair] = self._segments.get(pair, 0) + 1
+            buffer.n_saved = n_rows
+
+    def _to_table(self, pair: str, df: DataFrame) -> "pa.Table":
+        # Arrow needs homogeneous columns, zero filled rows may sit next to strings.
+        # Object columns (e.g. classifier labels) are therefore stored as strings.
+        df = df.astype({col: str for col in df.columns if df[col].dtype == object})
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[PAIR_METADATA_KEY] = pair.encode()
+        return table.replace_schema_metadata(metadata)
+
+    def load(self) -> bool:
+        """
+        Memory-map all segments found in `path` back into buffers. A segment which can't
+        be read is dropped together with the segments following it, the pair is then
+        rewritten on the next save.
+        :return: bool - whether any segment was found
+        """
+        if not self.exists():
+            return False
+        if pa is None:
+            logger.warning("pyarrow is not installed, can't load historic predictions segments.")
+            return False
+        for pair_path in sorted(p for p in self.path.iterdir() if p.is_dir()):
+            segments = sorted(pair_path.glob(f"*{SEGMENT_SUFFIX}"))
+            tables = []
+            for segment in segments:
+                try:
+                    tables.append(feather.read_table(segment, memory_map=True))
+                except (OSError, pa.ArrowException) as e:
+                    logger.warning(
+                        f"Historic predictions segment {segment} is corrupted, dropping it and "
+                        f"the {len(segments) - len(tables) - 1} segments following it. {e}"
+                    )
+                    break
+            if not tables:
+                continue
+            pair = tables[0].schema.metadata[PAIR_METADATA_KEY].decode()
+            df = pa.concat_tables(tables, promote_options="permissive").to_pandas(split_blocks=True)
+            buffer = PairPredictionBuffer(df)
+            self._buffers[pair] = buffer
+            self._segments[pair] = int(segments[-1].stem) + 1
+            if len(tables) == len(segments) <= MAX_SEGMENTS_PER_PAIR:
+                buffer.n_saved = buffer.n_rows
+        return True
@@ -3,80 +3,21 @@ LEA LSTM Model for FreqAI
 Based on: Deep Learning in Quantitative Trading (Zhang & Zohren, 2025)
 """
 from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
 import torch
-import torch.nn as nn
 
 from freqtrade.freqai.base_models.BasePyTorchRegressor import BasePyTorchRegressor
 from freqtrade.freqai.data_kitchen import FreqaiDataKitchen
+from freqtrade.freqai.torch.datasets import sliding_windows
+from freqtrade.freqai.torch.LSTMWithAttention import LSTMWithAttention
 from freqtrade.freqai.torch.PyTorchDataConvertor import (
     DefaultPyTorchDataConvertor,
     PyTorchDataConvertor,
 )
-from freqtrade.freqai.torch.PyTorchModelTrainer import PyTorchModelTrainer
-
-
-class LSTMWithAttention(nn.Module):
-    """
-    LSTM model with optional attention mechanism
-    """
-    def __init__(
-        self,
-        input_dim: int,
-        hidden_dim: int = 128,
-        num_layers: int = 2,
-        dropout: float = 0.25,
-        sequence_len: int = 48,
-        use_attention: bool = True,
-    ):
-        super().__init__()
-        self.hidden_dim = hidden_dim
-        self.num_layers = num_layers
-        self.use_attention = use_attention
-
-        # LSTM layers
-        self.lstm = nn.LSTM(
-            input_size=input_dim,
-            hidden_size=hidden_dim,
-            num_layers=num_layers,
-            dropout=dropout if num_layers > 1 else 0,
-            batch_first=True,
-            bidirectional=False
-        )
-
-        # Attention mechanism
-        if use_attention:
-            self.attention = nn.Sequential(
-                nn.Linear(hidden_dim, hidden_dim),
-                nn.Tanh(),
-                nn.Linear(hidden_dim, 1)
-            )
-
-        # Output layer
-        self.fc = nn.Sequential(
-            nn.Linear(hidden_dim, hidden_dim // 2),
-            nn.ReLU(),
-            nn.Dropout(dropout),
-            nn.Linear(hidden_dim // 2, 1)
-        )
-
-    def forward(self, x):
-        # x shape: (batch_size, sequence_len, input_dim)
-        lstm_out, _ = self.lstm(x)  # (batch_size, sequence_len, hidden_dim)
-
-        if self.use_attention:
-            # Attention weights
-            attention_weights = self.attention(lstm_out)  # (batch_size, sequence_len, 1)
-            attention_weights = torch.softmax(attention_weights, dim=1)
-
-            # Weighted sum
-            context = torch.sum(attention_weights * lstm_out, dim=1)  # (batch_size, hidden_dim)
-        else:
-            # Use last output
-            context = lstm_out[:, -1, :]  # (batch_size, hidden_dim)
-
-        # Final prediction
-        output = self.fc(context)  # (batch_size, 1)
-        return output
+from freqtrade.freqai.torch.PyTorchModelTrainer import PyTorchSequenceTrainer
 
 
 class LeaTorchLSTM(BasePyTorchRegressor):
@@ -84,6 +25,8 @@ class LeaTorchLSTM(BasePyTorchRegressor):
     LEA LSTM FreqAI Model
 
     Implements LSTM-based price prediction with attention mechanism.
+    Each prediction is made from the last `sequence` candles, fed to the model as
+    a (batch, sequence, n_features) window.
 
     Config example:
     {
@@ -124,6 +67,10 @@ class LeaTorchLSTM(BasePyTorchRegressor):
         self.n_epochs: int = config.get("epochs", 15)
         self.batch_size: int = config.get("batch_size", 64)
 
+        # Live inference receives the last `sequence` candles instead of `conv_width`
+        self.window_size = self.sequence_len
+        self.CONV_WIDTH = self.sequence_len
+
     def fit(self, data_dictionary: dict, dk: FreqaiDataKitchen, **kwargs) -> Any:
         """
         Train the LSTM model
@@ -154,12 +101,13 @@ class LeaTorchLSTM(BasePyTorchRegressor):
         # Check if continual learning is activated
         trainer = self.get_init_model(dk.pair)
         if trainer is None:
-            trainer = PyTorchModelTrainer(
+            trainer = PyTorchSequenceTrainer(
                 model=model,
                 optimizer=optimizer,
                 criterion=criterion,
                 device=self.device,
                 data_convertor=self.data_convertor,
+                window_size=self.sequence_len,
                 tb_logger=self.tb_logger,
                 n_epochs=self.n_epochs,
                 batch_size=self.batch_size,
@@ -167,3 +115,63 @@ class LeaTorchLSTM(BasePyTorchRegressor):
 
         trainer.fit(data_dictionary, self.splits)
         return trainer
+
+    def predict(
+        self, unfiltered_df: pd.DataFrame, dk: FreqaiDataKitchen, **kwargs
+    ) -> tuple[pd.DataFrame, npt.NDArray[np.int_]]:
+        """
+        Filter the prediction features data and predict with it.
+        The first prediction (and every backtest window) predicts every row from strided
+        windows over the feature tensor. Subsequent live predictions only run the last
+        window, a single forward pass of shape (1, sequence, n_features).
+        :param unfiltered_df: Full dataframe for the current backtest period.
+        :return:
+        :pred_df: dataframe containing the predictions
+        :do_predict: np.array of 1s and 0s to indicate places where freqai needed to remove
+        data (NaNs) or felt uncertain about data (PCA and DI index)
+        """
+
+        dk.find_features(unfiltered_df)
+        filtered_df, _ = dk.filter_features(
+            unfiltered_df, dk.training_features_list, training_filter=False
+        )
+        dk.data_dictionary["prediction_features"] = filtered_df
+
+        dk.data_dictionary["prediction_features"], outliers, _ = dk.feature_pipeline.transform(
+            dk.data_dictionary["prediction_features"], outlier_check=True
+        )
+
+        x = self.data_convertor.convert_x(
+            dk.data_dictionary["prediction_features"], device=self.device
+        ).contiguous()
+        first = kwargs.get("first", True)
+        if first:
+            windows = sliding_windows(x, self.sequence_len)
+        else:
+            windows = sliding_windows(x[-self.sequence_len :], self.sequence_len)
+
+        self.model.model.eval()
+        y = np.zeros((len(windows), 1), dtype=np.float32)
+        with torch.no_grad():
+            for start in range(0, len(windows), self.batch_size):
+                xb = windows[start : start + self.batch_size]
+                y[start : start + len(xb)] = self.model.model(xb).cpu().numpy()
+
+        pred_df = pd.DataFrame(y, columns=[dk.label_list[0]])
+        pred_df, _, _ = dk.label_pipeline.inverse_transform(pred_df)
+
+        if dk.feature_pipeline["di"]:
+            dk.DI_values = dk.feature_pipeline["di"].di_values
+        else:
+            dk.DI_values = np.zeros(outliers.shape[0])
+
+        # rows without a full window of history cannot be predicted
+        n_warmup = (len(x) if first else 1) - len(pred_df)
+        if n_warmup > 0:
+            outliers[: len(outliers) - len(pred_df)] = 0
+            zeros_df = pd.DataFrame(
+                np.zeros((n_warmup, len(pred_df.columns))), columns=pred_df.columns
+            )
+            pred_df = pd.concat([zeros_df, pred_df], axis=0, ignore_index=True)
+        dk.do_predict = outliers
+        return (pred_df, dk.do_predict)
@@ -7,6 +7,7 @@ import torch
 
 from freqtrade.freqai.base_models.BasePyTorchRegressor import BasePyTorchRegressor
 from freqtrade.freqai.data_kitchen import FreqaiDataKitchen
+from freqtrade.freqai.torch.datasets import sliding_windows
 from freqtrade.freqai.torch.PyTorchDataConvertor import (
     DefaultPyTorchDataConvertor,
     PyTorchDataConvertor,
@@ -119,26 +120,18 @@ class PyTorchTransformerRegressor(BasePyTorchRegressor):
             dk.data_dictionary["prediction_features"], outlier_check=True
         )
 
-        x = self.data_convertor.convert_x(
-            dk.data_dictionary["prediction_features"], device=self.device
-        )
+        # chunks are moved to the device by the inference engine
+        x = self.data_convertor.convert_x(dk.data_dictionary["prediction_features"], device="cpu")
         # if user is asking for multiple predictions, slide the window
         # along the tensor
-        x = x.unsqueeze(0)
-        # create empty torch tensor
-        self.model.model.eval()
-        yb = torch.empty(0).to(self.device)
-        if x.shape[1] > self.window_size:
-            ws = self.window_size
-            for i in range(0, x.shape[1] - ws):
-                xb = x[:, i : i + ws, :].to(self.device)
-                y = self.model.model(xb)
-                yb = torch.cat((yb, y), dim=1)
+        ws = self.window_size
+        if len(x) > ws:
+            windows = sliding_windows(x, ws)[: len(x) - ws]
         else:
-            yb = self.model.model(x)
+            windows = x.unsqueeze(0)
+        yb = self.get_inference_engine(dk.pair).predict(windows)
 
-        yb = yb.cpu().squeeze(0)
-        pred_df = pd.DataFrame(yb.detach().numpy(), columns=dk.label_list)
+        pred_df = pd.DataFrame(yb.reshape(-1, yb.shape[-1]), columns=dk.label_list)
         pred_df, _, _ = dk.label_pipeline.inverse_transform(pred_df)
 
         if self.ft_params.get("DI_threshold", 0) > 0:
@@ -147,9 +140,9 @@ class PyTorchTransformerRegressor(BasePyTorchRegressor):
             dk.DI_values = np.zeros(outliers.shape[0])
         dk.do_predict = outliers
 
-        if x.shape[1] > 1:
+        if len(x) > 1:
             zeros_df = pd.DataFrame(
-                np.zeros((x.shape[1] - len(pred_df), len(pred_df.columns))), columns=pred_df.columns
+                np.zeros((len(x) - len(pred_df), len(pred_df.columns))), columns=pred_df.columns
             )
             pred_df = pd.concat([zeros_df, pred_df], axis=0, ignore_index=True)
         return (pred_df, dk.do_predict)
@@ -0,0 +1,69 @@
+import torch
+import torch.nn as nn
+
+
+class LSTMWithAttention(nn.Module):
+    """
+    LSTM model with optional attention mechanism.
+    Lives in the freqtrade package (rather than next to LeaTorchLSTM) so that the
+    trainer holding it can be pickled and loaded again.
+
+    :returns: The output of the model, with shape (batch_size, 1)
+    """
+
+    def __init__(
+        self,
+        input_dim: int,
+        hidden_dim: int = 128,
+        num_layers: int = 2,
+        dropout: float = 0.25,
+        sequence_len: int = 48,
+        use_attention: bool = True,
+    ):
+        super().__init__()
+        self.hidden_dim = hidden_dim
+        self.num_layers = num_layers
+        self.use_attention = use_attention
+
+        # LSTM layers
+        self.lstm = nn.LSTM(
+            input_size=input_dim,
+            hidden_size=hidden_dim,
+            num_layers=num_layers,
+            dropout=dropout if num_layers > 1 else 0,
+            batch_first=True,
+            bidirectional=False,
+        )
+
+        # Attention mechanism
+        if use_attention:
+            self.attention = nn.Sequential(
+                nn.Linear(hidden_dim, hidden_dim), nn.Tanh(), nn.Linear(hidden_dim, 1)
+            )
+
+        # Output layer
+        self.fc = nn.Sequential(
+            nn.Linear(hidden_dim, hidden_dim // 2),
+            nn.ReLU(),
+            nn.Dropout(dropout),
+            nn.Linear(hidden_dim // 2, 1),
+        )
+
+    def forward(self, x):
+        # x shape: (batch_size, sequence_len, input_dim)
+        lstm_out, _ = self.lstm(x)  # (batch_size, sequence_len, hidden_dim)
+
+        if self.use_attention:
+            # Attention weights
+            attention_weights = self.attention(lstm_out)  # (batch_size, sequence_len, 1)
+            attention_weights = torch.softmax(attention_weights, dim=1)
+
+            # Weighted sum
+            context = torch.sum(attention_weights * lstm_out, dim=1)  # (batch_size, hidden_dim)
+        else:
+            # Use last output
+            context = lstm_out[:, -1, :]  # (batch_size, hidden_dim)
+
+        # Final prediction
+        output = self.fc(context)  # (batch_size, 1)
+        return output
@@ -0,0 +1,86 @@
+import logging
+from collections.abc import Callable
+from typing import Literal
+
+import numpy as np
+import torch
+from torch import nn
+
+
+logger = logging.getLogger(__name__)
+
+CompileMode = Literal["compile", "trace"]
+
+
+class PyTorchInferenceEngine:
+    """
+    Runs a trained model over large inputs in fixed size chunks under `torch.inference_mode`,
+    writing each chunk's output into a preallocated numpy array.
+    Optionally runs a `torch.compile`d or TorchScript traced version of the model.
+    """
+
+    def __init__(
+        self,
+        model: nn.Module,
+        device: str,
+        batch_size: int = 8192,
+        compile_mode: CompileMode | None = None,
+    ):
+        """
+        :param model: The trained PyTorch model.
+        :param device: The device the model lives on (e.g. 'cpu', 'cuda').
+        :param batch_size: Number of rows passed to the model per forward pass.
+        :param compile_mode: "compile" to use `torch.compile`, "trace" to use a TorchScript
+            trace of the model, None to run the model as is.
+        """
+        if batch_size < 1:
+            raise ValueError(f"Inference batch size must be at least 1, got {batch_size}.")
+        if compile_mode not in (None, "compile", "trace"):
+            raise ValueError(f"Unknown inference compile mode {compile_mode}.")
+        self.model = model
+        self.device = device
+        self.batch_size = batch_size
+        self.compile_mode = compile_mode
+        self._forward: Callable[[torch.Tensor], torch.Tensor] | None = None
+
+    def _get_forward(self, example: torch.Tensor) -> Callable[[torch.Tensor], torch.Tensor]:
+        if self._forward is not None:
+            return self._forward
+        self._forward = self.model
+        try:
+            if self.compile_mode == "compile":
+                compiled = torch.compile(self.model)
+                # compilation happens on the first call
+                compiled(example)
+                self._forward = compiled
+            elif self.compile_mode == "trace":
+                self._forward = torch.jit.trace(self.model, example, check_trace=False)
+        except Exception as e:
+            logger.warning(f"Could not {self.compile_mode} model, running it uncompiled: {e}")
+        return self._forward
+
+    def predict(
+        self,
+        x: torch.Tensor,
+        postprocess: Callable[[torch.Tensor], torch.Tensor] | None = None,
+    ) -> np.ndarray:
+        """
+        :param x: Model input, batched along the first dimension. May live on any device,
+            chunks are moved to the model's device one at a time.
+        :param postprocess: Applied to the model output of each chunk (e.g. softmax).
+        :return: Model outputs of all rows, concatenated along the first dimension.
+        """
+        self.model.eval()
+        out = np.empty(0)
+        with torch.inference_mode():
+            # a single (empty) chunk still runs for empty inputs, to get the output shape
+            for start in range(0, max(len(x), 1), self.batch_size):
+                xb = x[start : start + self.batch_size].to(self.device)
+                yb = self._get_forward(xb)(xb)
+                if postprocess is not None:
+                    yb = postprocess(yb)
+                yb = yb.cpu().numpy()
+                if start == 0:
+                    out = np.empty((len(x), *yb.shape[1:]), dtype=yb.dtype)
+                out[start : start + len(yb)] = yb
+        return out
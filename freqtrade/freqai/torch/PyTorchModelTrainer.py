@@ -6,12 +6,12 @@ import pandas as pd
 import torch
 from torch import nn
 from torch.optim import Optimizer
-from torch.utils.data import DataLoader, TensorDataset
+from torch.utils.data import BatchSampler, DataLoader, SequentialSampler, TensorDataset
 
 from freqtrade.freqai.torch.PyTorchDataConvertor import PyTorchDataConvertor
 from freqtrade.freqai.torch.PyTorchTrainerInterface import PyTorchTrainerInterface
 
-from .datasets import WindowDataset
+from .datasets import StridedWindowDataset, WindowDataset
 
 
 logger = logging.getLogger(__name__)
@@ -212,10 +212,43 @@ class PyTorchTransformerTrainer(PyTorchModelTrainer):
             x = self.data_convertor.convert_x(data_dictionary[f"{split}_features"], self.device)
             y = self.data_convertor.convert_y(data_dictionary[f"{split}_labels"], self.device)
             dataset = WindowDataset(x, y, self.window_size)
+            # hand whole batches of indices to the dataset instead of collating
+            # one window per call
+            data_loader = DataLoader(
+                dataset,
+                batch_size=None,
+                sampler=BatchSampler(
+                    SequentialSampler(dataset), batch_size=self.batch_size, drop_last=True
+                ),
+                num_workers=0,
+            )
+            data_loader_dictionary[split] = data_loader
+
+        return data_loader_dictionary
+
+
+class PyTorchSequenceTrainer(PyTorchModelTrainer):
+    """
+    Creating a trainer for recurrent models consuming (batch, window_size, n_features)
+    sequences. Windows are strided views over the feature tensor, so the training set is
+    never materialized window by window.
+    """
+
+    def create_data_loaders_dictionary(
+        self, data_dictionary: dict[str, pd.DataFrame], splits: list[str]
+    ) -> dict[str, DataLoader]:
+        """
+        Converts the input data to PyTorch tensors using a data loader.
+        """
+        data_loader_dictionary = {}
+        for split in splits:
+            x = self.data_convertor.convert_x(data_dictionary[f"{split}_features"], self.device)
+            y = self.data_convertor.convert_y(data_dictionary[f"{split}_labels"], self.device)
+            dataset = StridedWindowDataset(x, y, self.window_size)
             data_loader = DataLoader(
                 dataset,
                 batch_size=self.batch_size,
-                shuffle=False,
+                shuffle=True,
                 drop_last=True,
                 num_workers=0,
             )
@@ -1,19 +1,67 @@
 import torch
 
 
+def sliding_windows(xs: torch.Tensor, window_size: int) -> torch.Tensor:
+    """
+    Build a zero-copy view of all sliding windows over the rows of `xs`.
+    :param xs: (n_rows, n_features) tensor.
+    :param window_size: number of consecutive rows per window.
+    :return: (n_rows - window_size + 1, window_size, n_features) strided view sharing
+        storage with `xs`. Window `i` covers rows `i : i + window_size`.
+    """
+    if len(xs) < window_size:
+        return xs.new_empty((0, window_size, xs.shape[-1]))
+    return xs.unfold(0, window_size, 1).transpose(1, 2)
+
+
 class WindowDataset(torch.utils.data.Dataset):
+    """
+    Windows are served in reverse order. Indexing with an int returns a single window,
+    indexing with a list of indices (as yielded by a `BatchSampler`) gathers the whole
+    batch at once from a strided view of `xs`.
+    """
+
     def __init__(self, xs, ys, window_size):
         self.xs = xs
         self.ys = ys
         self.window_size = window_size
+        self.windows = sliding_windows(xs, window_size)
 
     def __len__(self):
         return len(self.xs) - self.window_size
 
     def __getitem__(self, index):
+        if not isinstance(index, int):
+            return self._get_batch(index)
         idx_rev = len(self.xs) - self.window_size - index - 1
         window_x = self.xs[idx_rev : idx_rev + self.window_size, :]
         # Beware of indexing, these two window_x and window_y are aimed at the same row!
         # this is what happens when you use :
         window_y = self.ys[idx_rev + self.window_size - 1, :].unsqueeze(0)
         return window_x, window_y
+
+    def _get_batch(self, indices):
+        idx_rev = len(self.xs) - self.window_size - 1 - torch.as_tensor(indices)
+        window_x = self.windows[idx_rev]
+        window_y = self.ys[idx_rev + self.window_size - 1, :].unsqueeze(1)
+        return window_x, window_y
+
+
+class StridedWindowDataset(torch.utils.data.Dataset):
+    """
+    Sequence dataset backed by a single contiguous feature tensor. Windows are strided
+    views, so memory stays at one copy of the features whatever the window size.
+    Each window is paired with the label of its last row.
+    """
+
+    def __init__(self, xs, ys, window_size):
+        self.xs = xs.contiguous()
+        self.ys = ys
+        self.window_size = window_size
+        self.windows = sliding_windows(self.xs, window_size)
+
+    def __len__(self):
+        return len(self.windows)
+
+    def __getitem__(self, index):
+        return self.windows[index], self.ys[index + self.window_size - 1]
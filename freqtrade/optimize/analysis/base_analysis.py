@@ -1,15 +1,23 @@
 import logging
-from copy import deepcopy
+import shutil
+from abc import ABC, abstractmethod
+from copy import copy, deepcopy
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 
+from joblib import Parallel, delayed
 from pandas import DataFrame
 
 from freqtrade.configuration import TimeRange
+from freqtrade.loggers.set_log_levels import reduce_verbosity_for_bias_tester
 
 
 logger = logging.getLogger(__name__)
 
+# Exchange of an analysis worker process, reused by all backtests run by this process
+_worker_exchange: Any | None = None
+
 
 class VarHolder:
     timerange: TimeRange
@@ -24,12 +32,28 @@ class VarHolder:
     startup_candle: int
 
 
-class BaseAnalysis:
+def _prepare_data_in_worker(
+    analysis: "BaseAnalysis", varholder: VarHolder, pairs_to_load: list[str]
+) -> VarHolder:
+    global _worker_exchange
+    reduce_verbosity_for_bias_tester()
+    analysis.exchange = _worker_exchange
+    try:
+        analysis.prepare_data(varholder, pairs_to_load)
+    finally:
+        analysis.purge_freqai_models()
+    _worker_exchange = analysis.exchange
+    return varholder
+
+
+class BaseAnalysis(ABC):
     def __init__(self, config: dict[str, Any], strategy_obj: dict):
         self.failed_bias_check = True
         self.full_varHolder = VarHolder()
         self.exchange: Any | None = None
         self._fee = None
+        # number of worker processes backtests are spread over, 1 runs them in this process
+        self.analysis_jobs: int = config.get("analysis_jobs", 1)
 
         # pull variables the scope of the lookahead_analysis-instance
         self.local_config = deepcopy(config)
@@ -41,6 +65,54 @@ class BaseAnalysis:
         timestamp = int(dt.replace(tzinfo=UTC).timestamp())
         return timestamp
 
+    @abstractmethod
+    def prepare_data(self, varholder: VarHolder, pairs_to_load: list[str]) -> None:
+        """
+        Run the backtest of `varholder` and store its data, indicators and results in it.
+        """
+
+    def purge_freqai_models(self) -> None:
+        """
+        Remove models of the freqai identifier, to be sure nothing is carried over
+        from older backtests.
+        """
+        if "freqai" in self.local_config and "identifier" in self.local_config["freqai"]:
+            path_to_current_identifier = Path(
+                f"{self.local_config['user_data_dir']}/models/"
+                f"{self.local_config['freqai']['identifier']}"
+            ).resolve()
+            # remove folder and its contents
+            if Path.exists(path_to_current_identifier):
+                shutil.rmtree(path_to_current_identifier)
+
+    def _worker_copy(self, task_id: int, config_overrides: dict[str, Any]) -> "BaseAnalysis":
+        """
+        Lightweight copy of this analysis, to prepare data in a worker process.
+        """
+        worker = copy(self)
+        worker.full_varHolder = VarHolder()
+        worker.exchange = None
+        worker.local_config = deepcopy(self.local_config) | config_overrides
+        if "freqai" in worker.local_config and "identifier" in worker.local_config["freqai"]:
+            # concurrent backtests must not train into (and purge) the same model folder
+            worker.local_config["freqai"]["identifier"] += f"-analysis-{task_id}"
+        return worker
+
+    def prepare_data_parallel(
+        self, tasks: list[tuple[VarHolder, list[str], dict[str, Any]]]
+    ) -> list[VarHolder]:
+        """
+        Run `prepare_data` of each task in `self.analysis_jobs` worker processes.
+        Each worker process keeps its exchange between backtests.
+        :param tasks: tuples of (varholder, pairs to load, config overrides)
+        :return: prepared varholders, in the order of tasks
+        """
+        logger.info(f"Running {len(tasks)} backtests with {self.analysis_jobs} jobs.")
+        return Parallel(n_jobs=self.analysis_jobs)(
+            delayed(_prepare_data_in_worker)(self._worker_copy(idx, overrides), varholder, pairs)
+            for idx, (varholder, pairs, overrides) in enumerate(tasks)
+        )
+
     def fill_full_varholder(self):
         self.full_varHolder = VarHolder()
 
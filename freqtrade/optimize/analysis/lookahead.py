@@ -1,8 +1,6 @@
 import logging
-import shutil
 from copy import deepcopy
 from datetime import datetime, timedelta
-from pathlib import Path
 from typing import Any
 
 from pandas import DataFrame
@@ -37,6 +35,8 @@ class LookaheadAnalysis(BaseAnalysis):
         self.exit_varHolders: list[VarHolder] = []
 
         self.current_analysis = Analysis()
+        # (idx, result_row, varHolder position) of rows waiting for their parallel backtests
+        self._queued_rows: list[tuple[int, Any, int]] = []
         self.minimum_trade_amount = config["minimum_trade_amount"]
         self.targeted_trade_amount = config["targeted_trade_amount"]
 
@@ -94,17 +94,9 @@ class LookaheadAnalysis(BaseAnalysis):
                             f"{str(self_value)} != {str(other_value)}"
                         )
 
-    def prepare_data(self, varholder: VarHolder, pairs_to_load: list[DataFrame]):
-        if "freqai" in self.local_config and "identifier" in self.local_config["freqai"]:
-            # purge previous data if the freqai model is defined
-            # (to be sure nothing is carried over from older backtests)
-            path_to_current_identifier = Path(
-                f"{self.local_config['user_data_dir']}/models/"
-                f"{self.local_config['freqai']['identifier']}"
-            ).resolve()
-            # remove folder and its contents
-            if Path.exists(path_to_current_identifier):
-                shutil.rmtree(path_to_current_identifier)
+    def prepare_data(self, varholder: VarHolder, pairs_to_load: list[str]) -> None:
+        # purge previous data if the freqai model is defined
+        self.purge_freqai_models()
 
         prepare_data_config = deepcopy(self.local_config)
         prepare_data_config["timerange"] = (
@@ -136,27 +128,31 @@ class LookaheadAnalysis(BaseAnalysis):
         varholder.indicators = filled_indicators
         varholder.result = self.get_result(backtesting, varholder.indicators)
 
-    def fill_entry_and_exit_varHolders(self, result_row):
+    def get_entry_and_exit_varHolders(self, result_row) -> tuple[VarHolder, VarHolder]:
         # entry_varHolder
         entry_varHolder = VarHolder()
-        self.entry_varHolders.append(entry_varHolder)
         entry_varHolder.from_dt = self.full_varHolder.from_dt
         entry_varHolder.compared_dt = result_row["open_date"]
         # to_dt needs +1 candle since it won't buy on the last candle
         entry_varHolder.to_dt = result_row["open_date"] + timedelta(
             minutes=timeframe_to_minutes(self.full_varHolder.timeframe)
         )
-        self.prepare_data(entry_varHolder, [result_row["pair"]])
 
         # exit_varHolder
         exit_varHolder = VarHolder()
-        self.exit_varHolders.append(exit_varHolder)
         # to_dt needs +1 candle since it will always exit/force-exit trades on the last candle
         exit_varHolder.from_dt = self.full_varHolder.from_dt
         exit_varHolder.to_dt = result_row["close_date"] + timedelta(
             minutes=timeframe_to_minutes(self.full_varHolder.timeframe)
         )
         exit_varHolder.compared_dt = result_row["close_date"]
+        return entry_varHolder, exit_varHolder
+
+    def fill_entry_and_exit_varHolders(self, result_row):
+        entry_varHolder, exit_varHolder = self.get_entry_and_exit_varHolders(result_row)
+        self.entry_varHolders.append(entry_varHolder)
+        self.prepare_data(entry_varHolder, [result_row["pair"]])
+        self.exit_varHolders.append(exit_varHolder)
         self.prepare_data(exit_varHolder, [result_row["pair"]])
 
     # now we analyze a full trade of full_varholder and look for analyze its bias
@@ -168,9 +164,32 @@ class LookaheadAnalysis(BaseAnalysis):
         # keep track of how many signals are processed at total
         self.current_analysis.total_signals += 1
 
+        if self.analysis_jobs != 1:
+            # backtests of all rows run in parallel, rows are compared once all are done
+            entry_varHolder, exit_varHolder = self.get_entry_and_exit_varHolders(result_row)
+            self.entry_varHolders.append(entry_varHolder)
+            self.exit_varHolders.append(exit_varHolder)
+            self._queued_rows.append((idx, result_row, len(self.entry_varHolders) - 1))
+            return
+
         # fill entry_varHolder and exit_varHolder
         self.fill_entry_and_exit_varHolders(result_row)
-
+        self.compare_row(idx, result_row)
+
+    def analyze_queued_rows(self):
+        tasks = []
+        for _, result_row, position in self._queued_rows:
+            tasks.append((self.entry_varHolders[position], [result_row["pair"]], {}))
+            tasks.append((self.exit_varHolders[position], [result_row["pair"]], {}))
+        varHolders = self.prepare_data_parallel(tasks)
+
+        for i, (idx, result_row, position) in enumerate(self._queued_rows):
+            self.entry_varHolders[position] = varHolders[2 * i]
+            self.exit_varHolders[position] = varHolders[2 * i + 1]
+            self.compare_row(idx, result_row)
+        self._queued_rows = []
+
+    def compare_row(self, idx: int, result_row):
         # this will trigger a logger-message
         entry_or_exit_biased: bool = False
 
@@ -250,6 +269,9 @@ class LookaheadAnalysis(BaseAnalysis):
 
             self.analyze_row(idx, result_row)
 
+        if self._queued_rows:
+            self.analyze_queued_rows()
+
         if len(self.entry_varHolders) < self.minimum_trade_amount:
             logger.info(
                 f"only found {found_signals} after skipping forced exits "
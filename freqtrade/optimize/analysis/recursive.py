@@ -1,13 +1,9 @@
 import logging
 import numbers
-import shutil
 from copy import deepcopy
 from datetime import timedelta
-from pathlib import Path
 from typing import Any
 
-from pandas import DataFrame
-
 from freqtrade.exchange import timeframe_to_minutes
 from freqtrade.loggers.set_log_levels import (
     reduce_verbosity_for_bias_tester,
@@ -118,17 +114,9 @@ class RecursiveAnalysis(BaseAnalysis):
         else:
             logger.info("No lookahead bias on indicators found.")
 
-    def prepare_data(self, varholder: VarHolder, pairs_to_load: list[DataFrame]):
-        if "freqai" in self.local_config and "identifier" in self.local_config["freqai"]:
-            # purge previous data if the freqai model is defined
-            # (to be sure nothing is carried over from older backtests)
-            path_to_current_identifier = Path(
-                f"{self.local_config['user_data_dir']}/models/"
-                f"{self.local_config['freqai']['identifier']}"
-            ).resolve()
-            # remove folder and its contents
-            if Path.exists(path_to_current_identifier):
-                shutil.rmtree(path_to_current_identifier)
+    def prepare_data(self, varholder: VarHolder, pairs_to_load: list[str]) -> None:
+        # purge previous data if the freqai model is defined
+        self.purge_freqai_models()
 
         prepare_data_config = deepcopy(self.local_config)
         prepare_data_config["timerange"] = (
@@ -187,6 +175,32 @@ class RecursiveAnalysis(BaseAnalysis):
 
         self.partial_varHolder_lookahead_array.append(partial_varHolder)
 
+    def fill_partial_varholders_parallel(self, start_date, end_date):
+        """
+        Prepare the lookahead and all startup candle varholders in worker processes.
+        """
+        lookahead_varHolder = VarHolder()
+        lookahead_varHolder.from_dt = self.full_varHolder.from_dt
+        lookahead_varHolder.to_dt = end_date
+        tasks = [(lookahead_varHolder, self.local_config["pairs"], {})]
+
+        for startup_candle in self._startup_candle:
+            partial_varHolder = VarHolder()
+            partial_varHolder.from_dt = start_date
+            partial_varHolder.to_dt = self.full_varHolder.to_dt
+            partial_varHolder.startup_candle = startup_candle
+            tasks.append(
+                (
+                    partial_varHolder,
+                    self.local_config["pairs"],
+                    {"startup_candle_count": startup_candle},
+                )
+            )
+
+        lookahead_varHolder, *partial_varHolders = self.prepare_data_parallel(tasks)
+        self.partial_varHolder_lookahead_array.append(lookahead_varHolder)
+        self.partial_varHolder_array.extend(partial_varHolders)
+
     def start(self) -> None:
         super().start()
 
@@ -197,15 +211,17 @@ class RecursiveAnalysis(BaseAnalysis):
         timeframe_minutes = timeframe_to_minutes(self.full_varHolder.timeframe)
 
         end_date_partial = start_date_full + timedelta(minutes=int(timeframe_minutes * 10))
+        start_date_partial = end_date_full - timedelta(minutes=int(timeframe_minutes))
 
-        self.fill_partial_varholder_lookahead(end_date_partial)
+        if self.analysis_jobs != 1:
+            self.fill_partial_varholders_parallel(start_date_partial, end_date_partial)
+        else:
+            self.fill_partial_varholder_lookahead(end_date_partial)
 
-        # restore_verbosity_for_bias_tester()
+            # restore_verbosity_for_bias_tester()
 
-        start_date_partial = end_date_full - timedelta(minutes=int(timeframe_minutes))
-
-        for startup_candle in self._startup_candle:
-            self.fill_partial_varholder(start_date_partial, startup_candle)
+            for startup_candle in self._startup_candle:
+                self.fill_partial_varholder(start_date_partial, startup_candle)
 
         # Restore verbosity, so it's not too quiet for the next strategy
         restore_verbosity_for_bias_tester()
@@ -0,0 +1,64 @@
+"""
+Array based candle storage for backtesting
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+from pandas import DataFrame, Timestamp
+
+
+# Same order as the backtesting HEADERS, rows built from it can be indexed the same way.
+CANDLE_DTYPE = np.dtype(
+    [
+        ("date", "i8"),
+        ("open", "f8"),
+        ("high", "f8"),
+        ("low", "f8"),
+        ("close", "f8"),
+        ("enter_long", "f8"),
+        ("exit_long", "f8"),
+        ("enter_short", "f8"),
+        ("exit_short", "f8"),
+        ("enter_tag", "O"),
+        ("exit_tag", "O"),
+    ]
+)
+
+
+class PairCandles(Sequence):
+    """
+    Analyzed candles of one pair, held in a single structured numpy array.
+    Indexing returns the same row tuple as the list based backtest data
+    (date as UTC Timestamp, followed by prices, signals and tags), built on access only.
+    """
+
+    def __init__(self, df: DataFrame):
+        self.candles = np.empty(len(df), dtype=CANDLE_DTYPE)
+        if len(df):
+            self.candles["date"] = df["date"].to_numpy(dtype="datetime64[ns]").view("i8")
+            for col in CANDLE_DTYPE.names[1:]:
+                self.candles[col] = df[col].to_numpy(dtype=CANDLE_DTYPE[col])
+        self.dates = self.candles["date"]
+
+    def __len__(self) -> int:
+        return len(self.candles)
+
+    def __getitem__(self, index):
+        if not isinstance(index, int):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        date, *values = self.candles[index].item()
+        return (Timestamp(date, tz="UTC"), *values)
+
+    def entry_signals(self, can_short: bool) -> np.ndarray:
+        """
+        Vectorized `Backtesting.check_for_trade_entry`.
+        :return: Boolean array, True for candles with a long or short entry signal
+        """
+        enter_long = self.candles["enter_long"] == 1
+        exit_long = self.candles["exit_long"] == 1
+        enter_short = (self.candles["enter_short"] == 1) & can_short
+        exit_short = (self.candles["exit_short"] == 1) & can_short
+        long = enter_long & ~(exit_long | enter_short)
+        short = enter_short & ~(exit_short | enter_long)
+        return long | short
@@ -6,11 +6,12 @@ This module contains the backtesting logic
 
 import logging
 from collections import defaultdict
+from collections.abc import Sequence
 from copy import deepcopy
 from datetime import datetime, timedelta
 
-from numpy import isnan, nan
-from pandas import DataFrame, Series
+from numpy import isnan, nan, ndarray
+from pandas import DataFrame, Series, Timestamp
 
 from freqtrade import constants
 from freqtrade.configuration import TimeRange, validate_config_consistency
@@ -49,6 +50,7 @@ from freqtrade.ft_types import (
 from freqtrade.leverage.liquidation_price import update_liquidation_prices
 from freqtrade.mixins import LoggingMixin
 from freqtrade.optimize.backtest_caching import get_strategy_run_id
+from freqtrade.optimize.backtest_candles import PairCandles
 from freqtrade.optimize.bt_progress import BTProgress
 from freqtrade.optimize.optimize_reports import (
     generate_backtest_stats,
@@ -212,6 +214,7 @@ class Backtesting:
         self._position_stacking: bool = self.config.get("position_stacking", False)
         self.enable_protections: bool = self.config.get("enable_protections", False)
         self.dynamic_pairlist: bool = self.config.get("enable_dynamic_pairlist", False)
+        self.array_data: bool = self.config.get("backtest_array_data", False)
         migrate_data(config, self.exchange)
 
         self.init_backtest()
@@ -271,6 +274,9 @@ class Backtesting:
             self.timeframe_detail_td = timedelta(seconds=0)
         self.detail_data: dict[str, DataFrame] = {}
         self.futures_data: dict[str, DataFrame] = {}
+        # Signal independent columns (date, open, high, low, close) as lists per pair.
+        # Set by hyperopt, which runs many epochs over the same data.
+        self.ohlcv_cache: dict[str, list[list]] | None = None
 
     def init_backtest(self):
         self.prepare_backtest(False)
@@ -510,9 +516,32 @@ class Backtesting:
 
             # Convert from Pandas to list for performance reasons
             # (Looping Pandas is slow.)
-            data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
+            data[pair] = self._dataframe_to_rows(pair, df_analyzed)
         return data
 
+    def _dataframe_to_rows(self, pair: str, df_analyzed: DataFrame) -> Sequence:
+        """
+        Convert the analyzed dataframe to a list of rows (in HEADERS order),
+        or to PairCandles if `backtest_array_data` is enabled.
+        With `ohlcv_cache` set, only the signal columns are converted, the ohlcv columns
+        are converted once and reused while the candles stay the same.
+        """
+        if self.array_data:
+            return PairCandles(df_analyzed)
+        if df_analyzed.empty:
+            return []
+        if self.ohlcv_cache is None:
+            return df_analyzed[HEADERS].values.tolist()
+        ohlcv = self.ohlcv_cache.get(pair)
+        if (
+            ohlcv is None
+            or len(ohlcv[0]) != len(df_analyzed)
+            or ohlcv[0][0] != df_analyzed["date"].iat[0]
+        ):
+            ohlcv = self.ohlcv_cache[pair] = [df_analyzed[col].tolist() for col in HEADERS[:5]]
+        signals = [df_analyzed[col].tolist() for col in HEADERS[5:]]
+        return list(map(list, zip(*ohlcv, *signals, strict=True)))
+
     def _get_close_rate(
         self,
         row: tuple,
@@ -1435,6 +1464,56 @@ class Backtesting:
             return None
         return row
 
+    def _get_entry_signals(self, data: dict[str, Sequence]) -> dict[str, ndarray] | None:
+        if not self.array_data:
+            return None
+        return {
+            pair: candles.entry_signals(self._can_short)
+            for pair, candles in data.items()
+            if isinstance(candles, PairCandles)
+        }
+
+    def _is_idle_candle(
+        self,
+        data: dict[str, PairCandles],
+        entry_signals: dict[str, ndarray] | None,
+        pair: str,
+        row_index: int,
+        current_time_ns: int,
+    ) -> bool:
+        """
+        Check if the main candle at `row_index` exists for the current time, has no entry
+        signal and the pair has no open trades - so backtest_loop would not do anything.
+        """
+        if entry_signals is None or LocalTrade.bt_trades_open_pp[pair] or pair not in entry_signals:
+            return False
+        return (
+            row_index < len(data[pair])
+            and data[pair].dates[row_index] <= current_time_ns
+            and not entry_signals[pair][row_index]
+        )
+
+    def _get_main_row(
+        self,
+        data: dict,
+        entry_signals: dict[str, ndarray] | None,
+        indexes: dict[str, int],
+        pair: str,
+        current_time: datetime,
+        current_time_ns: int,
+    ) -> tuple | None:
+        """
+        Get the main candle row of the pair for the current time.
+        Idle candles are skipped (returning None) after advancing the pair's index.
+        """
+        row_index = indexes[pair]
+        if self._is_idle_candle(data, entry_signals, pair, row_index, current_time_ns):
+            indexes[pair] = row_index + 1
+            self.dataprovider._set_dataframe_max_index(pair, self.required_startup + row_index + 1)
+            self.dataprovider._set_dataframe_max_date(current_time)
+            return None
+        return self.validate_row(data, pair, row_index, current_time)
+
     def _collate_rejected(self, pair, row):
         """
         Temporarily store rejected signal information for downstream use in backtesting_analysis
@@ -1581,6 +1660,9 @@ class Backtesting:
         )
         # Indexes per pair, so some pairs are allowed to have a missing start.
         indexes: dict = defaultdict(int)
+        # With array data, candles without entry signal of pairs without open trades
+        # are skipped without building their row.
+        entry_signals = self._get_entry_signals(data)
 
         for current_time in self._time_generator(start_date, end_date):
             # Loop for each main candle.
@@ -1599,6 +1681,7 @@ class Backtesting:
             pair_detail_cache: dict[str, list[tuple]] = {}
             pair_tradedir_cache: dict[str, LongShort | None] = {}
             pairs_with_open_trades = [t.pair for t in LocalTrade.bt_trades_open]
+            current_time_ns = Timestamp(current_time).value
 
             for current_time_det, is_first, has_detail, idx, pair in self._time_pair_generator_det(
                 current_time, pairs
@@ -1611,7 +1694,9 @@ class Backtesting:
                 if is_first:
                     # Main candle
                     row_index = indexes[pair]
-                    row = self.validate_row(data, pair, row_index, current_time)
+                    row = self._get_main_row(
+                        data, entry_signals, indexes, pair, current_time, current_time_ns
+                    )
                     if not row:
                         continue
 
@@ -7,6 +7,9 @@ This module contains the hyperopt logic
 import gc
 import logging
 import random
+import time
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from datetime import datetime
 from math import ceil
 from multiprocessing import Manager
@@ -15,6 +18,7 @@ from typing import Any
 
 import rapidjson
 from joblib import Parallel, cpu_count
+from joblib.externals.loky import get_reusable_executor
 from optuna.trial import FrozenTrial, Trial, TrialState
 
 from freqtrade.constants import FTHYPT_FILEVERSION, LAST_BT_RESULT_FN, Config
@@ -38,6 +42,12 @@ logger = logging.getLogger(__name__)
 log_queue: Any
 
 
+def _streaming_optimizer_wrapper(queue: Any, verbosity: int, func, *args, **kwargs):
+    """Run one streamed epoch in a worker, forwarding its logs to the parent's queue."""
+    logging_mp_setup(queue, verbosity)
+    return func(*args, **kwargs)
+
+
 class Hyperopt:
     """
     Hyperopt class, this class contains all the logic to run a hyperopt simulation
@@ -53,6 +63,7 @@ class Hyperopt:
         self.config = config
 
         self.analyze_per_epoch = self.config.get("analyze_per_epoch", False)
+        self.stream_epochs = self.config.get("stream_epochs", False)
         HyperoptStateContainer.set_state(HyperoptState.STARTUP)
 
         if self.config.get("hyperopt"):
@@ -168,13 +179,22 @@ class Hyperopt:
             asked.append(self.opt.ask(dimensions))
         return asked
 
-    def duplicate_optuna_asked_points(self, trial: Trial, asked_trials: list[FrozenTrial]) -> bool:
+    def duplicate_optuna_asked_points(
+        self,
+        trial: Trial,
+        asked_trials: list[FrozenTrial],
+        running_trials: Sequence[FrozenTrial] = (),
+    ) -> bool:
         asked_trials_no_dups: list[FrozenTrial] = []
         trials_to_consider = trial.study.get_trials(deepcopy=False, states=[TrialState.COMPLETE])
         # Check whether we already evaluated the sampled `params`.
         for t in reversed(trials_to_consider):
             if trial.params == t.params:
                 return True
+        # Check whether the same `params` are still being evaluated (streaming mode).
+        for t in running_trials:
+            if trial.params == t.params:
+                return True
         # Check whether same`params` in one batch (asked_trials). Autosampler is doing this.
         for t in asked_trials:
             if t.params not in asked_trials_no_dups:
@@ -183,9 +203,12 @@ class Hyperopt:
             return True
         return False
 
-    def get_asked_points(self, n_points: int, dimensions: dict) -> tuple[list[Any], list[bool]]:
+    def get_asked_points(
+        self, n_points: int, dimensions: dict, running_trials: Sequence[FrozenTrial] = ()
+    ) -> tuple[list[Any], list[bool]]:
         """
         Enforce points returned from `self.opt.ask` have not been already evaluated
+        (or are not being evaluated, for `running_trials`)
 
         Steps:
         1. Try to get points using `self.opt.ask` first
@@ -197,12 +220,12 @@ class Hyperopt:
         asked_non_tried += [
             x
             for x in optuna_asked_trials
-            if not self.duplicate_optuna_asked_points(x, optuna_asked_trials)
+            if not self.duplicate_optuna_asked_points(x, optuna_asked_trials, running_trials)
         ]
         i = 0
         while i < 2 * n_points and len(asked_non_tried) < n_points:
             asked_new = self.get_optuna_asked_points(n_points=1, dimensions=dimensions)[0]
-            if not self.duplicate_optuna_asked_points(asked_new, asked_non_tried):
+            if not self.duplicate_optuna_asked_points(asked_new, asked_non_tried, running_trials):
                 asked_non_tried.append(asked_new)
             i += 1
         if len(asked_non_tried) < n_points:
@@ -236,6 +259,119 @@ class Hyperopt:
 
         self._save_result(val)
 
+    def run_optimizer_batched(
+        self, parallel: Parallel, jobs: int, pbar: Any, task: Any, start: int
+    ) -> None:
+        """
+        Run the remaining epochs in batches of `jobs` epochs, waiting for the whole batch
+        before asking for the next one.
+        """
+        evals = ceil((self.total_epochs - start) / jobs)
+        for i in range(evals):
+            # Correct the number of epochs to be processed for the last
+            # iteration (should not exceed self.total_epochs in total)
+            n_rest = (i + 1) * jobs - (self.total_epochs - start)
+            current_jobs = jobs - n_rest if n_rest > 0 else jobs
+
+            asked, is_random = self.get_asked_points(
+                n_points=current_jobs, dimensions=self.hyperopter.o_dimensions
+            )
+
+            f_val = self.run_optimizer_parallel(
+                parallel,
+                [asked1.params for asked1 in asked],
+            )
+
+            f_val_loss = [v["loss"] for v in f_val]
+            for o_ask, v in zip(asked, f_val_loss, strict=False):
+                self.opt.tell(o_ask, v)
+
+            for j, val in enumerate(f_val):
+                # Use human-friendly indexes here (starting from 1)
+                current = i * jobs + j + 1 + start
+
+                self.evaluate_result(val, current, is_random[j])
+                pbar.update(task, advance=1)
+            logging_mp_handle(log_queue)
+            gc.collect()
+
+            if self.hyperopter.es_epochs > 0 and self.hyperopter.es_terminator.should_terminate(
+                self.opt
+            ):
+                logger.info(f"Early stopping after {(i + 1) * jobs} epochs")
+                return
+
+    def run_optimizer_streaming(self, jobs: int, pbar: Any, task: Any, start: int) -> None:
+        """
+        Run the remaining epochs keeping every worker busy: a new point is asked as soon as
+        a worker is free and results are told to the optimizer in the order they complete.
+        """
+        executor = get_reusable_executor(max_workers=jobs)
+        verbosity = logging.INFO if self.config["verbosity"] < 1 else logging.DEBUG
+        pending: dict[Future, tuple[FrozenTrial, bool, float]] = {}
+        dispatched = start
+        current = start
+        busy_time = 0.0
+        started = time.monotonic()
+        stop = False
+        try:
+            while True:
+                while not stop and dispatched < self.total_epochs and len(pending) < jobs:
+                    # Skipped duplicates count towards the epochs, as they do in batch mode
+                    dispatched += 1
+                    asked, is_random = self.get_asked_points(
+                        n_points=1,
+                        dimensions=self.hyperopter.o_dimensions,
+                        running_trials=[trial for trial, _, _ in pending.values()],
+                    )
+                    if not asked:
+                        continue
+                    func, args, kwargs = self.hyperopter.generate_optimizer_wrapped(asked[0].params)
+                    future = executor.submit(
+                        _streaming_optimizer_wrapper,
+                        log_queue,
+                        verbosity,
+                        func,
+                        *args,
+                        **kwargs,
+                    )
+                    pending[future] = (asked[0], is_random[0], time.monotonic())
+                if not pending:
+                    break
+
+                now = time.monotonic()
+                in_flight = sum(now - submitted for _, _, submitted in pending.values())
+                utilization = (busy_time + in_flight) / max(jobs * (now - started), 1e-9)
+                pbar.update(
+                    task,
+                    description=f"Epochs [{len(pending)}/{jobs} busy, {utilization:.0%} util]",
+                )
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    trial, trial_is_random, submitted = pending.pop(future)
+                    val = future.result()
+                    busy_time += time.monotonic() - submitted
+                    self.opt.tell(trial, val["loss"])
+                    current += 1
+                    self.evaluate_result(val, current, trial_is_random)
+                    pbar.update(task, advance=1)
+                    if current % jobs == 0:
+                        gc.collect()
+                logging_mp_handle(log_queue)
+
+                if (
+                    not stop
+                    and self.hyperopter.es_epochs > 0
+                    and self.hyperopter.es_terminator.should_terminate(self.opt)
+                ):
+                    # Epochs already running are still evaluated and stored
+                    logger.info(f"Early stopping after {current} epochs")
+                    stop = True
+        finally:
+            for future in pending:
+                future.cancel()
+
     def _setup_logging_mp_workaround(self) -> None:
         """
         Workaround for logging in child processes.
@@ -281,41 +417,10 @@ class Hyperopt:
                         pbar.update(task, advance=1)
                         start += 1
 
-                    evals = ceil((self.total_epochs - start) / jobs)
-                    for i in range(evals):
-                        # Correct the number of epochs to be processed for the last
-                        # iteration (should not exceed self.total_epochs in total)
-                        n_rest = (i + 1) * jobs - (self.total_epochs - start)
-                        current_jobs = jobs - n_rest if n_rest > 0 else jobs
-
-                        asked, is_random = self.get_asked_points(
-                            n_points=current_jobs, dimensions=self.hyperopter.o_dimensions
-                        )
-
-                        f_val = self.run_optimizer_parallel(
-                            parallel,
-                            [asked1.params for asked1 in asked],
-                        )
-
-                        f_val_loss = [v["loss"] for v in f_val]
-                        for o_ask, v in zip(asked, f_val_loss, strict=False):
-                            self.opt.tell(o_ask, v)
-
-                        for j, val in enumerate(f_val):
-                            # Use human-friendly indexes here (starting from 1)
-                            current = i * jobs + j + 1 + start
-
-                            self.evaluate_result(val, current, is_random[j])
-                            pbar.update(task, advance=1)
-                        logging_mp_handle(log_queue)
-                        gc.collect()
-
-                        if (
-                            self.hyperopter.es_epochs > 0
-                            and self.hyperopter.es_terminator.should_terminate(self.opt)
-                        ):
-                            logger.info(f"Early stopping after {(i + 1) * jobs} epochs")
-                            break
+                    if self.stream_epochs and jobs > 1:
+                        self.run_optimizer_streaming(jobs, pbar, task, start)
+                    else:
+                        self.run_optimizer_batched(parallel, jobs, pbar, task, start)
 
         except KeyboardInterrupt:
             print("User interrupted..")
@@ -17,10 +17,11 @@ def logging_mp_setup(log_queue: Queue, verbosity: int):
     """
     current_proc = current_process().name
     if current_proc != "MainProcess":
-        h = QueueHandler(log_queue)
         root = logging.getLogger()
         root.setLevel(verbosity)
-        root.addHandler(h)
+        # Reused workers run this once per epoch - only attach the queue handler once.
+        if not any(isinstance(h, QueueHandler) for h in root.handlers):
+            root.addHandler(QueueHandler(log_queue))
 
 
 def logging_mp_handle(q: Queue):
@@ -5,6 +5,7 @@ and will be sent to the hyperopt worker processes.
 
 import logging
 import sys
+import time
 import warnings
 from datetime import UTC, datetime
 from pathlib import Path
@@ -49,6 +50,10 @@ INITIAL_POINTS = 30
 
 MAX_LOSS = 100000  # just a big enough number to be bad result in loss optimization
 
+# Processed data per data file, loaded once per (worker) process.
+# Values are (data version, processed dataframes, ohlcv cache of Backtesting).
+_processed_cache: dict[Path, tuple[int, dict[str, DataFrame], dict[str, list[list]]]] = {}
+
 optuna_samplers_dict = {
     "TPESampler": optuna.samplers.TPESampler,
     "GPSampler": optuna.samplers.GPSampler,
@@ -103,6 +108,8 @@ class HyperOptimizer:
         self.calculate_loss = self.custom_hyperoptloss.hyperopt_loss_function
 
         self.data_pickle_file = data_pickle_file
+        # Changes whenever data_pickle_file is rewritten, invalidates worker caches
+        self.data_version = 0
 
         self.market_change = 0.0
 
@@ -321,15 +328,18 @@ class HyperOptimizer:
 
             self.backtesting.strategy.max_open_trades = updated_max_open_trades
 
-        with self.data_pickle_file.open("rb") as f:
-            processed = load(f, mmap_mode="r")
+        processed, self.backtesting.ohlcv_cache = self.load_processed()
         if self.analyze_per_epoch:
             # Data is not yet analyzed, rerun populate_indicators.
             processed = self.advise_and_trim(processed)
 
-        bt_results = self.backtesting.backtest(
-            processed=processed, start_date=self.min_date, end_date=self.max_date
-        )
+        try:
+            bt_results = self.backtesting.backtest(
+                processed=processed, start_date=self.min_date, end_date=self.max_date
+            )
+        finally:
+            # Don't ship the cache back with this object to the next worker
+            self.backtesting.ohlcv_cache = None
         backtest_end_time = datetime.now(UTC)
         bt_results.update(
             {
@@ -342,6 +352,24 @@ class HyperOptimizer:
         )
         return result
 
+    def load_processed(self) -> tuple[dict[str, DataFrame], dict[str, list[list]]]:
+        """
+        Load the processed data from `data_pickle_file`, once per process.
+        Dataframes are memory-mapped, so their pages are shared between all worker processes.
+        :return: Shallow copies of the processed dataframes (signal columns added by the epoch
+            stay out of the cache) and the ohlcv cache to use for backtesting.
+        """
+        cached = _processed_cache.get(self.data_pickle_file)
+        if cached is None or cached[0] != self.data_version:
+            with self.data_pickle_file.open("rb") as f:
+                processed = load(f, mmap_mode="r")
+            _processed_cache.clear()
+            cached = _processed_cache[self.data_pickle_file] = (self.data_version, processed, {})
+        _, processed, ohlcv_cache = cached
+        return {
+            pair: df.copy(deep=False) if df is not None else df for pair, df in processed.items()
+        }, ohlcv_cache
+
     def _get_results_dict(
         self,
         backtesting_results: BacktestContentType,
@@ -481,3 +509,4 @@ class HyperOptimizer:
             dump(preprocessed, self.data_pickle_file)
         else:
             dump(data, self.data_pickle_file)
+        self.data_version = time.time_ns()
@@ -4,7 +4,7 @@ from freqtrade.persistence.custom_data import CustomDataWrapper
 from freqtrade.persistence.key_value_store import KeyStoreKeys, KeyValueStore
 from freqtrade.persistence.models import init_db
 from freqtrade.persistence.pairlock_middleware import PairLocks
-from freqtrade.persistence.trade_model import LocalTrade, Order, Trade
+from freqtrade.persistence.trade_model import ClosedTradeRecord, LocalTrade, Order, Trade
 from freqtrade.persistence.usedb_context import (
     FtNoDBContext,
     disable_database_use,
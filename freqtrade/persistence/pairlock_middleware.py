@@ -1,6 +1,9 @@
+import heapq
 import logging
+from bisect import bisect_left, insort
 from collections.abc import Sequence
 from datetime import UTC, datetime
+from itertools import count
 
 from sqlalchemy import select
 
@@ -21,6 +24,14 @@ class PairLocks:
     use_db = True
     locks: list[PairLock] = []
 
+    # Backtesting only: locks which did not expire yet, indexed by (pair, side) as
+    # (creation sequence, lock) - and a heap by lock_end_time to evict expired locks.
+    # Evicted locks are kept sorted by lock_end_time, for lookups at an earlier date.
+    _index: dict[tuple[str, str], list[tuple[int, PairLock]]] = {}
+    _expiry_heap: list[tuple[datetime, int, PairLock]] = []
+    _evicted: list[tuple[datetime, int, PairLock]] = []
+    _lock_seq = count()
+
     timeframe: str = ""
 
     @staticmethod
@@ -30,6 +41,52 @@ class PairLocks:
         """
         if not PairLocks.use_db:
             PairLocks.locks = []
+            PairLocks._index = {}
+            PairLocks._expiry_heap = []
+            PairLocks._evicted = []
+
+    @staticmethod
+    def _add_to_index(lock: PairLock) -> None:
+        seq = next(PairLocks._lock_seq)
+        PairLocks._index.setdefault((lock.pair, lock.side), []).append((seq, lock))
+        heapq.heappush(PairLocks._expiry_heap, (lock.lock_end_time, seq, lock))
+
+    @staticmethod
+    def _evict_expired(now: datetime) -> None:
+        heap = PairLocks._expiry_heap
+        while heap and heap[0][0] < now:
+            entry = heapq.heappop(heap)
+            _, seq, lock = entry
+            entries = PairLocks._index[(lock.pair, lock.side)]
+            entries.remove((seq, lock))
+            if not entries:
+                del PairLocks._index[(lock.pair, lock.side)]
+            insort(PairLocks._evicted, entry, key=lambda e: (e[0], e[1]))
+
+    @staticmethod
+    def _get_indexed_locks(pair: str | None, now: datetime, side: str | None) -> list[PairLock]:
+        """
+        Backtesting lookup of get_pair_locks, using the (pair, side) index.
+        """
+        PairLocks._evict_expired(now)
+        sides = None if side is None else tuple(dict.fromkeys(("*", side)))
+        if pair is None:
+            keys = [key for key in PairLocks._index if sides is None or key[1] in sides]
+        else:
+            keys = [(pair, lock_side) for lock_side in sides or ("*", "long", "short")]
+        entries = [entry for key in keys for entry in PairLocks._index.get(key, [])]
+
+        # Locks evicted by a lookup at a later date, which are still active at `now`
+        evicted = PairLocks._evicted
+        start = bisect_left(evicted, now, key=lambda e: e[0])
+        entries.extend(
+            (seq, lock)
+            for _, seq, lock in evicted[start:]
+            if (pair is None or lock.pair == pair) and (sides is None or lock.side in sides)
+        )
+        # Keep creation order, as the scan over all locks would
+        entries.sort(key=lambda entry: entry[0])
+        return [lock for _, lock in entries if lock.active is True]
 
     @staticmethod
     def lock_pair(
@@ -63,6 +120,7 @@ class PairLocks:
             PairLock.session.commit()
         else:
             PairLocks.locks.append(lock)
+            PairLocks._add_to_index(lock)
         return lock
 
     @staticmethod
@@ -82,17 +140,7 @@ class PairLocks:
         if PairLocks.use_db:
             return PairLock.query_pair_locks(pair, now, side).all()
         else:
-            locks = [
-                lock
-                for lock in PairLocks.locks
-                if (
-                    lock.lock_end_time >= now
-                    and lock.active is True
-                    and (pair is None or lock.pair == pair)
-                    and (side is None or lock.side == "*" or lock.side == side)
-                )
-            ]
-            return locks
+            return PairLocks._get_indexed_locks(pair, now, side)
 
     @staticmethod
     def get_pair_longest_lock(
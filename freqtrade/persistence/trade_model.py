@@ -3,6 +3,7 @@ This module contains the class to persist trades into SQLite
 """
 
 import logging
+from bisect import bisect_right
 from collections import defaultdict
 from collections.abc import Sequence
 from dataclasses import dataclass
@@ -378,6 +379,58 @@ class Order(ModelBase):
         return Order.session.scalars(select(Order).filter(Order.order_id == order_id)).first()
 
 
+@dataclass(frozen=True, slots=True)
+class ClosedTradeRecord:
+    """
+    Close date and profit of a closed trade, as far as protections need to know.
+    """
+
+    close_date: datetime
+    close_profit: float
+    close_profit_abs: float
+
+
+class ClosedTradeIndex:
+    """
+    Closed backtesting trades, sorted by close_date.
+    Trades closed after a given date are found with a bisect.
+    """
+
+    def __init__(self) -> None:
+        self.close_dates: list[datetime] = []
+        self.trades: list[LocalTrade] = []
+        self.records: list[ClosedTradeRecord] = []
+
+    def add(self, trade: "LocalTrade") -> None:
+        if trade.close_date is None:
+            return
+        record = ClosedTradeRecord(
+            trade.close_date, trade.close_profit or 0.0, trade.close_profit_abs or 0.0
+        )
+        if not self.close_dates or trade.close_date >= self.close_dates[-1]:
+            # Trades usually close in chronological order
+            self.close_dates.append(trade.close_date)
+            self.trades.append(trade)
+            self.records.append(record)
+        else:
+            idx = bisect_right(self.close_dates, trade.close_date)
+            self.close_dates.insert(idx, trade.close_date)
+            self.trades.insert(idx, trade)
+            self.records.insert(idx, record)
+
+    def closed_after(self, close_date: datetime) -> list["LocalTrade"]:
+        """
+        :return: Trades with close_date > close_date, oldest first
+        """
+        return self.trades[bisect_right(self.close_dates, close_date) :]
+
+    def records_after(self, close_date: datetime) -> list[ClosedTradeRecord]:
+        """
+        :return: Records of trades with close_date > close_date, oldest first
+        """
+        return self.records[bisect_right(self.close_dates, close_date) :]
+
+
 class LocalTrade:
     """
     Trade database model.
@@ -390,6 +443,9 @@ class LocalTrade:
     bt_trades_open: list["LocalTrade"] = []
     # Copy of trades_open - but indexed by pair
     bt_trades_open_pp: dict[str, list["LocalTrade"]] = defaultdict(list)
+    # Closed trades by close_date - overall and per pair
+    bt_trades_closed: ClosedTradeIndex = ClosedTradeIndex()
+    bt_trades_closed_pp: dict[str, ClosedTradeIndex] = defaultdict(ClosedTradeIndex)
     bt_open_open_trade_count: int = 0
     bt_total_profit: float = 0
     realized_profit: float = 0
@@ -767,6 +823,8 @@ class LocalTrade:
         LocalTrade.bt_trades = []
         LocalTrade.bt_trades_open = []
         LocalTrade.bt_trades_open_pp = defaultdict(list)
+        LocalTrade.bt_trades_closed = ClosedTradeIndex()
+        LocalTrade.bt_trades_closed_pp = defaultdict(ClosedTradeIndex)
         LocalTrade.bt_open_open_trade_count = 0
         LocalTrade.bt_total_profit = 0
 
@@ -1455,6 +1513,14 @@ class LocalTrade:
         """
 
         # Offline mode - without database
+        if is_open is False and close_date:
+            # Closed after close_date - answered from the close_date index
+            index = LocalTrade.bt_trades_closed_pp[pair] if pair else LocalTrade.bt_trades_closed
+            sel_trades = index.closed_after(close_date)
+            if open_date:
+                sel_trades = [trade for trade in sel_trades if trade.open_date > open_date]
+            return sel_trades
+
         if is_open is not None:
             if is_open:
                 sel_trades = LocalTrade.bt_trades_open
@@ -1476,14 +1542,34 @@ class LocalTrade:
 
         return sel_trades
 
+    @staticmethod
+    def get_closed_records_proxy(
+        *, close_date: datetime, pair: str | None = None
+    ) -> list[ClosedTradeRecord]:
+        """
+        Close date and profit of trades closed after close_date, oldest first.
+        Lightweight alternative to get_trades_proxy for protections.
+        In Backtest mode, uses the records kept with the closed trades index.
+        :param close_date: Filter by close_date (trade.close_date > input)
+        :param pair: Filter by pair
+        """
+        index = LocalTrade.bt_trades_closed_pp[pair] if pair else LocalTrade.bt_trades_closed
+        return index.records_after(close_date)
+
     @staticmethod
     def close_bt_trade(trade):
         LocalTrade.bt_trades_open.remove(trade)
         LocalTrade.bt_trades_open_pp[trade.pair].remove(trade)
         LocalTrade.bt_open_open_trade_count -= 1
-        LocalTrade.bt_trades.append(trade)
+        LocalTrade._add_closed_bt_trade(trade)
         LocalTrade.bt_total_profit += trade.close_profit_abs
 
+    @staticmethod
+    def _add_closed_bt_trade(trade):
+        LocalTrade.bt_trades.append(trade)
+        LocalTrade.bt_trades_closed.add(trade)
+        LocalTrade.bt_trades_closed_pp[trade.pair].add(trade)
+
     @staticmethod
     def add_bt_trade(trade):
         if trade.is_open:
@@ -1491,7 +1577,7 @@ class LocalTrade:
             LocalTrade.bt_trades_open_pp[trade.pair].append(trade)
             LocalTrade.bt_open_open_trade_count += 1
         else:
-            LocalTrade.bt_trades.append(trade)
+            LocalTrade._add_closed_bt_trade(trade)
 
     @staticmethod
     def remove_bt_trade(trade):
@@ -1803,6 +1889,32 @@ class Trade(ModelBase, LocalTrade):
                 pair=pair, is_open=is_open, open_date=open_date, close_date=close_date
             )
 
+    @staticmethod
+    def get_closed_records_proxy(
+        *, close_date: datetime, pair: str | None = None
+    ) -> list[ClosedTradeRecord]:
+        """
+        Close date and profit of trades closed after close_date, oldest first.
+        Lightweight alternative to get_trades_proxy for protections.
+        In live mode, only selects the required columns.
+        :param close_date: Filter by close_date (trade.close_date > input)
+        :param pair: Filter by pair
+        """
+        if not Trade.use_db:
+            return LocalTrade.get_closed_records_proxy(close_date=close_date, pair=pair)
+        trade_filter = [Trade.is_open.is_(False), Trade.close_date > close_date]
+        if pair:
+            trade_filter.append(Trade.pair == pair)
+        rows = Trade.session.execute(
+            select(Trade.close_date, Trade.close_profit, Trade.close_profit_abs)
+            .filter(*trade_filter)
+            .order_by(Trade.close_date, Trade.id)
+        ).all()
+        return [
+            ClosedTradeRecord(close_date, close_profit or 0.0, close_profit_abs or 0.0)
+            for close_date, close_profit, close_profit_abs in rows
+        ]
+
     @staticmethod
     def get_trades_query(trade_filter=None, include_orders: bool = True) -> Select:
         """
@@ -2108,6 +2220,62 @@ class Trade(ModelBase, LocalTrade):
         # returns pair, profit_ratio, abs_profit, count
         return best_pair
 
+    @staticmethod
+    def get_closed_profit_summary(trade_filter: list | None = None):
+        """
+        Aggregate the profits of closed trades.
+        NOTE: Not supported in Backtesting.
+        :returns: Row containing trade_count, profit_ratio_sum, profit_abs_sum,
+            winning_trades, winning_profit, losing_trades, losing_profit,
+            last_close_date and last_id
+        """
+        trade_filter = [*(trade_filter or []), Trade.is_open.is_(False)]
+        profit_ratio = func.coalesce(Trade.close_profit, 0.0)
+        profit_abs = func.coalesce(Trade.close_profit_abs, 0.0)
+        is_winning = profit_ratio >= 0
+
+        return Trade.session.execute(
+            select(
+                func.count(Trade.id).label("trade_count"),
+                func.coalesce(func.sum(profit_ratio), 0.0).label("profit_ratio_sum"),
+                func.coalesce(func.sum(profit_abs), 0.0).label("profit_abs_sum"),
+                func.coalesce(func.sum(case((is_winning, 1), else_=0)), 0).label("winning_trades"),
+                func.coalesce(func.sum(case((is_winning, profit_abs), else_=0.0)), 0.0).label(
+                    "winning_profit"
+                ),
+                func.coalesce(func.sum(case((is_winning, 0), else_=1)), 0).label("losing_trades"),
+                func.coalesce(func.sum(case((is_winning, 0.0), else_=profit_abs)), 0.0).label(
+                    "losing_profit"
+                ),
+                func.max(Trade.close_date).label("last_close_date"),
+                func.max(Trade.id).label("last_id"),
+            ).filter(*trade_filter)
+        ).one()
+
+    @staticmethod
+    def get_exit_reason_summary(trade_filter: list | None = None):
+        """
+        Count wins, losses and draws of closed trades per exit reason,
+        in the order exit reasons first occurred.
+        NOTE: Not supported in Backtesting.
+        :returns: List of rows containing exit_reason, wins, losses and draws
+        """
+        trade_filter = [*(trade_filter or []), Trade.is_open.is_(False)]
+
+        return Trade.session.execute(
+            select(
+                Trade.exit_reason,
+                func.sum(case((Trade.close_profit > 0, 1), else_=0)).label("wins"),
+                func.sum(case((Trade.close_profit < 0, 1), else_=0)).label("losses"),
+                func.sum(
+                    case((Trade.close_profit > 0, 0), (Trade.close_profit < 0, 0), else_=1)
+                ).label("draws"),
+            )
+            .filter(*trade_filter)
+            .group_by(Trade.exit_reason)
+            .order_by(func.min(Trade.id))
+        ).all()
+
     @staticmethod
     def get_trading_volume(trade_filter: list | None = None) -> float:
         """
@@ -5,12 +5,15 @@ Provides dynamic pair list based on trade volumes
 """
 
 import logging
+from collections import defaultdict
 from datetime import timedelta
 from typing import Any, Literal
 
+import numpy as np
 from cachetools import TTLCache
+from pandas import DataFrame
 
-from freqtrade.constants import ListPairsWithTimeframes
+from freqtrade.constants import ListPairsWithTimeframes, PairWithTimeframe
 from freqtrade.exceptions import OperationalException
 from freqtrade.exchange import timeframe_to_minutes, timeframe_to_prev_date
 from freqtrade.exchange.exchange_types import Tickers
@@ -48,6 +51,8 @@ class VolumePairList(IPairList):
         self._lookback_timeframe = self._pairlistconfig.get("lookback_timeframe", "1d")
         self._lookback_period = self._pairlistconfig.get("lookback_period", 0)
         self._def_candletype = self._config["candle_type_def"]
+        # Dates (in ms) and quote volumes of the candles in lookback range, per pair
+        self._range_volumes: dict[str, tuple[np.ndarray, np.ndarray]] = {}
 
         if (self._lookback_days > 0) & (self._lookback_period > 0):
             raise OperationalException(
@@ -212,6 +217,109 @@ class VolumePairList(IPairList):
 
         return pairlist
 
+    def _range_quote_volumes(self, pairs: list[str], since_ms: int) -> list[float]:
+        """
+        Quote volume of each pair, summed over its last `lookback_period` candles since `since_ms`.
+        Quote volumes per candle are cached, so refreshes only download and add the candles
+        following the cached ones, and drop those older than `since_ms`.
+        :param pairs: Pairs to calculate the quote volume for
+        :param since_ms: Start of the lookback range
+        :return: Quote volume per pair, 0 for pairs without `lookback_period` candles
+        """
+        tf_ms = self._tf_in_min * 60 * 1000
+        # Pairs without cached candles in range need the full range
+        pairs_by_since: dict[int, list[str]] = defaultdict(list)
+        for pair in pairs:
+            if pair in self._range_volumes and self._range_volumes[pair][0][-1] >= since_ms:
+                pairs_by_since[int(self._range_volumes[pair][0][-1]) + tf_ms].append(pair)
+            else:
+                self._range_volumes.pop(pair, None)
+                pairs_by_since[since_ms].append(pair)
+
+        candles: dict[PairWithTimeframe, DataFrame] = {}
+        for since, since_pairs in pairs_by_since.items():
+            needed_pairs: ListPairsWithTimeframes = [
+                (p, self._lookback_timeframe, self._def_candletype) for p in since_pairs
+            ]
+            candles.update(self._exchange.refresh_ohlcv_with_cache(needed_pairs, since))
+
+        self._add_range_candles(pairs, candles, since_ms)
+
+        # Stack the last `lookback_period` quote volumes of all pairs having enough candles
+        period = self._lookback_period
+        quote_volumes = np.zeros(len(pairs))
+        complete = [
+            i
+            for i, pair in enumerate(pairs)
+            if len(self._range_volumes.get(pair, ((), ()))[1]) >= period
+        ]
+        if complete:
+            stacked = np.stack([self._range_volumes[pairs[i]][1][-period:] for i in complete])
+            # A missing volume within the range counts the pair as having none
+            quote_volumes[complete] = np.nan_to_num(stacked.sum(axis=1), nan=0.0)
+        return quote_volumes.tolist()
+
+    def _add_range_candles(
+        self, pairs: list[str], candles: dict[PairWithTimeframe, DataFrame], since_ms: int
+    ) -> None:
+        """
+        Calculate the quote volume of the downloaded candles of all pairs at once
+        and add them to the cached quote volumes per candle.
+        """
+        new_candles = [
+            (pair, df)
+            for pair in pairs
+            if (df := candles.get((pair, self._lookback_timeframe, self._def_candletype)))
+            is not None
+            and not df.empty
+        ]
+        if new_candles:
+            lengths = [len(df) for _, df in new_candles]
+            dates = np.concatenate(
+                [df["date"].to_numpy(dtype="datetime64[ms]").view("i8") for _, df in new_candles]
+            )
+            volume = np.concatenate([df["volume"].to_numpy(dtype=float) for _, df in new_candles])
+            if self._exchange.get_option("ohlcv_volume_currency") == "base":
+                high, low, close = (
+                    np.concatenate([df[col].to_numpy(dtype=float) for _, df in new_candles])
+                    for col in ("high", "low", "close")
+                )
+                contract_size = np.repeat(
+                    [
+                        self._exchange.markets[pair].get("contractSize", 1.0) or 1.0
+                        for pair, _ in new_candles
+                    ],
+                    lengths,
+                )
+                typical_price = (high + low + close) / 3
+                quote_volume = volume * typical_price * contract_size
+            else:
+                # Exchange ohlcv data is in quote volume already.
+                quote_volume = volume
+
+            splits = np.cumsum(lengths)[:-1]
+            for (pair, _), pair_dates, pair_volumes in zip(
+                new_candles, np.split(dates, splits), np.split(quote_volume, splits), strict=True
+            ):
+                if pair in self._range_volumes:
+                    cached_dates, cached_volumes = self._range_volumes[pair]
+                    keep = cached_dates < pair_dates[0]
+                    pair_dates = np.concatenate([cached_dates[keep], pair_dates])
+                    pair_volumes = np.concatenate([cached_volumes[keep], pair_volumes])
+                self._range_volumes[pair] = (pair_dates, pair_volumes)
+
+        # Drop pairs no longer in the list, and cached candles which left the range
+        range_volumes = {}
+        for pair in pairs:
+            if pair not in self._range_volumes:
+                continue
+            pair_dates, pair_volumes = self._range_volumes[pair]
+            if pair_dates[0] < since_ms <= pair_dates[-1]:
+                in_range = pair_dates >= since_ms
+                pair_dates, pair_volumes = pair_dates[in_range], pair_volumes[in_range]
+            range_volumes[pair] = (pair_dates, pair_volumes)
+        self._range_volumes = range_volumes
+
     def filter_pairlist(self, pairlist: list[str], tickers: dict) -> list[str]:
         """
         Filters and sorts pairlist and returns the whitelist again.
@@ -253,48 +361,12 @@ class VolumePairList(IPairList):
                 f"till {format_ms_time(to_ms)}",
                 logger.info,
             )
-            needed_pairs: ListPairsWithTimeframes = [
-                (p, self._lookback_timeframe, self._def_candletype)
-                for p in [s["symbol"] for s in filtered_tickers]
-                if p not in self._pair_cache
-            ]
-
-            candles = self._exchange.refresh_ohlcv_with_cache(needed_pairs, since_ms)
-
-            for i, p in enumerate(filtered_tickers):
-                contract_size = self._exchange.markets[p["symbol"]].get("contractSize", 1.0) or 1.0
-                pair_candles = (
-                    candles[(p["symbol"], self._lookback_timeframe, self._def_candletype)]
-                    if (p["symbol"], self._lookback_timeframe, self._def_candletype) in candles
-                    else None
-                )
-                # in case of candle data calculate typical price and quoteVolume for candle
-                if pair_candles is not None and not pair_candles.empty:
-                    if self._exchange.get_option("ohlcv_volume_currency") == "base":
-                        pair_candles["typical_price"] = (
-                            pair_candles["high"] + pair_candles["low"] + pair_candles["close"]
-                        ) / 3
-
-                        pair_candles["quoteVolume"] = (
-                            pair_candles["volume"] * pair_candles["typical_price"] * contract_size
-                        )
-                    else:
-                        # Exchange ohlcv data is in quote volume already.
-                        pair_candles["quoteVolume"] = pair_candles["volume"]
-                    # ensure that a rolling sum over the lookback_period is built
-                    # if pair_candles contains more candles than lookback_period
-                    quoteVolume = (
-                        pair_candles["quoteVolume"]
-                        .rolling(self._lookback_period)
-                        .sum()
-                        .fillna(0)
-                        .iloc[-1]
-                    )
-
-                    # replace quoteVolume with range quoteVolume sum calculated above
-                    filtered_tickers[i]["quoteVolume"] = quoteVolume
-                else:
-                    filtered_tickers[i]["quoteVolume"] = 0
+            quote_volumes = self._range_quote_volumes(
+                [s["symbol"] for s in filtered_tickers], since_ms
+            )
+            for ticker, quote_volume in zip(filtered_tickers, quote_volumes, strict=True):
+                # replace quoteVolume with range quoteVolume sum
+                ticker["quoteVolume"] = quote_volume
         else:
             # Tickers mode - filter based on incoming pairlist.
             filtered_tickers = [v for k, v in tickers.items() if k in pairlist]
@@ -1,5 +1,6 @@
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any
@@ -8,7 +9,7 @@ from freqtrade.constants import Config, LongShort
 from freqtrade.exchange import timeframe_to_minutes
 from freqtrade.misc import plural
 from freqtrade.mixins import LoggingMixin
-from freqtrade.persistence import LocalTrade
+from freqtrade.persistence import ClosedTradeRecord, LocalTrade
 
 
 logger = logging.getLogger(__name__)
@@ -119,7 +120,9 @@ class IProtection(LoggingMixin, ABC):
             If true, this pair will be locked with <reason> until <until>
         """
 
-    def calculate_lock_end(self, trades: list[LocalTrade]) -> datetime:
+    def calculate_lock_end(
+        self, trades: Sequence[LocalTrade] | Sequence[ClosedTradeRecord]
+    ) -> datetime:
         """
         Get lock end time
         Implicitly uses `self._stop_duration` or `self._unlock_at` depending on the configuration.
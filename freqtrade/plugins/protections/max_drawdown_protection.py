@@ -2,10 +2,8 @@ import logging
 from datetime import datetime, timedelta
 from typing import Any
 
-import pandas as pd
-
 from freqtrade.constants import Config, LongShort
-from freqtrade.data.metrics import calculate_max_drawdown
+from freqtrade.data.metrics import calculate_max_drawdown_abs
 from freqtrade.persistence import Trade
 from freqtrade.plugins.protections import IProtection, ProtectionReturn
 
@@ -48,21 +46,16 @@ class MaxDrawdown(IProtection):
         """
         look_back_until = date_now - timedelta(minutes=self._lookback_period)
 
-        trades = Trade.get_trades_proxy(is_open=False, close_date=look_back_until)
-
-        trades_df = pd.DataFrame([trade.to_json() for trade in trades])
+        trades = Trade.get_closed_records_proxy(close_date=look_back_until)
 
-        if len(trades) < self._trade_limit:
+        if len(trades) < self._trade_limit or len(trades) < 2:
             # Not enough trades in the relevant period
+            # (a drawdown needs at least 2 trades, as with calculate_max_drawdown)
             return None
 
         # Drawdown is always positive
-        try:
-            # TODO: This should use absolute profit calculation, considering account balance.
-            drawdown_obj = calculate_max_drawdown(trades_df, value_col="close_profit")
-            drawdown = drawdown_obj.drawdown_abs
-        except ValueError:
-            return None
+        # TODO: This should use absolute profit calculation, considering account balance.
+        drawdown = calculate_max_drawdown_abs(trade.close_profit for trade in trades)
 
         if drawdown > self._max_allowed_drawdown:
             self.log_once(
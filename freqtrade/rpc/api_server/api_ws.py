@@ -12,6 +12,12 @@ from freqtrade.rpc.api_server.api_auth import validate_ws_token
 from freqtrade.rpc.api_server.deps import get_message_stream, get_rpc
 from freqtrade.rpc.api_server.ws.channel import WebSocketChannel, create_channel
 from freqtrade.rpc.api_server.ws.message_stream import MessageStream
+from freqtrade.rpc.api_server.ws.serializer import (
+    ARROW_WS_AVAILABLE,
+    ARROW_WS_SUBPROTOCOL,
+    HybridArrowWebSocketSerializer,
+    HybridJSONWebSocketSerializer,
+)
 from freqtrade.rpc.api_server.ws_schemas import (
     WSAnalyzedDFMessage,
     WSErrorMessage,
@@ -102,9 +108,13 @@ async def _process_consumer_request(request: dict[str, Any], channel: WebSocketC
         # Limit the amount of candles per dataframe to 'limit' or 1500
         limit = int(min(data.get("limit", 1500), 1500)) if data else None
         pair = data.get("pair", None) if data else None
+        # Last candle timestamp (ms) per pair the consumer already has
+        since = data.get("since", None) if data else None
+        if not isinstance(since, dict):
+            since = None
 
         # For every pair in the generator, send a separate message
-        for message in rpc._ws_request_analyzed_df(limit, pair):
+        for message in rpc._ws_request_analyzed_df(limit, pair, since):
             # Format response
             response = WSAnalyzedDFMessage(data=message)
             await channel.send(response.model_dump(exclude_none=True))
@@ -118,7 +128,16 @@ async def message_endpoint(
     message_stream: MessageStream = Depends(get_message_stream),
 ):
     if token:
-        async with create_channel(websocket) as channel:
+        # Send dataframes as Arrow if the consumer offered to read them
+        if ARROW_WS_AVAILABLE and ARROW_WS_SUBPROTOCOL in websocket.scope.get("subprotocols", []):
+            channel_kwargs = {
+                "serializer_cls": HybridArrowWebSocketSerializer,
+                "subprotocol": ARROW_WS_SUBPROTOCOL,
+            }
+        else:
+            channel_kwargs = {"serializer_cls": HybridJSONWebSocketSerializer}
+
+        async with create_channel(websocket, **channel_kwargs) as channel:
             await channel.run_channel_tasks(
                 channel_reader(channel, rpc), channel_broadcaster(channel, message_stream)
             )
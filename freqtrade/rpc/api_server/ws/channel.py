@@ -33,9 +33,12 @@ class WebSocketChannel:
         channel_id: str | None = None,
         serializer_cls: type[WebSocketSerializer] = HybridJSONWebSocketSerializer,
         send_throttle: float = 0.01,
+        subprotocol: str | None = None,
     ):
         self.channel_id = channel_id if channel_id else uuid4().hex[:8]
         self._websocket = WebSocketProxy(websocket)
+        # The subprotocol to accept the connection with
+        self._subprotocol = subprotocol
 
         # Internal event to signify a closed websocket
         self._closed = asyncio.Event()
@@ -130,7 +133,7 @@ class WebSocketChannel:
         accept, just close the channel.
         """
         try:
-            return await self._websocket.accept()
+            return await self._websocket.accept(self._subprotocol)
         except RuntimeError:
             await self.close()
 
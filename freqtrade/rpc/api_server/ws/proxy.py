@@ -33,7 +33,9 @@ class WebSocketProxy:
         """
         Send data on the wrapped websocket
         """
-        if hasattr(self._websocket, "send_text"):
+        if isinstance(data, bytes) and hasattr(self._websocket, "send_bytes"):
+            await self._websocket.send_bytes(data)
+        elif hasattr(self._websocket, "send_text"):
             await self._websocket.send_text(data)
         else:
             await self._websocket.send(data)
@@ -65,9 +67,9 @@ class WebSocketProxy:
             except RuntimeError:
                 pass
 
-    async def accept(self):
+    async def accept(self, subprotocol: str | None = None):
         """
         Accept the WebSocket connection, only support by FastAPI WebSockets
         """
         if hasattr(self._websocket, "accept"):
-            return await self._websocket.accept()
+            return await self._websocket.accept(subprotocol=subprotocol)
@@ -1,4 +1,5 @@
 import logging
+import struct
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -11,8 +12,20 @@ from freqtrade.rpc.api_server.ws.proxy import WebSocketProxy
 from freqtrade.rpc.api_server.ws_schemas import WSMessageSchemaType
 
 
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+
 logger = logging.getLogger(__name__)
 
+# Subprotocol offered by consumers able to read Arrow encoded dataframes
+ARROW_WS_SUBPROTOCOL = "freqtrade.arrow"
+ARROW_WS_AVAILABLE = pa is not None
+
+_FRAME_LENGTH = struct.Struct("<Q")
+
 
 class WebSocketSerializer(ABC):
     def __init__(self, websocket: WebSocketProxy):
@@ -43,6 +56,75 @@ class HybridJSONWebSocketSerializer(WebSocketSerializer):
         return rapidjson.loads(data, object_hook=_json_object_hook)
 
 
+class HybridArrowWebSocketSerializer(HybridJSONWebSocketSerializer):
+    """
+    Messages holding dataframes are sent as binary frames: a length prefixed JSON document
+    in which each dataframe is replaced by the index of a length prefixed Arrow IPC stream
+    following it. Messages without dataframes are sent as JSON text, as are dataframes
+    Arrow can't convert (e.g. object columns of mixed types).
+    """
+
+    def _serialize(self, data) -> str | bytes:  # type: ignore[override]
+        streams: list[bytes] = []
+
+        def _default(z):
+            if isinstance(z, DataFrame):
+                try:
+                    streams.append(dataframe_to_arrow(z))
+                except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                    return _json_default(z)
+                return {"__type__": "dataframe", "__arrow__": len(streams) - 1}
+            raise TypeError
+
+        header = orjson.dumps(data, default=_default)
+        if not streams:
+            return str(header, "utf-8")
+
+        parts = [_FRAME_LENGTH.pack(len(header)), header]
+        for stream in streams:
+            parts.extend((_FRAME_LENGTH.pack(len(stream)), stream))
+        return b"".join(parts)
+
+    def _deserialize(self, data: str | bytes):
+        if isinstance(data, str):
+            return super()._deserialize(data)
+
+        view = memoryview(data)
+        chunks = []
+        offset = 0
+        while offset < len(view):
+            (length,) = _FRAME_LENGTH.unpack_from(view, offset)
+            offset += _FRAME_LENGTH.size
+            chunks.append(view[offset : offset + length])
+            offset += length
+        header, *streams = chunks
+
+        def _object_hook(z):
+            if z.get("__type__") == "dataframe" and "__arrow__" in z:
+                return arrow_to_dataframe(streams[z["__arrow__"]])
+            return _json_object_hook(z)
+
+        return rapidjson.loads(str(header, "utf-8"), object_hook=_object_hook)
+
+
+def dataframe_to_arrow(dataframe: DataFrame) -> bytes:
+    """
+    Serialize a DataFrame to an Arrow IPC stream, keeping dtypes and raw float64 values
+    """
+    table = pa.Table.from_pandas(dataframe)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def arrow_to_dataframe(data: bytes | memoryview) -> DataFrame:
+    """
+    Deserialize an Arrow IPC stream into a DataFrame
+    """
+    return pa.ipc.open_stream(pa.py_buffer(data)).read_all().to_pandas()
+
+
 # Support serializing pandas DataFrames
 def _json_default(z):
     if isinstance(z, DataFrame):
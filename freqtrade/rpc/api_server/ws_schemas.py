@@ -60,6 +60,8 @@ class WSAnalyzedDFMessage(WSMessageSchema):
         key: PairWithTimeframe
         df: DataFrame
         la: datetime
+        # The dataframe only holds the candles since the last one the consumer has
+        delta: bool = False
 
     type: RPCMessageType = RPCMessageType.ANALYZED_DF
     data: AnalyzedDFData
@@ -14,6 +14,7 @@ from typing import Any, TypedDict
 
 import websockets
 from pydantic import ValidationError
+from websockets.typing import Subprotocol
 
 from freqtrade.constants import FULL_DATAFRAME_THRESHOLD
 from freqtrade.data.dataprovider import DataProvider
@@ -21,6 +22,12 @@ from freqtrade.enums import RPCMessageType
 from freqtrade.misc import remove_entry_exit_signals
 from freqtrade.rpc.api_server.ws.channel import WebSocketChannel, create_channel
 from freqtrade.rpc.api_server.ws.message_stream import MessageStream
+from freqtrade.rpc.api_server.ws.serializer import (
+    ARROW_WS_AVAILABLE,
+    ARROW_WS_SUBPROTOCOL,
+    HybridArrowWebSocketSerializer,
+    HybridJSONWebSocketSerializer,
+)
 from freqtrade.rpc.api_server.ws_schemas import (
     WSAnalyzedDFMessage,
     WSAnalyzedDFRequest,
@@ -191,12 +198,25 @@ class ExternalMessageConsumer:
                 name = producer["name"]
                 scheme = "wss" if producer.get("secure", False) else "ws"
                 ws_url = f"{scheme}://{host}:{port}/api/v1/message/ws?token={token}"
+                # Offer to receive dataframes as Arrow
+                subprotocols = [Subprotocol(ARROW_WS_SUBPROTOCOL)] if ARROW_WS_AVAILABLE else None
 
                 # This will raise InvalidURI if the url is bad
                 async with websockets.connect(
-                    ws_url, max_size=self.message_size_limit, ping_interval=None
+                    ws_url,
+                    max_size=self.message_size_limit,
+                    ping_interval=None,
+                    subprotocols=subprotocols,
                 ) as ws:
-                    async with create_channel(ws, channel_id=name, send_throttle=0.5) as channel:
+                    # Producers not supporting Arrow don't select the subprotocol
+                    serializer_cls = (
+                        HybridArrowWebSocketSerializer
+                        if ws.subprotocol == ARROW_WS_SUBPROTOCOL
+                        else HybridJSONWebSocketSerializer
+                    )
+                    async with create_channel(
+                        ws, channel_id=name, send_throttle=0.5, serializer_cls=serializer_cls
+                    ) as channel:
                         # Create the message stream for this channel
                         self._channel_streams[name] = MessageStream()
 
@@ -234,9 +254,27 @@ class ExternalMessageConsumer:
                 await asyncio.sleep(self.sleep_time)
                 continue
 
+    def _get_initial_requests(self, producer_name: str) -> list[WSRequestSchema]:
+        """
+        Get the requests to send on (re)connection. Dataframes already held
+        from this producer are only requested from their last candle on.
+
+        :param producer_name: The name of the producer
+        """
+        since = self._dp._get_producer_last_candles(producer_name)
+        if not since:
+            return self._initial_requests
+
+        return [
+            WSAnalyzedDFRequest(data={**request.data, "since": since})
+            if isinstance(request, WSAnalyzedDFRequest)
+            else request
+            for request in self._initial_requests
+        ]
+
     async def _send_requests(self, channel: WebSocketChannel, channel_stream: MessageStream):
         # Send the initial requests
-        for init_request in self._initial_requests:
+        for init_request in self._get_initial_requests(channel.channel_id):
             await channel.send(schema_to_dict(init_request))
 
         # Now send any subsequent requests published to
@@ -345,6 +383,7 @@ class ExternalMessageConsumer:
         key = df_message.data.key
         df = df_message.data.df
         la = df_message.data.la
+        delta = df_message.data.delta
 
         pair, timeframe, candle_type = key
 
@@ -365,6 +404,7 @@ class ExternalMessageConsumer:
             timeframe=timeframe,
             candle_type=candle_type,
             producer_name=producer_name,
+            delta=delta,
         )
 
         if not did_append:
@@ -378,9 +418,13 @@ class ExternalMessageConsumer:
                 f"for {key} from `{producer_name}`"
             )
 
-            self.send_producer_request(
-                producer_name, WSAnalyzedDFRequest(data={"limit": n_missing, "pair": pair})
-            )
+            request_data: dict[str, Any] = {"limit": n_missing, "pair": pair}
+            # Producers able to will only send the candles since our last one
+            last_candles = self._dp._get_producer_last_candles(producer_name)
+            if pair in last_candles:
+                request_data["since"] = {pair: last_candles[pair]}
+
+            self.send_producer_request(producer_name, WSAnalyzedDFRequest(data=request_data))
             return
 
         logger.debug(
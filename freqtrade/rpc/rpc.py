@@ -3,16 +3,18 @@ This module contains class to define a RPC communications
 """
 
 import logging
+import threading
 from abc import abstractmethod
 from collections.abc import Generator, Sequence
 from datetime import UTC, date, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
 import psutil
+from cachetools import LRUCache
 from dateutil.relativedelta import relativedelta
 from dateutil.tz import tzlocal
-from numpy import inf, int64, isnan, mean, nan
-from pandas import DataFrame, NaT
+from numpy import inf, int64, isnan, nan
+from pandas import DataFrame, NaT, Timestamp
 from sqlalchemy import func, select
 
 from freqtrade import __version__
@@ -121,6 +123,10 @@ class RPC:
         self._config: Config = freqtrade.config
         if self._config.get("fiat_display_currency"):
             self._fiat_converter = CryptoToFiatConverter(self._config)
+        # Closed trade statistics, keyed by trade filter
+        self._closed_trade_statistics_cache: LRUCache = LRUCache(maxsize=16)
+        # API server requests run in a thread pool, cachetools caches are not thread-safe
+        self._closed_trade_statistics_lock = threading.Lock()
 
     @staticmethod
     def _rpc_show_config(
@@ -474,27 +480,29 @@ class RPC:
         Generate generic stats for trades in database
         """
 
-        def trade_win_loss(trade):
-            if trade.close_profit > 0:
+        def trade_win_loss(close_profit):
+            if close_profit > 0:
                 return "wins"
-            elif trade.close_profit < 0:
+            elif close_profit < 0:
                 return "losses"
             else:
                 return "draws"
 
-        trades = Trade.get_trades([Trade.is_open.is_(False)], include_orders=False)
+        # Exit reason
+        exit_reasons = {
+            exit_reason: {"wins": wins, "losses": losses, "draws": draws}
+            for exit_reason, wins, losses, draws in Trade.get_exit_reason_summary()
+        }
         # Duration
         dur: dict[str, list[float]] = {"wins": [], "draws": [], "losses": []}
-        # Exit reason
-        exit_reasons = {}
-        for trade in trades:
-            if trade.exit_reason not in exit_reasons:
-                exit_reasons[trade.exit_reason] = {"wins": 0, "losses": 0, "draws": 0}
-            exit_reasons[trade.exit_reason][trade_win_loss(trade)] += 1
-
-            if trade.close_date is not None and trade.open_date is not None:
-                trade_dur = (trade.close_date - trade.open_date).total_seconds()
-                dur[trade_win_loss(trade)].append(trade_dur)
+        for close_profit, open_date, close_date in Trade.session.execute(
+            select(Trade.close_profit, Trade.open_date, Trade.close_date).filter(
+                Trade.is_open.is_(False)
+            )
+        ):
+            if close_date is not None and open_date is not None:
+                trade_dur = (close_date - open_date).total_seconds()
+                dur[trade_win_loss(close_profit)].append(trade_dur)
 
         wins_dur = sum(dur["wins"]) / len(dur["wins"]) if len(dur["wins"]) > 0 else None
         draws_dur = sum(dur["draws"]) / len(dur["draws"]) if len(dur["draws"]) > 0 else None
@@ -503,6 +511,73 @@ class RPC:
         durations = {"wins": wins_dur, "draws": draws_dur, "losses": losses_dur}
         return {"exit_reasons": exit_reasons, "durations": durations}
 
+    def _closed_trade_statistics(
+        self, cache_key: tuple, trade_filter: list, summary, starting_balance: float
+    ) -> dict[str, Any]:
+        """
+        Statistics of closed trades which can't be aggregated in SQL.
+        Cached until the profit summary of the closed trades changes, e.g. when a trade closes.
+        :param cache_key: Key identifying `trade_filter`
+        :param trade_filter: Filters selecting the closed trades
+        :param summary: Profit summary of these trades, from `Trade.get_closed_profit_summary`
+        :param starting_balance: Starting balance to calculate the drawdown with
+        """
+        cache_key = (*cache_key, starting_balance)
+        with self._closed_trade_statistics_lock:
+            cached = self._closed_trade_statistics_cache.get(cache_key)
+        if cached and cached[0] == tuple(summary):
+            return cached[1]
+
+        trades = Trade.session.execute(
+            select(Trade.id, Trade.open_date, Trade.close_date, Trade.close_profit_abs)
+            .filter(*trade_filter)
+            .order_by(Trade.id)
+        ).all()
+
+        trades_df = DataFrame(
+            [
+                {
+                    "close_date": format_date(close_date),
+                    "close_date_dt": close_date,
+                    "profit_abs": close_profit_abs,
+                }
+                for _, _, close_date, close_profit_abs in trades
+                if close_date
+            ]
+        )
+
+        expectancy, expectancy_ratio = calculate_expectancy(trades_df)
+
+        drawdown = DrawDownResult()
+        if len(trades_df) > 0:
+            try:
+                drawdown = calculate_max_drawdown(
+                    trades_df,
+                    value_col="profit_abs",
+                    date_col="close_date_dt",
+                    starting_balance=starting_balance,
+                )
+            except ValueError:
+                # ValueError if no losing trade.
+                pass
+
+        stats = {
+            "durations": [
+                (close_date - open_date).total_seconds()
+                for _, open_date, close_date, _ in trades
+                if close_date
+            ],
+            # (id, open date) of the first and last trade
+            "first_trade": (trades[0][0], trades[0][1].replace(tzinfo=UTC)) if trades else None,
+            "last_trade": (trades[-1][0], trades[-1][1].replace(tzinfo=UTC)) if trades else None,
+            "expectancy": expectancy,
+            "expectancy_ratio": expectancy_ratio,
+            "drawdown": drawdown,
+        }
+        with self._closed_trade_statistics_lock:
+            self._closed_trade_statistics_cache[cache_key] = (tuple(summary), stats)
+        return stats
+
     def _collect_trade_statistics_data(
         self,
         trades: Sequence["Trade"],
@@ -582,34 +657,43 @@ class RPC:
         """
         start_date = datetime.fromtimestamp(0) if start_date is None else start_date
 
-        trade_filter = (
-            Trade.is_open.is_(False) & (Trade.close_date >= start_date)
-        ) | Trade.is_open.is_(True)
+        closed_filter = [Trade.is_open.is_(False), Trade.close_date >= start_date]
+        open_filter = [Trade.is_open.is_(True)]
 
         if direction == "long":
             dir_filter = Trade.is_short.is_(False)
-            trade_filter = trade_filter & dir_filter
+            closed_filter.append(dir_filter)
+            open_filter.append(dir_filter)
         elif direction == "short":
             dir_filter = Trade.is_short.is_(True)
-            trade_filter = trade_filter & dir_filter
+            closed_filter.append(dir_filter)
+            open_filter.append(dir_filter)
 
-        trades: Sequence[Trade] = Trade.session.scalars(
-            Trade.get_trades_query(trade_filter, include_orders=False).order_by(Trade.id)
+        # Closed trades are aggregated in SQL, only open trades need pricing
+        closed = Trade.get_closed_profit_summary(closed_filter)
+        starting_balance = self._freqtrade.wallets.get_starting_balance()
+        closed_stats = self._closed_trade_statistics(
+            (start_date, direction), closed_filter, closed, starting_balance
+        )
+
+        open_trades: Sequence[Trade] = Trade.session.scalars(
+            Trade.get_trades_query(open_filter, include_orders=False).order_by(Trade.id)
         ).all()
 
-        stats = self._collect_trade_statistics_data(trades, stake_currency, fiat_display_currency)
+        stats = self._collect_trade_statistics_data(
+            open_trades, stake_currency, fiat_display_currency
+        )
 
         profit_all_coin = stats["profit_all_coin"]
         profit_all_ratio = stats["profit_all_ratio"]
-        profit_closed_coin = stats["profit_closed_coin"]
-        profit_closed_ratio = stats["profit_closed_ratio"]
-        durations = stats["durations"]
-        winning_trades = stats["winning_trades"]
-        losing_trades = stats["losing_trades"]
-        winning_profit = stats["winning_profit"]
-        losing_profit = stats["losing_profit"]
+        durations = closed_stats["durations"] + stats["durations"]
+        winning_trades = int(closed.winning_trades)
+        losing_trades = int(closed.losing_trades)
+        winning_profit = closed.winning_profit
+        losing_profit = closed.losing_profit
 
-        closed_trade_count = len([t for t in trades if not t.is_open])
+        closed_trade_count = int(closed.trade_count)
+        trade_count = closed_trade_count + len(open_trades)
 
         best_pair_filters = [Trade.close_date > start_date]
         trading_volume_filters = [Order.order_filled_date >= start_date]
@@ -622,9 +706,11 @@ class RPC:
         trading_volume = Trade.get_trading_volume(trading_volume_filters)
 
         # Prepare data to display
-        profit_closed_coin_sum = round(sum(profit_closed_coin), 8)
-        profit_closed_ratio_mean = float(mean(profit_closed_ratio) if profit_closed_ratio else 0.0)
-        profit_closed_ratio_sum = sum(profit_closed_ratio) if profit_closed_ratio else 0.0
+        profit_closed_coin_sum = round(closed.profit_abs_sum, 8)
+        profit_closed_ratio_sum = closed.profit_ratio_sum
+        profit_closed_ratio_mean = (
+            profit_closed_ratio_sum / closed_trade_count if closed_trade_count else 0.0
+        )
 
         profit_closed_fiat = (
             self._fiat_converter.convert_amount(
@@ -634,11 +720,11 @@ class RPC:
             else 0
         )
 
-        profit_all_coin_sum = round(sum(profit_all_coin), 8)
-        profit_all_ratio_mean = float(mean(profit_all_ratio) if profit_all_ratio else 0.0)
+        profit_all_coin_sum = round(closed.profit_abs_sum + sum(profit_all_coin), 8)
+        profit_all_count = closed_trade_count + len(profit_all_ratio)
         # Doing the sum is not right - overall profit needs to be based on initial capital
-        profit_all_ratio_sum = sum(profit_all_ratio) if profit_all_ratio else 0.0
-        starting_balance = self._freqtrade.wallets.get_starting_balance()
+        profit_all_ratio_sum = profit_closed_ratio_sum + sum(profit_all_ratio)
+        profit_all_ratio_mean = profit_all_ratio_sum / profit_all_count if profit_all_count else 0.0
         profit_closed_ratio_fromstart = 0.0
         profit_all_ratio_fromstart = 0.0
         if starting_balance:
@@ -649,32 +735,9 @@ class RPC:
 
         winrate = (winning_trades / closed_trade_count) if closed_trade_count > 0 else 0
 
-        trades_df = DataFrame(
-            [
-                {
-                    "close_date": format_date(trade.close_date),
-                    "close_date_dt": trade.close_date,
-                    "profit_abs": trade.close_profit_abs,
-                }
-                for trade in trades
-                if not trade.is_open and trade.close_date
-            ]
-        )
-
-        expectancy, expectancy_ratio = calculate_expectancy(trades_df)
-
-        drawdown = DrawDownResult()
-        if len(trades_df) > 0:
-            try:
-                drawdown = calculate_max_drawdown(
-                    trades_df,
-                    value_col="profit_abs",
-                    date_col="close_date_dt",
-                    starting_balance=starting_balance,
-                )
-            except ValueError:
-                # ValueError if no losing trade.
-                pass
+        expectancy = closed_stats["expectancy"]
+        expectancy_ratio = closed_stats["expectancy_ratio"]
+        drawdown = closed_stats["drawdown"]
 
         profit_all_fiat = (
             self._fiat_converter.convert_amount(
@@ -684,8 +747,14 @@ class RPC:
             else 0
         )
 
-        first_date = trades[0].open_date_utc if trades else None
-        last_date = trades[-1].open_date_utc if trades else None
+        # First and last trade by id, open or closed
+        trade_dates = [closed_stats["first_trade"], closed_stats["last_trade"]]
+        if open_trades:
+            trade_dates.append((open_trades[0].id, open_trades[0].open_date_utc))
+            trade_dates.append((open_trades[-1].id, open_trades[-1].open_date_utc))
+        trade_dates = sorted(d for d in trade_dates if d)
+        first_date = trade_dates[0][1] if trade_dates else None
+        last_date = trade_dates[-1][1] if trade_dates else None
         num = float(len(durations) or 1)
         bot_start = KeyValueStore.get_datetime_value("bot_start_time")
         return {
@@ -705,7 +774,7 @@ class RPC:
             "profit_all_ratio": profit_all_ratio_fromstart,
             "profit_all_percent": round(profit_all_ratio_fromstart * 100, 2),
             "profit_all_fiat": profit_all_fiat,
-            "trade_count": len(trades),
+            "trade_count": trade_count,
             "closed_trade_count": closed_trade_count,
             "first_trade_date": format_date(first_date),
             "first_trade_humanized": dt_humanize_delta(first_date) if first_date else "",
@@ -1510,15 +1579,14 @@ class RPC:
         :param limit: The amount of candles in the dataframe
         """
         _data, last_analyzed = self._freqtrade.dataprovider.get_analyzed_dataframe(pair, timeframe)
-        _data = _data.copy()
 
         if limit:
             _data = _data.iloc[-limit:]
 
-        return _data, last_analyzed
+        return _data.copy(), last_analyzed
 
     def _ws_all_analysed_dataframes(
-        self, pairlist: list[str], limit: int | None
+        self, pairlist: list[str], limit: int | None, since: dict[str, int] | None = None
     ) -> Generator[dict[str, Any], None, None]:
         """
         Get the analysed dataframes of each pair in the pairlist.
@@ -1528,21 +1596,49 @@ class RPC:
         :param pairlist: A list of pairs to get
         :param limit: If an integer, limits the size of dataframe
                       If a list of string date times, only returns those candles
-        :returns: A generator of dictionaries with the key, dataframe, and last analyzed timestamp
+        :param since: Last candle (timestamp in ms) the consumer holds per pair. Dataframes
+                      containing that candle are sent from it on and flagged as delta,
+                      `limit` only applies to the other dataframes.
+        :returns: A generator of dictionaries with the key, dataframe, last analyzed timestamp
+                  and whether the dataframe is a delta
         """
         timeframe = self._freqtrade.config["timeframe"]
         candle_type = self._freqtrade.config.get("candle_type_def", CandleType.SPOT)
 
         for pair in pairlist:
-            dataframe, last_analyzed = self.__rpc_analysed_dataframe_raw(pair, timeframe, limit)
-
-            yield {"key": (pair, timeframe, candle_type), "df": dataframe, "la": last_analyzed}
+            _data, last_analyzed = self._freqtrade.dataprovider.get_analyzed_dataframe(
+                pair, timeframe
+            )
+            delta = False
+            # Filter before limiting: a gap request asks for the number of missing candles,
+            # which would cut off the consumer's last candle
+            if since and pair in since and not _data.empty:
+                since_date = Timestamp(since[pair], unit="ms", tz="UTC")
+                # Without the consumer's last candle, the consumer needs the full dataframe
+                if _data["date"].iloc[0] <= since_date:
+                    _data = _data.iloc[_data["date"].searchsorted(since_date) :]
+                    delta = True
+            if limit and not delta:
+                _data = _data.iloc[-limit:]
+            dataframe = _data.copy()
+
+            yield {
+                "key": (pair, timeframe, candle_type),
+                "df": dataframe,
+                "la": last_analyzed,
+                "delta": delta,
+            }
 
-    def _ws_request_analyzed_df(self, limit: int | None = None, pair: str | None = None):
+    def _ws_request_analyzed_df(
+        self,
+        limit: int | None = None,
+        pair: str | None = None,
+        since: dict[str, int] | None = None,
+    ):
         """Historical Analyzed Dataframes for WebSocket"""
         pairlist = [pair] if pair else self._freqtrade.active_pair_whitelist
 
-        return self._ws_all_analysed_dataframes(pairlist, limit)
+        return self._ws_all_analysed_dataframes(pairlist, limit, since)
 
     def _ws_request_whitelist(self):
         """Whitelist data for WebSocket"""
@@ -4,7 +4,10 @@ This module defines the interface to apply for strategies
 """
 
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from math import isinf, isnan
 
@@ -13,7 +16,7 @@ from pydantic import ValidationError
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import CUSTOM_TAG_MAX_LENGTH, Config, IntOrInf, ListPairsWithTimeframes
-from freqtrade.data.converter import populate_dataframe_with_trades
+from freqtrade.data.converter import OrderflowState, populate_dataframe_with_trades
 from freqtrade.data.converter.converter import reduce_dataframe_footprint
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.enums import (
@@ -47,6 +50,9 @@ from freqtrade.wallets import Wallets
 
 logger = logging.getLogger(__name__)
 
+# Per-thread analysis state, kept off the strategy so it stays picklable for hyperopt
+_analysis_state = threading.local()
+
 
 class IStrategy(ABC, HyperStrategyMixin):
     """
@@ -146,13 +152,16 @@ class IStrategy(ABC, HyperStrategyMixin):
     # A self set parameter that represents the market direction. filled from configuration
     market_direction: MarketDirection = MarketDirection.NONE
 
-    # Global cache dictionary
-    _cached_grouped_trades_per_pair: dict[str, DataFrame] = {}
+    # Global orderflow state per pair
+    _orderflow_state_per_pair: dict[str, OrderflowState] = {}
 
     def __init__(self, config: Config) -> None:
         self.config = config
         # Dict to determine if analysis is necessary
         self.__last_candle_seen_per_pair: dict[str, datetime] = {}
+        # Duration (seconds) of the last analysis of each pair
+        self.analysis_durations: dict[str, float] = {}
+        self._analyze_executor: ThreadPoolExecutor | None = None
         super().__init__(config)
 
         # Gather informative pairs from @informative-decorated methods.
@@ -223,6 +232,9 @@ class IStrategy(ABC, HyperStrategyMixin):
         Clean up FreqAI and child threads
         """
         self.freqai.shutdown()
+        if self._analyze_executor:
+            self._analyze_executor.shutdown(wait=True)
+            self._analyze_executor = None
 
     @abstractmethod
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
@@ -1218,9 +1230,7 @@ class IStrategy(ABC, HyperStrategyMixin):
 
             self.__last_candle_seen_per_pair[pair] = dataframe.iloc[-1]["date"]
 
-            candle_type = self.config.get("candle_type_def", CandleType.SPOT)
-            self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
-            self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+            self._publish_analyzed_df(pair, dataframe, new_candle)
 
         else:
             logger.debug("Skipping TA Analysis for already analyzed candle")
@@ -1262,13 +1272,70 @@ class IStrategy(ABC, HyperStrategyMixin):
             logger.warning("Empty dataframe for pair %s", pair)
             return
 
+    def _publish_analyzed_df(self, pair: str, dataframe: DataFrame, new_candle: bool) -> None:
+        """
+        Store the analyzed dataframe in the dataprovider and emit it to consumers.
+        Deferred while analyzing on a worker thread, `analyze` publishes in pair order.
+        """
+        candle_type = self.config.get("candle_type_def", CandleType.SPOT)
+        deferred = getattr(_analysis_state, "deferred", None)
+        if deferred is not None:
+            deferred.append((pair, dataframe, new_candle, candle_type))
+            return
+        self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
+        self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+
+    def _analyze_pair_timed(self, pair: str) -> float:
+        start = time.perf_counter()
+        self.analyze_pair(pair)
+        duration = time.perf_counter() - start
+        self.analysis_durations[pair] = duration
+        return duration
+
+    def _analyze_pair_deferred(self, pair: str) -> list[tuple[str, DataFrame, bool, CandleType]]:
+        _analysis_state.deferred = []
+        try:
+            self._analyze_pair_timed(pair)
+            return _analysis_state.deferred
+        finally:
+            _analysis_state.deferred = None
+
     def analyze(self, pairs: list[str]) -> None:
         """
         Analyze all pairs using analyze_pair().
+        With `analyze_workers` > 1, pairs are analyzed concurrently on a thread pool.
+        The first pair is analyzed on the calling thread, so that per-candle caches (e.g.
+        FreqAI corr pair features) are populated before the other pairs start.
+        Analyzed dataframes are still stored and emitted in pair order.
+        The duration of each pair analysis is kept in `analysis_durations`.
         :param pairs: List of pairs to analyze
         """
-        for pair in pairs:
-            self.analyze_pair(pair)
+        start = time.perf_counter()
+        workers = self.config.get("analyze_workers", 1)
+        if workers <= 1 or len(pairs) <= 2:
+            for pair in pairs:
+                self._analyze_pair_timed(pair)
+        else:
+            self._analyze_pair_timed(pairs[0])
+            if self._analyze_executor is None:
+                self._analyze_executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="analyze"
+                )
+            futures = [
+                self._analyze_executor.submit(self._analyze_pair_deferred, pair)
+                for pair in pairs[1:]
+            ]
+            for future in futures:
+                for pair, dataframe, new_candle, candle_type in future.result():
+                    self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
+                    self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+
+        if pairs:
+            slowest = max(pairs, key=lambda p: self.analysis_durations.get(p, 0))
+            logger.debug(
+                f"Analyzed {len(pairs)} pairs in {time.perf_counter() - start:.3f}s, slowest "
+                f"{slowest} in {self.analysis_durations.get(slowest, 0):.3f}s."
+            )
 
     def get_latest_candle(
         self,
@@ -1742,6 +1809,15 @@ class IStrategy(ABC, HyperStrategyMixin):
         using only one strategy.
         """
         res = {}
+        freqai_config = self.config.get("freqai", {})
+        if (
+            freqai_config.get("enabled", False)
+            and freqai_config.get("backtest_parallel_workers", 0) > 1
+            and not self.config.get("freqai_backtest_live_models", False)
+        ):
+            # train all backtesting windows upfront, populate_indicators then only
+            # assembles the predictions saved to disk
+            self.freqai.start_backtesting_parallel(data, self)
         for pair, pair_data in data.items():
             validator = StrategyResultValidator(
                 pair_data, warn_only=not self.disable_dataframe_checks
@@ -1778,15 +1854,11 @@ class IStrategy(ABC, HyperStrategyMixin):
 
             trades = self.dp.trades(pair=pair, copy=False, timerange=timerange)
 
-            cached_grouped_trades: DataFrame | None = self._cached_grouped_trades_per_pair.get(pair)
-            dataframe, cached_grouped_trades = populate_dataframe_with_trades(
-                cached_grouped_trades, self.config, dataframe, trades
+            dataframe, orderflow_state = populate_dataframe_with_trades(
+                self._orderflow_state_per_pair.get(pair), self.config, dataframe, trades
             )
-
-            # dereference old cache
-            if pair in self._cached_grouped_trades_per_pair:
-                del self._cached_grouped_trades_per_pair[pair]
-            self._cached_grouped_trades_per_pair[pair] = cached_grouped_trades
+            if orderflow_state is not None:
+                self._orderflow_state_per_pair[pair] = orderflow_state
 
             logger.debug("Populated dataframe with trades.")
         return dataframe
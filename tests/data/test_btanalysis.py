@@ -28,6 +28,7 @@ from freqtrade.data.metrics import (
     calculate_expectancy,
     calculate_market_change,
     calculate_max_drawdown,
+    calculate_max_drawdown_abs,
     calculate_sharpe,
     calculate_sortino,
     calculate_sqn,
@@ -376,6 +377,27 @@ def test_calculate_max_drawdown(testdatadir):
         calculate_underwater(DataFrame())
 
 
+@pytest.mark.parametrize(
+    "profits",
+    [
+        [0.0, -500.0, 500.0, 10000.0, -1000.0],
+        [-0.1, -0.05, 0.2, -0.3, 0.1, -0.02],
+        [0.1, 0.2, 0.05],
+        [-0.1, 0.05],
+    ],
+)
+def test_calculate_max_drawdown_abs_profits(profits):
+    dates = [datetime(2020, 1, 1, tzinfo=UTC) + timedelta(days=i) for i in range(len(profits))]
+    df = DataFrame({"profit_abs": profits, "close_date": dates})
+    try:
+        expected = calculate_max_drawdown(df).drawdown_abs
+    except ValueError:
+        # No losing trade
+        expected = 0.0
+    assert pytest.approx(calculate_max_drawdown_abs(profits)) == expected
+    assert calculate_max_drawdown_abs([]) == 0.0
+
+
 def test_calculate_csum(testdatadir):
     filename = testdatadir / "backtest_results/backtest-result.json"
     bt_data = load_backtest_data(filename)
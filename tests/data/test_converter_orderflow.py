@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -7,6 +8,7 @@ from freqtrade.data.converter.orderflow import (
     ORDERFLOW_ADDED_COLUMNS,
     stacked_imbalance,
     timeframe_to_DateOffset,
+    trades_orderflow_to_imbalances,
     trades_to_volumeprofile_with_total_delta_bid_ask,
 )
 from freqtrade.data.converter.trade_converter import trades_list_to_df
@@ -389,6 +391,116 @@ def test_public_trades_binned_big_sample_list(public_trades_list):
     assert 52.7199999 == pytest.approx(df["delta"].iat[0])  # delta
 
 
+@pytest.mark.parametrize(
+    "scale,imbalance_volume,stacked_imbalance_range", [(0.05, 0, 2), (0.01, 5, 1), (1, 0, 3)]
+)
+def test_populate_dataframe_with_trades_per_candle(
+    public_trades_list, scale, imbalance_volume, stacked_imbalance_range
+):
+    trades = trades_list_to_df(public_trades_list[DEFAULT_TRADES_COLUMNS].values.tolist())
+    dataframe = pd.DataFrame(
+        {"date": pd.date_range("2023-02-02 09:18:00", periods=6, freq="1min", tz="UTC")}
+    )
+    config = {
+        "timeframe": "1m",
+        "orderflow": {
+            "cache_size": 1000,
+            "max_candles": 1500,
+            "scale": scale,
+            "imbalance_volume": imbalance_volume,
+            "imbalance_ratio": 3,
+            "stacked_imbalance_range": stacked_imbalance_range,
+        },
+    }
+    df, cache = populate_dataframe_with_trades(None, config, dataframe, trades.copy())
+    # No trades in the first 2 candles
+    assert df["total_trades"].isna().tolist() == [True, True, False, False, False, False]
+    assert df["total_trades"].sum() == len(trades)
+
+    for _, row in df.iloc[2:].iterrows():
+        candle_trades = trades.loc[
+            (trades["date"] >= row["date"]) & (trades["date"] < row["date"] + pd.Timedelta("1min"))
+        ]
+        assert [t["id"] for t in row["trades"]] == candle_trades["id"].tolist()
+        assert list(row["trades"][0].keys()) == DEFAULT_TRADES_COLUMNS + ["date"]
+
+        # Same results as the per candle calculation
+        orderflow = trades_to_volumeprofile_with_total_delta_bid_ask(candle_trades, scale=scale)
+        assert list(row["orderflow"].keys()) == orderflow.index.tolist()
+        for price, level in orderflow.to_dict(orient="index").items():
+            assert pytest.approx(row["orderflow"][price]) == level
+        imbalances = trades_orderflow_to_imbalances(
+            orderflow, imbalance_ratio=3, imbalance_volume=imbalance_volume
+        )
+        assert row["imbalances"] == imbalances.to_dict(orient="index")
+        for label in ("bid", "ask"):
+            assert row[f"stacked_imbalances_{label}"] == stacked_imbalance(
+                imbalances, label=label, stacked_imbalance_range=stacked_imbalance_range
+            )
+
+        deltas = np.where(candle_trades["side"] == "buy", 1, -1) * candle_trades["amount"]
+        assert pytest.approx(row["delta"]) == deltas.sum()
+        assert pytest.approx(row["max_delta"]) == deltas.cumsum().max()
+        assert pytest.approx(row["min_delta"]) == deltas.cumsum().min()
+        assert (
+            pytest.approx(row["bid"])
+            == candle_trades.loc[candle_trades["side"] == "sell", "amount"].sum()
+        )
+
+    # Cached candles are reused as they are
+    df2, _ = populate_dataframe_with_trades(cache, config, dataframe.copy(), trades.copy())
+    for col in ORDERFLOW_ADDED_COLUMNS:
+        assert df2[col].iloc[2:].tolist() == df[col].iloc[2:].tolist()
+
+
+def test_populate_dataframe_with_trades_incremental(mocker, public_trades_list):
+    trades = trades_list_to_df(public_trades_list[DEFAULT_TRADES_COLUMNS].values.tolist())
+    dataframe = pd.DataFrame(
+        {"date": pd.date_range("2023-02-02 09:18:00", periods=6, freq="1min", tz="UTC")}
+    )
+    config = {
+        "timeframe": "1m",
+        "orderflow": {
+            "cache_size": 3,
+            "max_candles": 1500,
+            "scale": 0.05,
+            "imbalance_volume": 0,
+            "imbalance_ratio": 3,
+            "stacked_imbalance_range": 2,
+        },
+    }
+    import freqtrade.data.converter.orderflow as orderflow_module
+
+    spy = mocker.spy(orderflow_module, "trades_to_orderflow_per_candle")
+    state = None
+    processed = 0
+    for end in (300, 301, 650, 900, 1000, 1000):
+        open_candle_trades = len(state.open_trades) if state else 0
+        call_count = spy.call_count
+        df, state = populate_dataframe_with_trades(
+            state, config, dataframe.copy(), trades.iloc[:end]
+        )
+        expected, _ = populate_dataframe_with_trades(
+            None, config, dataframe.copy(), trades.iloc[:end]
+        )
+        for col in ORDERFLOW_ADDED_COLUMNS:
+            pd.testing.assert_series_equal(df[col], expected[col])
+        # Only new trades and trades of the open candle were calculated
+        if end > processed:
+            calculated = spy.call_args_list[call_count].args[0]
+            assert len(calculated) == open_candle_trades + end - processed
+        processed = end
+        assert len(state.candles) <= 3
+
+    assert state.last_timestamp == trades["timestamp"].iat[-1]
+    assert df["total_trades"].sum() == len(trades)
+
+    # A different trades history starts over
+    df, state2 = populate_dataframe_with_trades(state, config, dataframe.copy(), trades.iloc[:10])
+    assert state2 is not state
+    assert df["total_trades"].sum() == 10
+
+
 def test_public_trades_config_max_trades(
     default_conf, populate_dataframe_with_trades_dataframe, populate_dataframe_with_trades_trades
 ):
@@ -502,7 +614,7 @@ def test_analyze_with_orderflow(
     mocker.patch.object(strategy.dp, "trades", return_value=populate_dataframe_with_trades_trades)
     import freqtrade.data.converter.orderflow as orderflow_module
 
-    spy = mocker.spy(orderflow_module, "trades_to_volumeprofile_with_total_delta_bid_ask")
+    spy = mocker.spy(orderflow_module, "trades_to_orderflow_per_candle")
 
     pair = "ETH/BTC"
     df = strategy.advise_indicators(ohlcv_history, {"pair:": pair})
@@ -529,7 +641,8 @@ def test_analyze_with_orderflow(
     df1 = strategy.advise_indicators(ohlcv_history, {"pair": pair})
     assert len(df1) == len(ohlcv_history)
     assert "open" in df1.columns
-    assert spy.call_count == 5
+    # All candles are calculated at once
+    assert spy.call_count == 1
 
     for col in ORDERFLOW_ADDED_COLUMNS:
         assert col in df1.columns, f"Column {col} not found in df.columns"
@@ -537,7 +650,7 @@ def test_analyze_with_orderflow(
         if col not in ("stacked_imbalances_bid", "stacked_imbalances_ask"):
             assert df1[col].count() == 5, f"Column {col} has {df1[col].count()} non-NaN values"
 
-    assert len(strategy._cached_grouped_trades_per_pair[pair]) == 5
+    assert len(strategy._orderflow_state_per_pair[pair].candles) == 5
 
     lastval_trades = df1.at[len(df1) - 1, "trades"]
     assert isinstance(lastval_trades, list)
@@ -518,6 +518,20 @@ def test_dp__add_external_df(default_conf_usdt):
     df, _ = dp.get_producer_df("ETH/USDT", timeframe, CandleType.SPOT)
     assert len(df) == 48
 
+    assert dp._get_producer_last_candles("default") == {
+        "ETH/USDT": int(df2["date"].iloc[-1].timestamp() * 1000)
+    }
+    assert dp._get_producer_last_candles("other") == {}
+
+    # A delta is appended whatever its length
+    df3 = generate_test_data(timeframe, 150, "2022-01-02 23:00:00+00:00")
+    res = dp._add_external_df(
+        "ETH/USDT", df3, last_analyzed, timeframe, CandleType.SPOT, delta=True
+    )
+    assert res == (True, 0)
+    df, _ = dp.get_producer_df("ETH/USDT", timeframe, CandleType.SPOT)
+    assert len(df) == 47 + 150
+
     # Add a dataframe with a 12 hour offset - so 12 candles are overlapping, and 12 valid.
     df3 = generate_test_data(timeframe, 24, "2022-01-02 12:00:00+00:00")
 
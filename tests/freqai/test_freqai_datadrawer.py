@@ -1,15 +1,18 @@
 import shutil
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from freqtrade.configuration import TimeRange
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.exceptions import OperationalException
+from freqtrade.freqai.data_drawer import FreqaiDataDrawer
 from freqtrade.freqai.data_kitchen import FreqaiDataKitchen
-from tests.conftest import get_patched_exchange
+from freqtrade.freqai.historic_predictions import HistoricPredictions
+from tests.conftest import get_patched_exchange, log_has_re
 from tests.freqai.conftest import get_patched_freqai_strategy
 
 
@@ -237,3 +240,129 @@ def test_set_initial_return_values_warning(mocker, freqai_conf):
 
     # Ensure logger error is not called
     mock_logger_warning.assert_called()
+
+
+def test_historic_predictions_save_only_new_rows(tmp_path):
+    dates = pd.date_range("2023-08-01", periods=3, freq="5min", tz="UTC")
+    hist_preds = HistoricPredictions(
+        tmp_path,
+        {
+            "BTC/USDT:USDT": pd.DataFrame(
+                {"&-s_close": [0.1, 0.2, 0.3], "do_predict": [1, 1, 0], "date_pred": dates}
+            )
+        },
+    )
+    hist_preds.save()
+    segments = sorted(tmp_path.glob("*/*.arrow"))
+    assert len(segments) == 1
+
+    new_date = dates[-1] + pd.Timedelta("5min")
+    hist_preds.append("BTC/USDT:USDT", {"&-s_close": 0.4, "date_pred": new_date, "unknown": 5})
+    hist_preds.save()
+    segments = sorted(tmp_path.glob("*/*.arrow"))
+    assert len(segments) == 2
+    assert len(pd.read_feather(segments[1])) == 1
+    # nothing new, nothing written
+    hist_preds.save()
+    assert len(sorted(tmp_path.glob("*/*.arrow"))) == 2
+
+    loaded = HistoricPredictions(tmp_path)
+    assert loaded.load()
+    df = loaded["BTC/USDT:USDT"]
+    assert list(df.columns) == ["&-s_close", "do_predict", "date_pred"]
+    assert np.allclose(df["&-s_close"], [0.1, 0.2, 0.3, 0.4])
+    # missing columns of appended rows are zero filled
+    assert list(df["do_predict"]) == [1, 1, 0, 0]
+    assert df["date_pred"].iloc[-1] == new_date
+    assert loaded.tail("BTC/USDT:USDT", 2)["date_pred"].iloc[0] == dates[-1]
+
+    # replacing a pair rewrites its segments
+    loaded["BTC/USDT:USDT"] = df.tail(1)
+    loaded.save()
+    segments = sorted(tmp_path.glob("*/*.arrow"))
+    assert len(segments) == 1
+    assert len(pd.read_feather(segments[0])) == 1
+
+
+def test_append_model_predictions(mocker, freqai_conf, tmp_path):
+    dd = FreqaiDataDrawer(tmp_path, freqai_conf)
+    pair = "ADA/BTC"
+    dates = pd.date_range("2023-08-01", periods=4, freq="5min", tz="UTC")
+    dd.historic_predictions[pair] = pd.DataFrame(
+        {
+            "&-s_close": [0.1, 0.2, 0.3],
+            "&-s_close_mean": 0,
+            "&-s_close_std": 0,
+            "do_predict": 0,
+            "DI_values": 0,
+            "high_price": 1.0,
+            "low_price": 1.0,
+            "close_price": 1.0,
+            "date_pred": dates[:3],
+        }
+    )
+    strat_df = pd.DataFrame({"date": dates, "high": 4.0, "low": 2.0, "close": 3.0})
+    dk = MagicMock()
+    dk.data = {
+        "labels_mean": {"&-s_close": 0.5},
+        "labels_std": {"&-s_close": 0.25},
+        "extra_returns_per_train": {},
+    }
+    dk.DI_values = np.array([0.7, 0.8])
+
+    dd.append_model_predictions(
+        pair, pd.DataFrame({"&-s_close": [0.6, 0.9]}), np.array([0, 1]), dk, strat_df
+    )
+
+    hist_preds = dd.historic_predictions[pair]
+    assert len(hist_preds) == 4
+    last = hist_preds.iloc[-1]
+    assert last["&-s_close"] == 0.9
+    assert last["&-s_close_mean"] == 0.5
+    assert last["&-s_close_std"] == 0.25
+    assert last["do_predict"] == 1
+    assert last["DI_values"] == 0.8
+    assert last["close_price"] == 3.0
+    assert last["date_pred"] == dates[-1]
+    assert len(dd.model_return_values[pair]) == 4
+
+    dd.save_historic_predictions_to_disk()
+    new_dd = FreqaiDataDrawer(tmp_path, freqai_conf)
+    pd.testing.assert_frame_equal(new_dd.historic_predictions[pair], hist_preds)
+
+
+def test_historic_predictions_corrupted_segment(tmp_path, caplog):
+    dates = pd.date_range("2023-08-01", periods=3, freq="5min", tz="UTC")
+    hist_preds = HistoricPredictions(
+        tmp_path, {"ADA/BTC": pd.DataFrame({"&-s_close": [0.1, 0.2, 0.3], "date_pred": dates})}
+    )
+    hist_preds.save()
+    for i in range(2):
+        hist_preds.append("ADA/BTC", {"&-s_close": 0.4 + i, "date_pred": dates[-1]})
+        hist_preds.save()
+    segments = sorted(tmp_path.glob("*/*.arrow"))
+    assert len(segments) == 3
+    segments[1].write_bytes(b"corrupted")
+
+    loaded = HistoricPredictions(tmp_path)
+    assert loaded.load()
+    assert log_has_re(r"Historic predictions segment .* is corrupted", caplog)
+    assert np.allclose(loaded["ADA/BTC"]["&-s_close"], [0.1, 0.2, 0.3])
+    # the pair is rewritten on the next save
+    loaded.save()
+    assert len(list(tmp_path.glob("*/*.arrow"))) == 1
+
+
+def test_save_historic_predictions_without_pyarrow(mocker, freqai_conf, tmp_path):
+    mocker.patch("freqtrade.freqai.data_drawer.HISTORIC_PREDICTIONS_ARROW", False)
+    dd = FreqaiDataDrawer(tmp_path, freqai_conf)
+    df = pd.DataFrame({"&-s_close": [0.1, 0.2], "labels": ["up", 0]})
+    dd.historic_predictions["ADA/BTC"] = df
+    dd.save_historic_predictions_to_disk()
+
+    assert not dd.historic_predictions.exists()
+    assert dd.historic_predictions_pkl_path.is_file()
+    assert dd.historic_predictions_bkp_path.is_file()
+    new_dd = FreqaiDataDrawer(tmp_path, freqai_conf)
+    # the pickle keeps object columns as they are
+    pd.testing.assert_frame_equal(new_dd.historic_predictions["ADA/BTC"], df)
@@ -204,3 +204,49 @@ def test_populate_features(mocker, freqai_conf):
     )
 
     assert df.iloc[0]["date"].strftime("%Y-%m-%d %H:%M:%S") == "2018-01-15 00:00:00"
+
+
+def test_populate_features_incremental(mocker, freqai_conf):
+    freqai_conf["freqai"]["feature_parameters"].update({"include_shifted_candles": 2})
+    strategy = get_patched_freqai_strategy(mocker, freqai_conf)
+    exchange = get_patched_exchange(mocker, freqai_conf)
+    strategy.dp = DataProvider(freqai_conf, exchange)
+    strategy.freqai_info = freqai_conf.get("freqai", {})
+    freqai = strategy.freqai
+    freqai.dk = FreqaiDataKitchen(freqai_conf)
+    timerange = TimeRange.parse_timerange("20180115-20180130")
+    freqai.dd.load_all_pair_histories(timerange, freqai.dk)
+    _, base_df = freqai.dd.get_base_and_corr_dataframes(timerange, "LTC/BTC", freqai.dk)
+    candles = base_df["5m"]
+
+    expected = freqai.dk.populate_informative_features(candles, "LTC/BTC", "5m", strategy)
+
+    feature_cache = {}
+    spy = mocker.spy(freqai.dk, "populate_informative_features")
+    # first call populates all candles
+    freqai.dk.populate_features_incremental(
+        candles.iloc[:-3], "LTC/BTC", "5m", strategy, feature_cache
+    )
+    assert len(spy.call_args[0][0]) == len(candles) - 3
+
+    # new candles only populate the lookback tail, while the oldest candle rolls out
+    features = freqai.dk.populate_features_incremental(
+        candles.iloc[1:].reset_index(drop=True), "LTC/BTC", "5m", strategy, feature_cache
+    )
+    assert spy.call_count == 2
+    assert len(spy.call_args[0][0]) == 3 + strategy.startup_candle_count + 2
+    assert feature_cache[("LTC/BTC", "5m")] is features
+    pd.testing.assert_frame_equal(features, expected.iloc[1:].reset_index(drop=True))
+
+    # no new candle, the cache is reused
+    freqai.dk.populate_features_incremental(
+        candles.iloc[1:].reset_index(drop=True), "LTC/BTC", "5m", strategy, feature_cache
+    )
+    assert spy.call_count == 2
+
+    # candles that do not line up with the cache are populated in full
+    freqai.dk.populate_features_incremental(
+        candles.iloc[::2].reset_index(drop=True), "LTC/BTC", "5m", strategy, feature_cache
+    )
+    assert spy.call_count == 3
+    assert len(spy.call_args[0][0]) == len(candles.iloc[::2])
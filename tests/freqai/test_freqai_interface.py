@@ -1,14 +1,23 @@
 import logging
+import pickle
 import shutil
+from collections import deque
+from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import numpy as np
+import pandas as pd
 import pytest
+import rapidjson
+import scipy.stats
+from datasieve.transforms import DissimilarityIndex
 
 from freqtrade.configuration import TimeRange
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.enums import RunMode
 from freqtrade.freqai.data_kitchen import FreqaiDataKitchen
+from freqtrade.freqai.dissimilarity_index import TreeDissimilarityIndex
 from freqtrade.freqai.utils import download_all_data_for_training, get_required_data_timerange
 from freqtrade.optimize.backtesting import Backtesting
 from freqtrade.persistence import Trade
@@ -29,7 +38,7 @@ from tests.freqai.conftest import (
 
 
 def can_run_model(model: str) -> None:
-    is_pytorch_model = "Reinforcement" in model or "PyTorch" in model
+    is_pytorch_model = "Reinforcement" in model or "Torch" in model
 
     if is_arm() and "Catboost" in model:
         pytest.skip("CatBoost is not supported on ARM.")
@@ -248,6 +257,7 @@ def test_extract_data_and_train_model_Classifiers(mocker, freqai_conf, model):
         ("CatboostRegressor", 2, "freqai_test_strat"),
         ("PyTorchMLPRegressor", 2, "freqai_test_strat"),
         ("PyTorchTransformerRegressor", 2, "freqai_test_strat"),
+        ("LeaTorchLSTM", 2, "freqai_test_strat"),
         ("ReinforcementLearner", 3, "freqai_rl_test_strat"),
         ("XGBoostClassifier", 2, "freqai_test_classifier"),
         ("LightGBMClassifier", 2, "freqai_test_classifier"),
@@ -283,6 +293,11 @@ def test_start_backtesting(mocker, freqai_conf, model, num_files, strat, caplog)
             # transformer model takes a window, unlike the MLP regressor
             freqai_conf.update({"conv_width": 10})
 
+    if model == "LeaTorchLSTM":
+        freqai_conf["freqai"]["model_training_parameters"].update(
+            {"sequence": 10, "hidden": 16, "layers": 1, "epochs": 1}
+        )
+
     freqai_conf.get("freqai", {}).get("feature_parameters", {}).update(
         {"indicator_periods_candles": [2]}
     )
@@ -346,6 +361,63 @@ def test_start_backtesting_subdaily_backtest_period(mocker, freqai_conf):
     shutil.rmtree(Path(freqai.dk.full_path))
 
 
+def test_start_backtesting_parallel(mocker, freqai_conf, caplog):
+    freqai_conf.update({"timerange": "20180120-20180130"})
+    freqai_conf["runmode"] = "backtest"
+    freqai_conf.get("freqai", {}).update(
+        {"backtest_period_days": 2, "save_backtest_models": True, "backtest_parallel_workers": 2}
+    )
+    freqai_conf.get("freqai", {}).get("feature_parameters", {}).update(
+        {"indicator_periods_candles": [2]}
+    )
+    strategy = get_patched_freqai_strategy(mocker, freqai_conf)
+    exchange = get_patched_exchange(mocker, freqai_conf)
+    strategy.dp = DataProvider(freqai_conf, exchange)
+    strategy.freqai_info = freqai_conf.get("freqai", {})
+    freqai = strategy.freqai
+    freqai.live = False
+    freqai.dk = FreqaiDataKitchen(freqai_conf)
+    timerange = TimeRange.parse_timerange("20180110-20180130")
+    freqai.dd.load_all_pair_histories(timerange, freqai.dk)
+    sub_timerange = TimeRange.parse_timerange("20180110-20180130")
+    _, base_df = freqai.dd.get_base_and_corr_dataframes(sub_timerange, "LTC/BTC", freqai.dk)
+    df = base_df[freqai_conf["timeframe"]]
+
+    freqai.start_backtesting_parallel({"LTC/BTC": df}, strategy)
+    assert log_has_re("Trained 5/5 backtesting windows in parallel.", caplog)
+    model_folders = [x for x in freqai.dd.full_path.iterdir() if x.is_dir()]
+    assert len(model_folders) == 6
+    assert len(list((freqai.dd.full_path / "backtesting_predictions").glob("*.feather"))) == 5
+    # the pair dictionary of the workers is merged and saved once, with the latest window
+    last_window = FreqaiDataKitchen(freqai_conf, False, "LTC/BTC").training_timeranges[-1]
+    assert freqai.dd.pair_dict["LTC/BTC"]["trained_timestamp"] == int(last_window.stopts)
+    with freqai.dd.pair_dictionary_path.open() as fp:
+        assert rapidjson.load(fp)["LTC/BTC"] == freqai.dd.pair_dict["LTC/BTC"]
+
+    # all windows are on disk, the serial loop only assembles the predictions
+    train_mock = mocker.patch.object(freqai, "train")
+    metadata = {"pair": "LTC/BTC"}
+    freqai.dk.set_paths("LTC/BTC", None)
+    dk = freqai.start_backtesting(df, metadata, freqai.dk, strategy)
+    assert train_mock.call_count == 0
+    assert "&-s_close" in dk.return_dataframe.columns
+    assert dk.return_dataframe["do_predict"].abs().sum() > 0
+
+    caplog.clear()
+    freqai.start_backtesting_parallel({"LTC/BTC": df}, strategy)
+    assert log_has_re("Trained 0/0 backtesting windows in parallel.", caplog)
+
+    # windows which can't be prepared are left to the serial loop
+    shutil.rmtree(freqai.dd.full_path / "backtesting_predictions")
+    mocker.patch.object(strategy, "advise_indicators", side_effect=KeyError("missing"))
+    caplog.clear()
+    freqai.start_backtesting_parallel({"LTC/BTC": df}, strategy)
+    assert log_has_re("Preparing the backtesting windows of LTC/BTC raised exception", caplog)
+    assert log_has_re("Trained 0/0 backtesting windows in parallel.", caplog)
+
+    shutil.rmtree(Path(freqai.dk.full_path))
+
+
 def test_start_backtesting_from_existing_folder(mocker, freqai_conf, caplog):
     freqai_conf.update({"timerange": "20180120-20180130"})
     freqai_conf["runmode"] = "backtest"
@@ -435,12 +507,105 @@ def test_backtesting_fit_live_predictions(mocker, freqai_conf, caplog):
 
     assert "&-s_close_mean" not in freqai.dk.full_df.columns
     assert "&-s_close_std" not in freqai.dk.full_df.columns
+    full_df = freqai.dk.full_df.copy()
     freqai.backtesting_fit_live_predictions(freqai.dk)
     assert "&-s_close_mean" in freqai.dk.full_df.columns
     assert "&-s_close_std" in freqai.dk.full_df.columns
+    assert freqai.dk.full_df["&-s_close_mean"].iloc[:10].isna().all()
+
+    # The rolling fit matches fitting every candle with the default fit_live_predictions
+    rolling_df = freqai.dk.full_df
+    freqai.dk.full_df = full_df
+    mocker.patch.object(freqai, "_fits_live_predictions_rolling", return_value=False)
+    freqai.backtesting_fit_live_predictions(freqai.dk)
+    for col in ("&-s_close_mean", "&-s_close_std"):
+        pd.testing.assert_series_equal(rolling_df[col], freqai.dk.full_df[col], rtol=1e-9)
     shutil.rmtree(Path(freqai.dk.full_path))
 
 
+def test_fits_live_predictions_rolling(mocker, freqai_conf):
+    strategy = get_patched_freqai_strategy(mocker, freqai_conf)
+    freqai = strategy.freqai
+    assert freqai._fits_live_predictions_rolling()
+
+    class CustomFit(type(freqai)):
+        def fit_live_predictions(self, dk, pair):
+            pass
+
+    class CustomRollingFit(CustomFit):
+        def fit_live_predictions_rolling(self, dk, predictions, num_candles):
+            return predictions
+
+    freqai.__class__ = CustomFit
+    assert not freqai._fits_live_predictions_rolling()
+    freqai.__class__ = CustomRollingFit
+    assert freqai._fits_live_predictions_rolling()
+
+
+def test_fit_live_predictions_rolling(mocker, freqai_conf):
+    strategy = get_patched_freqai_strategy(mocker, freqai_conf)
+    freqai = strategy.freqai
+    rng = np.random.default_rng(42)
+    predictions = pd.DataFrame({"&-a": rng.normal(1e4, 5, 500), "&-b": rng.normal(0, 1, 500)})
+    predictions.loc[200, "&-b"] = np.nan
+
+    fitted = freqai.fit_live_predictions_rolling(freqai.dk, predictions, 50)
+    assert list(fitted.columns) == ["&-a_mean", "&-a_std", "&-b_mean", "&-b_std"]
+    assert fitted.iloc[:50].isna().all().all()
+    for index in (50, 199, 333, 499):
+        for label in ("&-a", "&-b"):
+            window = predictions[label].iloc[index - 50 : index]
+            mean, std = scipy.stats.norm.fit(window)
+            assert fitted.at[index, f"{label}_mean"] == pytest.approx(mean, rel=1e-9)
+            assert fitted.at[index, f"{label}_std"] == pytest.approx(std, rel=1e-9)
+    # windows holding a NaN prediction cannot be fitted
+    assert fitted["&-b_mean"].iloc[201:251].isna().all()
+    assert fitted["&-b_mean"].iloc[251:].notna().all()
+    assert fitted["&-a_mean"].iloc[50:].notna().all()
+
+
+@pytest.mark.parametrize("di_index", ["pairwise", "kd_tree", "ball_tree"])
+def test_define_data_pipeline_di_index(mocker, freqai_conf, di_index):
+    freqai_conf["freqai"]["feature_parameters"].update({"DI_index": di_index})
+    strategy = get_patched_freqai_strategy(mocker, freqai_conf)
+    pipeline = strategy.freqai.define_data_pipeline()
+    if di_index == "pairwise":
+        assert type(pipeline["di"]) is DissimilarityIndex
+    else:
+        assert isinstance(pipeline["di"], TreeDissimilarityIndex)
+        assert pipeline["di"].algorithm == di_index
+        assert pipeline["di"].di_threshold == 0.9
+
+
+@pytest.mark.parametrize("algorithm", ["kd_tree", "ball_tree"])
+def test_tree_dissimilarity_index(algorithm):
+    rng = np.random.default_rng(1)
+    train = rng.uniform(-1, 1, (500, 6))
+    predict = np.concatenate([rng.uniform(-1, 1, (50, 6)), rng.uniform(2, 3, (5, 6))])
+
+    pairwise_di = DissimilarityIndex(di_threshold=0.5, n_jobs=1)
+    pairwise_di.fit(train)
+    tree_di = TreeDissimilarityIndex(di_threshold=0.5, n_jobs=1, algorithm=algorithm)
+    tree_di.fit(train)
+    assert tree_di.avg_mean_dist == pytest.approx(pairwise_di.avg_mean_dist)
+
+    _, outliers, _, _ = pairwise_di.transform(predict, np.ones(55), outlier_check=True)
+    # the tree is persisted with the feature pipeline
+    tree_di = pickle.loads(pickle.dumps(tree_di))  # noqa: S301
+    _, tree_outliers, _, _ = tree_di.transform(predict, np.ones(55), outlier_check=True)
+    np.testing.assert_allclose(tree_di.di_values, pairwise_di.di_values)
+    np.testing.assert_array_equal(tree_outliers, outliers)
+    assert (tree_outliers[-5:] == 0).all()
+
+    kept, _, _, _ = tree_di.transform(predict)
+    assert len(kept) == outliers.sum()
+
+    # large training sets estimate the average mean distance from a sample
+    sampled_di = TreeDissimilarityIndex(n_jobs=1, algorithm=algorithm, max_samples=200)
+    sampled_di.fit(train)
+    assert sampled_di.avg_mean_dist == pytest.approx(pairwise_di.avg_mean_dist, rel=0.05)
+
+
 def test_plot_feature_importance(mocker, freqai_conf):
     from freqtrade.freqai.utils import plot_feature_importance
 
@@ -589,3 +754,123 @@ def test_get_state_info(mocker, freqai_conf, dp_exists, caplog, tickers):
             "No exchange available",
             caplog,
         )
+
+
+def test_training_scheduler_priority(mocker, freqai_conf):
+    freqai_conf.get("freqai", {}).update({"live_retrain_hours": 1, "train_workers": 2})
+    strategy = get_patched_freqai_strategy(mocker, freqai_conf)
+    exchange = get_patched_exchange(mocker, freqai_conf)
+    strategy.dp = DataProvider(freqai_conf, exchange)
+    freqai = strategy.freqai
+    freqai.live = True
+    now = int(datetime.now(UTC).timestamp())
+    trained = {
+        "ADA/BTC": now - 7200,
+        "DASH/BTC": now,
+        "ETH/BTC": now - 3 * 3600,
+        "LTC/BTC": now - 2 * 3600,
+    }
+    for pair, trained_timestamp in trained.items():
+        freqai.dd.pair_dict[pair] = {
+            **freqai.dd.empty_pair_dict,
+            "trained_timestamp": trained_timestamp,
+        }
+    freqai.train_queue = deque(["ADA/BTC", "DASH/BTC", "ETH/BTC"])
+    mocker.patch.object(
+        strategy.dp, "current_whitelist", return_value=["ADA/BTC", "DASH/BTC", "LTC/BTC"]
+    )
+
+    due = freqai.get_pairs_due_for_training(strategy)
+    # ETH/BTC left the whitelist, LTC/BTC joined it, DASH/BTC was just trained
+    assert due == [("LTC/BTC", trained["LTC/BTC"]), ("ADA/BTC", trained["ADA/BTC"])]
+    assert list(freqai.train_queue) == ["LTC/BTC", "ADA/BTC", "DASH/BTC"]
+    assert freqai.get_pairs_due_for_training(strategy, exclude={"LTC/BTC"}) == [
+        ("ADA/BTC", trained["ADA/BTC"])
+    ]
+
+    # open trades come first, then the oldest model
+    assert freqai.get_training_priority(now - 3600, 0) > freqai.get_training_priority(now, 10)
+    assert freqai.get_training_priority(now - 3600, 0) < freqai.get_training_priority(now, 0)
+    # pairs whose last training failed go last, longest ago first
+    assert freqai.get_training_priority(now, 0) < freqai.get_training_priority(0, 10, 5.0)
+    assert freqai.get_training_priority(0, 10, 5.0) < freqai.get_training_priority(0, 10, 6.0)
+
+    trades = [MagicMock(pair="ADA/BTC", stake_amount=0.1)]
+    mocker.patch("freqtrade.freqai.freqai_interface.Trade.get_open_trades", return_value=trades)
+    assert freqai.get_open_trade_exposure() == {"ADA/BTC": 0.1}
+
+    freqai.train_workers = 1
+    mocker.patch("freqtrade.freqai.freqai_interface.time.sleep")
+    trained_pairs = []
+
+    def train_pair(pair, strategy):
+        trained_pairs.append(pair)
+        freqai._stop_event.set()
+
+    mocker.patch.object(freqai, "_train_pair", side_effect=train_pair)
+    freqai._start_scanning(strategy)
+    # ADA/BTC holds an open trade, so it is trained before the older LTC/BTC model
+    assert trained_pairs == ["ADA/BTC"]
+    assert freqai.train_queue_depth == 2
+    shutil.rmtree(Path(freqai.dd.full_path))
+
+
+def test_training_scheduler_failing_pair(mocker, freqai_conf):
+    freqai_conf.get("freqai", {}).update({"live_retrain_hours": 1, "train_workers": 1})
+    strategy = get_patched_freqai_strategy(mocker, freqai_conf)
+    exchange = get_patched_exchange(mocker, freqai_conf)
+    strategy.dp = DataProvider(freqai_conf, exchange)
+    freqai = strategy.freqai
+    freqai.live = True
+    now = int(datetime.now(UTC).timestamp())
+    trained = {"ADA/BTC": now - 7200, "ETH/BTC": now - 3 * 3600, "LTC/BTC": now - 2 * 3600}
+    for pair, trained_timestamp in trained.items():
+        freqai.dd.pair_dict[pair] = {
+            **freqai.dd.empty_pair_dict,
+            "trained_timestamp": trained_timestamp,
+        }
+    freqai.train_queue = deque(trained)
+    mocker.patch.object(strategy.dp, "current_whitelist", return_value=list(trained))
+    trades = [MagicMock(pair="ADA/BTC", stake_amount=0.1)]
+    mocker.patch("freqtrade.freqai.freqai_interface.Trade.get_open_trades", return_value=trades)
+    mocker.patch("freqtrade.freqai.freqai_interface.time.sleep")
+    trained_pairs = []
+
+    def train_pair(pair, strategy):
+        trained_pairs.append(pair)
+        if len(trained_pairs) == 4:
+            freqai._stop_event.set()
+        if pair == "ADA/BTC":
+            raise ValueError("training failed")
+        freqai.dd.pair_dict[pair]["trained_timestamp"] = now
+
+    mocker.patch.object(freqai, "_train_pair", side_effect=train_pair)
+    freqai._start_scanning(strategy)
+    # ADA/BTC holds an open trade but keeps failing, so it does not starve the other pairs
+    assert trained_pairs == ["ADA/BTC", "ETH/BTC", "LTC/BTC", "ADA/BTC"]
+    assert list(freqai.train_backoff) == ["ADA/BTC"]
+    shutil.rmtree(Path(freqai.dd.full_path), ignore_errors=True)
+
+
+def test_cache_corr_pairlist_dfs(mocker, freqai_conf):
+    strategy = get_patched_freqai_strategy(mocker, freqai_conf)
+    freqai = strategy.freqai
+    dk = MagicMock(pair="ADA/BTC")
+    corr_df = pd.DataFrame({"date": [1, 2], "%-feature-ETH/BTC": [0.1, 0.2]})
+    dk.extract_corr_pair_columns_from_populated_indicators.return_value = {"ETH/BTC": corr_df}
+    dataframe = pd.DataFrame({"date": [1, 2]})
+
+    freqai.cache_corr_pairlist_dfs(dataframe, dk, do_corr_pairs=True)
+    assert freqai.get_corr_dataframes is False
+    assert list(freqai.corr_dataframes) == ["ETH/BTC"]
+    dk.attach_corr_pair_columns.assert_not_called()
+
+    # A pair which populated its corr features before the cache was flipped by another pair
+    # must not attach the cached columns a second time
+    freqai.cache_corr_pairlist_dfs(dataframe, dk, do_corr_pairs=True)
+    dk.attach_corr_pair_columns.assert_not_called()
+
+    freqai.cache_corr_pairlist_dfs(dataframe, dk, do_corr_pairs=False)
+    dk.attach_corr_pair_columns.assert_called_once_with(
+        dataframe, freqai.corr_dataframes, "ADA/BTC"
+    )
@@ -0,0 +1,134 @@
+import logging
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+import pytest
+from stable_baselines3 import PPO
+
+from freqtrade.freqai.data_kitchen import FreqaiDataKitchen
+from freqtrade.freqai.RL.Base5ActionRLEnv import Actions, Base5ActionRLEnv, Positions
+from tests.conftest import is_arm, is_mac
+from tests.freqai.conftest import get_patched_freqaimodel, make_rl_config
+
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture(autouse=True)
+def skip_on_intel_mac():
+    if is_mac() and not is_arm():
+        pytest.skip("Reinforcement learning module not available on intel based Mac OS.")
+
+
+class ProfitRLEnv(Base5ActionRLEnv):
+    def calculate_reward(self, action: int) -> float:
+        if not self._is_valid(action):
+            return -2
+        return self.get_unrealized_profit()
+
+
+def make_env(freqai_conf, n_rows=500, n_features=8, add_state_info=False, live=False):
+    conf = make_rl_config(freqai_conf)
+    conf["freqai"]["rl_config"]["add_state_info"] = add_state_info
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame(
+        rng.uniform(-1, 1, (n_rows, n_features)), columns=[f"%-f{i}" for i in range(n_features)]
+    )
+    prices = pd.DataFrame({"open": 100 + rng.normal(0, 1, n_rows).cumsum()})
+    env = ProfitRLEnv(
+        df=df,
+        prices=prices,
+        reward_kwargs=conf["freqai"]["rl_config"]["model_reward_parameters"],
+        window_size=10,
+        config=conf,
+        live=live,
+        df_raw=df,
+    )
+    return env, df, prices
+
+
+def test_rl_env_observation(freqai_conf):
+    env, df, _ = make_env(freqai_conf)
+    observation, _ = env.reset()
+    assert observation.dtype == np.float32
+    assert observation.shape == env.observation_space.shape
+    np.testing.assert_array_equal(observation, df.iloc[0:10].to_numpy(dtype=np.float32))
+
+    observation, *_ = env.step(Actions.Long_enter.value)
+    np.testing.assert_array_equal(observation, df.iloc[1:11].to_numpy(dtype=np.float32))
+
+
+def test_rl_env_observation_state_info(freqai_conf):
+    env, df, prices = make_env(freqai_conf, add_state_info=True, live=True)
+    observation, _ = env.reset()
+    assert observation.shape == (10, 11)
+    assert (observation[:, 8:] == [0, Positions.Neutral.value, 0]).all()
+
+    env.step(Actions.Long_enter.value)
+    env.step(Actions.Neutral.value)
+    observation, _, _, _, info = env.step(Actions.Neutral.value)
+    np.testing.assert_array_equal(observation[:, :8], df.iloc[3:13].to_numpy(dtype=np.float32))
+    entry_price = env.add_entry_fee(prices["open"].iloc[11])
+    exit_price = env.add_exit_fee(prices["open"].iloc[13])
+    profit = (exit_price - entry_price) / entry_price
+    assert info["current_profit_pct"] == pytest.approx(profit)
+    assert observation[:, 8] == pytest.approx(profit)
+    assert (observation[:, 9] == Positions.Long.value).all()
+    assert (observation[:, 10] == 2).all()
+    assert env.current_price() == prices["open"].iloc[13]
+
+
+def test_rl_env_observation_state_info_not_overwritten(freqai_conf):
+    env, _, _ = make_env(freqai_conf, add_state_info=True, live=True)
+    first, _ = env.reset()
+    first_copy = first.copy()
+    observation, *_ = env.step(Actions.Long_enter.value)
+    observation_copy = observation.copy()
+    env.step(Actions.Neutral.value)
+    env.step(Actions.Neutral.value)
+    # The terminal observation kept by vectorized environments survives the reset
+    env.reset()
+    np.testing.assert_array_equal(first, first_copy)
+    np.testing.assert_array_equal(observation, observation_copy)
+    assert (observation[:, 9] == Positions.Long.value).all()
+
+
+def test_rl_env_step_benchmark(freqai_conf):
+    n_rows = 20_000
+    env, _, _ = make_env(freqai_conf, n_rows=n_rows, n_features=64)
+    actions = np.random.default_rng(5).integers(0, len(Actions), n_rows)
+
+    env.reset()
+    start = perf_counter()
+    n_steps = 0
+    for action in actions:
+        *_, done, _, _ = env.step(int(action))
+        n_steps += 1
+        if done:
+            env.reset()
+    logger.info(f"Base5ActionRLEnv: {n_steps / (perf_counter() - start):,.0f} steps/sec")
+    assert n_steps == n_rows
+
+
+def test_rl_model_predict_batched(mocker, freqai_conf):
+    env, df, _ = make_env(freqai_conf, n_rows=1500)
+    model = PPO("MlpPolicy", env, seed=1, policy_kwargs={"net_arch": [16]})
+    freqai_conf.update({"freqaimodel": "ReinforcementLearner"})
+    freqai = get_patched_freqaimodel(mocker, freqai_conf)
+    freqai.live = False
+    freqai.CONV_WIDTH = 10
+    dk = FreqaiDataKitchen(freqai_conf)
+    dk.label_list = ["&-action"]
+
+    pred_df = freqai.rl_model_predict(df, dk, model)
+    assert list(pred_df.columns) == ["&-action"]
+    assert len(pred_df) == 1500
+    assert pred_df["&-action"].iloc[:9].isna().all()
+    expected = [
+        model.predict(df.iloc[i - 9 : i + 1].to_numpy(np.float32), deterministic=True)[0]
+        for i in range(9, 1500)
+    ]
+    np.testing.assert_array_equal(pred_df["&-action"].iloc[9:], expected)
+
+    assert freqai.rl_model_predict(df.iloc[:5], dk, model)["&-action"].isna().all()
@@ -0,0 +1,150 @@
+import logging
+from time import perf_counter
+
+import pytest
+import torch
+from torch.utils.data import BatchSampler, DataLoader, SequentialSampler
+
+from freqtrade.freqai.torch.datasets import StridedWindowDataset, WindowDataset, sliding_windows
+from freqtrade.freqai.torch.PyTorchInferenceEngine import PyTorchInferenceEngine
+from freqtrade.freqai.torch.PyTorchMLPModel import PyTorchMLPModel
+from freqtrade.freqai.torch.PyTorchTransformerModel import PyTorchTransformerModel
+from tests.conftest import is_mac
+
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture(autouse=True)
+def skip_on_intel_mac():
+    if is_mac():
+        pytest.skip("PyTorch module not available on intel based Mac OS.")
+
+
+def test_sliding_windows():
+    xs = torch.arange(30, dtype=torch.float32).reshape(10, 3)
+    windows = sliding_windows(xs, 4)
+
+    assert windows.shape == (7, 4, 3)
+    # strided view, no copy of the feature tensor
+    assert windows.untyped_storage().data_ptr() == xs.untyped_storage().data_ptr()
+    for i in range(len(windows)):
+        assert torch.equal(windows[i], xs[i : i + 4])
+
+    assert sliding_windows(xs, 11).shape == (0, 11, 3)
+
+
+def test_strided_window_dataset():
+    xs = torch.arange(30, dtype=torch.float32).reshape(10, 3)
+    ys = torch.arange(10, dtype=torch.float32).reshape(10, 1)
+    dataset = StridedWindowDataset(xs, ys, 4)
+
+    assert len(dataset) == 7
+    window_x, window_y = dataset[0]
+    assert torch.equal(window_x, xs[0:4])
+    # label is aimed at the last row of the window
+    assert window_y.item() == 3
+    window_x, window_y = dataset[6]
+    assert torch.equal(window_x, xs[6:10])
+    assert window_y.item() == 9
+
+
+def test_window_dataset_batched_matches_per_item():
+    xs = torch.randn(200, 5)
+    ys = torch.randn(200, 2)
+    dataset = WindowDataset(xs, ys, 10)
+
+    batch_x, batch_y = dataset[[0, 1, 7, 189]]
+    assert batch_x.shape == (4, 10, 5)
+    assert batch_y.shape == (4, 1, 2)
+    for i, index in enumerate([0, 1, 7, 189]):
+        window_x, window_y = dataset[index]
+        assert torch.equal(batch_x[i], window_x)
+        assert torch.equal(batch_y[i], window_y)
+
+
+def test_window_dataset_sampling_benchmark():
+    n_rows, n_features, window_size, batch_size = 20_000, 32, 30, 64
+    xs = torch.randn(n_rows, n_features)
+    ys = torch.randn(n_rows, 1)
+    dataset = WindowDataset(xs, ys, window_size)
+
+    per_item = DataLoader(dataset, batch_size=batch_size, shuffle=False, drop_last=True)
+    batched = DataLoader(
+        dataset,
+        batch_size=None,
+        sampler=BatchSampler(SequentialSampler(dataset), batch_size=batch_size, drop_last=True),
+    )
+
+    rates = {}
+    batches = {}
+    for name, loader in (("per-item", per_item), ("batched", batched)):
+        start = perf_counter()
+        batches[name] = list(loader)
+        rates[name] = len(batches[name]) * batch_size / (perf_counter() - start)
+        logger.info(f"WindowDataset {name} sampling: {rates[name]:,.0f} windows/sec")
+
+    assert len(batches["per-item"]) == len(batches["batched"])
+    for (x1, y1), (x2, y2) in zip(batches["per-item"], batches["batched"], strict=True):
+        assert torch.equal(x1, x2)
+        assert torch.equal(y1, y2)
+
+
+@pytest.mark.parametrize("compile_mode", [None, "trace"])
+def test_inference_engine_matches_model(compile_mode):
+    torch.manual_seed(0)
+    model = PyTorchMLPModel(input_dim=8, output_dim=2, hidden_dim=16)
+    xs = torch.randn(1000, 8)
+    model.eval()
+    with torch.no_grad():
+        expected = model(xs).numpy()
+
+    engine = PyTorchInferenceEngine(model, device="cpu", batch_size=300, compile_mode=compile_mode)
+    y = engine.predict(xs)
+    assert y.shape == (1000, 2)
+    assert y.dtype == expected.dtype
+    assert torch.allclose(torch.from_numpy(y), torch.from_numpy(expected), atol=1e-6)
+
+    probs = engine.predict(xs, postprocess=lambda logits: torch.softmax(logits, dim=-1))
+    assert torch.allclose(torch.from_numpy(probs.sum(axis=1)), torch.ones(1000))
+
+    assert engine.predict(xs[:0]).shape == (0, 2)
+
+    with pytest.raises(ValueError, match=r"batch size must be at least 1"):
+        PyTorchInferenceEngine(model, device="cpu", batch_size=0)
+
+
+def test_inference_engine_windows():
+    torch.manual_seed(0)
+    model = PyTorchTransformerModel(input_dim=8, output_dim=1, hidden_dim=32, time_window=5)
+    windows = sliding_windows(torch.randn(100, 8), 5)
+    model.eval()
+    with torch.no_grad():
+        expected = torch.cat([model(windows[i : i + 1]) for i in range(len(windows))], dim=1)
+
+    y = PyTorchInferenceEngine(model, device="cpu", batch_size=16).predict(windows)
+    assert y.shape == (96, 1, 1)
+    assert torch.allclose(torch.from_numpy(y).reshape(1, 96, 1), expected, atol=1e-5)
+
+
+def test_inference_engine_benchmark():
+    torch.manual_seed(0)
+    n_rows, n_features = 50_000, 64
+    model = PyTorchMLPModel(input_dim=n_features, output_dim=1, hidden_dim=256, n_layer=2)
+    xs = torch.randn(n_rows, n_features)
+    engine = PyTorchInferenceEngine(model, device="cpu", batch_size=8192)
+
+    def full_graph():
+        model.eval()
+        return model(xs).detach().tolist()
+
+    results = {}
+    for name, predict in (("full graph", full_graph), ("engine", lambda: engine.predict(xs))):
+        start = perf_counter()
+        results[name] = predict()
+        rate = n_rows / (perf_counter() - start)
+        logger.info(f"PyTorch {name} inference: {rate:,.0f} rows/sec")
+
+    assert torch.allclose(
+        torch.from_numpy(results["engine"]), torch.tensor(results["full graph"]), atol=1e-6
+    )
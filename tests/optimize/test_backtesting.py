@@ -24,7 +24,8 @@ from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.exchange import timeframe_to_next_date, timeframe_to_prev_date
 from freqtrade.exchange.exchange_utils import DECIMAL_PLACES, TICK_SIZE
 from freqtrade.optimize.backtest_caching import get_backtest_metadata_filename, get_strategy_run_id
-from freqtrade.optimize.backtesting import Backtesting
+from freqtrade.optimize.backtest_candles import PairCandles
+from freqtrade.optimize.backtesting import DATE_IDX, HEADERS, Backtesting
 from freqtrade.persistence import LocalTrade, Trade
 from freqtrade.resolvers import StrategyResolver
 from freqtrade.util import dt_now, dt_utc
@@ -873,6 +874,111 @@ def test_backtest_one(default_conf, mocker, testdatadir) -> None:
         ) < round(t["close_rate"], 6) < round(ln1.iloc[0]["high"], 6)
 
 
+def test_backtest_ohlcv_cache(default_conf, mocker, testdatadir) -> None:
+    default_conf["use_exit_signal"] = False
+    default_conf["max_open_trades"] = 10
+
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    pair = "UNITTEST/BTC"
+    data = history.load_data(
+        datadir=testdatadir,
+        timeframe="5m",
+        pairs=[pair],
+        timerange=TimeRange("date", None, 1517227800, 0),
+    )
+    processed = backtesting.strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(processed)
+
+    expected = backtesting._get_ohlcv_as_lists(deepcopy(processed))
+
+    backtesting.ohlcv_cache = {}
+    assert backtesting._get_ohlcv_as_lists(deepcopy(processed)) == expected
+    assert len(backtesting.ohlcv_cache[pair]) == 5
+    assert backtesting.ohlcv_cache[pair][0][0] == expected[pair][0][0]
+
+    # Cached columns are reused for the next epoch, only the 6 signal columns are converted
+    tolist = mocker.spy(pd.Series, "tolist")
+    assert backtesting._get_ohlcv_as_lists(deepcopy(processed)) == expected
+    assert tolist.call_count == 6
+
+    result = backtesting.backtest(
+        processed=deepcopy(processed), start_date=min_date, end_date=max_date
+    )
+    assert len(result["results"]) == 2
+
+
+@pytest.mark.parametrize("use_detail", [True, False])
+def test_backtest_array_data(default_conf_usdt, mocker, testdatadir, use_detail) -> None:
+    default_conf_usdt["use_exit_signal"] = False
+    default_conf_usdt["max_open_trades"] = 2
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    if use_detail:
+        default_conf_usdt["timeframe_detail"] = "1m"
+
+    def advise_entry(df, *args, **kwargs):
+        # Mock function to force several entries
+        df.loc[(df["rsi"] < 40), "enter_long"] = 1
+        df.loc[(df["rsi"] < 40), "enter_tag"] = "rsi"
+        return df
+
+    pairs = ["XRP/ETH", "ETH/BTC"]
+    timerange = TimeRange.parse_timerange("20191010-20191013")
+    data = history.load_data(datadir=testdatadir, timeframe="5m", pairs=pairs, timerange=timerange)
+
+    def run_backtest(array_data: bool):
+        default_conf_usdt["backtest_array_data"] = array_data
+        backtesting = Backtesting(default_conf_usdt)
+        backtesting._set_strategy(backtesting.strategylist[0])
+        backtesting.strategy.populate_entry_trend = advise_entry
+        if use_detail:
+            backtesting.detail_data = history.load_data(
+                datadir=testdatadir, timeframe="1m", pairs=pairs, timerange=timerange
+            )
+        processed = backtesting.strategy.advise_all_indicators(deepcopy(data))
+        min_date, max_date = get_timerange(processed)
+        loop = mocker.spy(backtesting, "backtest_loop")
+        result = backtesting.backtest(processed=processed, start_date=min_date, end_date=max_date)
+        return result, loop.call_count
+
+    result_lists, loops_lists = run_backtest(False)
+    result_arrays, loops_arrays = run_backtest(True)
+
+    assert len(result_lists["results"]) > 2
+    pd.testing.assert_frame_equal(result_arrays["results"], result_lists["results"])
+    assert result_arrays["rejected_signals"] == result_lists["rejected_signals"]
+    assert result_arrays["final_balance"] == result_lists["final_balance"]
+    # Candles without signal or open trade were skipped
+    assert loops_arrays < loops_lists
+
+
+def test_pair_candles(testdatadir) -> None:
+    df = history.load_pair_history(pair="UNITTEST/BTC", timeframe="5m", datadir=testdatadir)
+    df = df.head(4)
+    df["enter_long"] = [1.0, 1.0, 0.0, 0.0]
+    df["exit_long"] = [0.0, 1.0, 0.0, 0.0]
+    df["enter_short"] = [0.0, 0.0, 1.0, 1.0]
+    df["exit_short"] = 0.0
+    df["enter_tag"] = ["a", None, None, None]
+    df["exit_tag"] = None
+
+    candles = PairCandles(df)
+    assert len(candles) == 4
+    assert list(candles[0]) == df[HEADERS].values.tolist()[0]
+    assert candles[-1][DATE_IDX] == df["date"].iloc[-1]
+    assert candles[0][DATE_IDX].tzinfo is not None
+    assert candles.entry_signals(False).tolist() == [True, False, False, False]
+    assert candles.entry_signals(True).tolist() == [True, False, True, True]
+    with pytest.raises(IndexError):
+        candles[4]
+    assert len(PairCandles(df.iloc[0:0])) == 0
+
+
 @pytest.mark.parametrize("use_detail", [True, False])
 def test_backtest_one_detail(default_conf_usdt, mocker, testdatadir, use_detail) -> None:
     default_conf_usdt["use_exit_signal"] = False
@@ -1,4 +1,5 @@
 # pragma pylint: disable=missing-docstring,W0212,C0103
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from functools import partial, wraps
 from pathlib import Path
@@ -7,12 +8,15 @@ from unittest.mock import ANY, MagicMock, PropertyMock
 import pandas as pd
 import pytest
 from filelock import Timeout
+from joblib import dump
+from optuna.trial import TrialState
 
 from freqtrade.commands.optimize_commands import setup_optimize_configuration, start_hyperopt
 from freqtrade.data.history import load_data
 from freqtrade.enums import ExitType, RunMode
 from freqtrade.exceptions import OperationalException
-from freqtrade.optimize.hyperopt import Hyperopt
+from freqtrade.optimize.hyperopt import Hyperopt, hyperopt_optimizer
+from freqtrade.optimize.hyperopt import hyperopt as hyperopt_module
 from freqtrade.optimize.hyperopt.hyperopt_auto import HyperOptAuto
 from freqtrade.optimize.hyperopt_tools import HyperoptTools
 from freqtrade.optimize.optimize_reports import generate_strategy_stats
@@ -651,6 +655,31 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
     assert generate_optimizer_value == response_expected
 
 
+def test_load_processed(mocker, hyperopt_conf, tmp_path) -> None:
+    patch_exchange(mocker)
+    hyperopt_conf.update({"user_data_dir": tmp_path})
+    (tmp_path / "hyperopt_results").mkdir(parents=True)
+    hyperopt = Hyperopt(hyperopt_conf)
+    opt = hyperopt.hyperopter
+    dump({"UNITTEST/BTC": pd.DataFrame({"close": [1.0, 2.0]})}, opt.data_pickle_file)
+    opt.data_version = 1
+    load_mock = mocker.spy(hyperopt_optimizer, "load")
+
+    processed, ohlcv_cache = opt.load_processed()
+    processed["UNITTEST/BTC"]["enter_long"] = 1
+    ohlcv_cache["UNITTEST/BTC"] = [[1.0, 2.0]]
+    processed1, ohlcv_cache1 = opt.load_processed()
+    # Loaded once, signal columns of an epoch don't leak into the next one
+    assert load_mock.call_count == 1
+    assert list(processed1["UNITTEST/BTC"].columns) == ["close"]
+    assert ohlcv_cache1 is ohlcv_cache
+
+    opt.data_version = 2
+    _, ohlcv_cache2 = opt.load_processed()
+    assert load_mock.call_count == 2
+    assert ohlcv_cache2 == {}
+
+
 def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
     patch_exchange(mocker)
 
@@ -1223,6 +1252,75 @@ def test_in_strategy_auto_hyperopt_per_epoch(mocker, hyperopt_conf, tmp_path, fe
     assert go.call_count == 3
 
 
+def test_duplicate_optuna_asked_points_running(mocker, hyperopt_conf, tmp_path) -> None:
+    patch_exchange(mocker)
+    hyperopt_conf.update({"user_data_dir": tmp_path})
+    (tmp_path / "hyperopt_results").mkdir(parents=True)
+    trial = MagicMock(params={"buy_rsi": 30})
+    trial.study.get_trials.return_value = []
+    hyperopt = Hyperopt(hyperopt_conf)
+
+    assert not hyperopt.duplicate_optuna_asked_points(trial, [trial])
+    # Points still being evaluated by a streaming worker are duplicates too
+    running = [MagicMock(params={"buy_rsi": 20}), MagicMock(params={"buy_rsi": 30})]
+    assert hyperopt.duplicate_optuna_asked_points(trial, [trial], running)
+    assert not hyperopt.duplicate_optuna_asked_points(trial, [trial], running[:1])
+
+
+def test_in_strategy_auto_hyperopt_stream_epochs(mocker, hyperopt_conf, tmp_path, fee) -> None:
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    (tmp_path / "hyperopt_results").mkdir(parents=True)
+
+    hyperopt_conf.update(
+        {
+            "strategy": "HyperoptableStrategy",
+            "user_data_dir": tmp_path,
+            "hyperopt_random_state": 42,
+            "spaces": ["all"],
+            "epochs": 5,
+            "hyperopt_jobs": 2,
+            "stream_epochs": True,
+        }
+    )
+    losses = iter([0.5, 0.2, 0.4, 0.1, 0.3])
+
+    def generate_optimizer(params_dict):
+        return {
+            "loss": next(losses),
+            "results_explanation": "foo result",
+            "params": {},
+            "results_metrics": generate_result_metrics(),
+        }
+
+    go = mocker.patch(
+        "freqtrade.optimize.hyperopt.hyperopt_optimizer.HyperOptimizer.generate_optimizer",
+        side_effect=generate_optimizer,
+    )
+    # Run the epochs in threads, the mock can't be sent to worker processes
+    mocker.patch(
+        "freqtrade.optimize.hyperopt.hyperopt.get_reusable_executor",
+        side_effect=lambda max_workers: ThreadPoolExecutor(max_workers),
+    )
+    batched = mocker.patch("freqtrade.optimize.hyperopt.hyperopt.Hyperopt.run_optimizer_parallel")
+    mp_setup = mocker.spy(hyperopt_module, "logging_mp_setup")
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.hyperopter.backtesting.exchange.get_max_leverage = MagicMock(return_value=1.0)
+
+    hyperopt.start()
+
+    assert go.call_count == 5
+    assert batched.call_count == 0
+    # Every streamed epoch sets up logging to the parent's queue in its worker
+    assert mp_setup.call_count == 5
+    assert all(c.args[0] is hyperopt_module.log_queue for c in mp_setup.call_args_list)
+    assert hyperopt.num_epochs_saved == 5
+    assert len(hyperopt.opt.get_trials(states=[TrialState.COMPLETE])) == 5
+    assert hyperopt.current_best_loss == 0.1
+    results = [r for batch in HyperoptTools._read_results(hyperopt.results_file) for r in batch]
+    assert [r["current_epoch"] for r in results] == [1, 2, 3, 4, 5]
+
+
 def test_SKDecimal():
     space = SKDecimal(1, 2, decimals=2)
     assert space._contains(1.5)
@@ -1,9 +1,13 @@
 # pragma pylint: disable=missing-docstring, W0212, line-too-long, C0103, unused-argument
+import pickle
 from copy import deepcopy
+from functools import partial
 from pathlib import Path
 from unittest.mock import MagicMock, PropertyMock
 
+import pandas as pd
 import pytest
+from joblib import Parallel
 
 from freqtrade.commands.optimize_commands import start_lookahead_analysis
 from freqtrade.data.history import get_timerange
@@ -492,6 +496,51 @@ def test_biased_strategy(lookahead_conf, mocker, caplog, scenario) -> None:
         assert instance.current_analysis.has_bias
 
 
+def test_biased_strategy_parallel(lookahead_conf, mocker, caplog) -> None:
+    patch_exchange(mocker)
+    mocker.patch("freqtrade.data.history.get_timerange", get_timerange)
+    mocker.patch(f"{EXMS}.get_fee", return_value=0.0)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(
+        "freqtrade.plugins.pairlistmanager.PairListManager.whitelist",
+        PropertyMock(return_value=["UNITTEST/BTC"]),
+    )
+    # Mocks don't reach worker processes, and backtests can't share a process concurrently
+    mocker.patch(
+        "freqtrade.optimize.analysis.base_analysis.Parallel",
+        partial(Parallel, backend="sequential"),
+    )
+    mocker.patch(
+        "freqtrade.strategy.hyper.HyperStrategyMixin.load_params_from_file",
+        return_value={"params": {"buy": {"scenario": "bias1"}}},
+    )
+    lookahead_conf["pairs"] = ["UNITTEST/USDT"]
+    lookahead_conf["timeframe"] = "5m"
+    lookahead_conf["timerange"] = "20180119-20180122"
+    strategy_obj = {"name": "strategy_test_v3_with_lookahead_bias"}
+
+    serial = LookaheadAnalysis(lookahead_conf, strategy_obj)
+    serial.start()
+
+    lookahead_conf["analysis_jobs"] = 2
+    instance = LookaheadAnalysis(lookahead_conf, strategy_obj)
+    instance.start()
+    assert log_has_re(r"Running \d+ backtests with 2 jobs\.", caplog)
+    assert instance.current_analysis.has_bias
+    assert vars(instance.current_analysis) == vars(serial.current_analysis)
+    assert len(instance.entry_varHolders) == len(serial.entry_varHolders)
+    # Sent to worker processes
+    worker = pickle.loads(pickle.dumps(instance._worker_copy(0, {})))  # noqa: S301
+    assert worker.analysis_jobs == 2
+    assert worker.exchange is None
+    for parallel_vh, serial_vh in zip(
+        instance.exit_varHolders, serial.exit_varHolders, strict=True
+    ):
+        assert parallel_vh.to_dt == serial_vh.to_dt
+        pd.testing.assert_frame_equal(parallel_vh.result["results"], serial_vh.result["results"])
+
+
 def test_config_overrides(lookahead_conf):
     lookahead_conf["max_open_trades"] = 0
     lookahead_conf["dry_run_wallet"] = 1
@@ -1,9 +1,11 @@
 # pragma pylint: disable=missing-docstring, W0212, line-too-long, C0103, unused-argument
 from copy import deepcopy
+from functools import partial
 from pathlib import Path
 from unittest.mock import MagicMock, PropertyMock
 
 import pytest
+from joblib import Parallel
 
 from freqtrade.commands.optimize_commands import start_recursive_analysis
 from freqtrade.data.history import get_timerange
@@ -182,3 +184,38 @@ def test_recursive_biased_strategy(recursive_conf, mocker, caplog, scenario) ->
     # check biased strategy
     elif scenario in ("bias1", "bias2"):
         assert diff_pct >= 0.01
+
+
+def test_recursive_biased_strategy_parallel(recursive_conf, mocker, caplog) -> None:
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_fee", return_value=0.0)
+    mocker.patch("freqtrade.data.history.get_timerange", get_timerange)
+    mocker.patch(
+        "freqtrade.plugins.pairlistmanager.PairListManager.whitelist",
+        PropertyMock(return_value=["UNITTEST/BTC"]),
+    )
+    # Mocks don't reach worker processes
+    mocker.patch(
+        "freqtrade.optimize.analysis.base_analysis.Parallel",
+        partial(Parallel, backend="sequential"),
+    )
+    mocker.patch(
+        "freqtrade.strategy.hyper.HyperStrategyMixin.load_params_from_file",
+        return_value={"params": {"buy": {"scenario": "bias2"}}},
+    )
+    recursive_conf["pairs"] = ["UNITTEST/BTC"]
+    recursive_conf["timeframe"] = "5m"
+    recursive_conf["timerange"] = "20180119-20180122"
+    recursive_conf["startup_candle"] = [100, 200]
+    strategy_obj = {"name": "strategy_test_v3_recursive_issue"}
+
+    serial = RecursiveAnalysis(recursive_conf, strategy_obj)
+    serial.start()
+
+    recursive_conf["analysis_jobs"] = 2
+    instance = RecursiveAnalysis(recursive_conf, strategy_obj)
+    instance.start()
+    assert log_has_re(r"Running 3 backtests with 2 jobs\.", caplog)
+    assert log_has_re("=> found lookahead in indicator rsi", caplog)
+    assert instance.dict_recursive == serial.dict_recursive
+    assert [vh.startup_candle for vh in instance.partial_varHolder_array] == [100, 200]
@@ -1889,6 +1889,78 @@ def test_get_trades_proxy(fee, use_db, is_short):
     Trade.use_db = True
 
 
+@pytest.mark.usefixtures("init_persistence")
+@pytest.mark.parametrize("use_db", [True, False])
+def test_get_closed_records_proxy(fee, use_db):
+    Trade.use_db = use_db
+    Trade.reset_trades()
+    create_mock_trades(fee, False, use_db)
+    close_date = datetime.now(tz=UTC) - timedelta(days=1)
+
+    trades = Trade.get_trades_proxy(is_open=False, close_date=close_date)
+    records = Trade.get_closed_records_proxy(close_date=close_date)
+    assert len(records) == len(trades) == 2
+    assert [r.close_date for r in records] == sorted(r.close_date for r in records)
+    for record, trade in zip(records, sorted(trades, key=lambda t: t.close_date), strict=True):
+        assert record.close_date.replace(tzinfo=None) == trade.close_date.replace(tzinfo=None)
+        assert record.close_profit == trade.close_profit
+        assert record.close_profit_abs == trade.close_profit_abs
+
+    assert len(Trade.get_closed_records_proxy(close_date=close_date, pair="ETC/BTC")) == 1
+    assert Trade.get_closed_records_proxy(close_date=close_date, pair="ETH/BTC") == []
+    assert Trade.get_closed_records_proxy(close_date=datetime.now(tz=UTC)) == []
+
+    Trade.use_db = True
+
+
+def test_get_trades_proxy_closed_index():
+    LocalTrade.reset_trades()
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    pairs = ["XRP/USDT", "ETH/USDT", "BTC/USDT"]
+    # Close dates out of order, as with trades closed at the end of a backtest
+    for i in [3, 0, 7, 5, 1, 9, 2, 8, 6, 4, 5]:
+        trade = LocalTrade(
+            pair=pairs[i % 3],
+            open_date=start + timedelta(hours=i),
+            amount=1,
+            open_rate=1,
+        )
+        trade.is_open = False
+        trade.close_date = start + timedelta(hours=i, minutes=30)
+        LocalTrade.add_bt_trade(trade)
+    LocalTrade.add_bt_trade(LocalTrade(pair="XRP/USDT", open_date=start, amount=1, open_rate=1))
+
+    def scan(pair, open_date, close_date):
+        return {
+            id(t)
+            for t in LocalTrade.bt_trades
+            if (not pair or t.pair == pair)
+            and (not open_date or t.open_date > open_date)
+            and t.close_date
+            and t.close_date > close_date
+        }
+
+    for pair in [None, *pairs]:
+        for hours in range(-1, 11):
+            close_date = start + timedelta(hours=hours)
+            for open_date in [None, start + timedelta(hours=4)]:
+                trades = LocalTrade.get_trades_proxy(
+                    pair=pair, is_open=False, open_date=open_date, close_date=close_date
+                )
+                assert {id(t) for t in trades} == scan(pair, open_date, close_date)
+                assert [t.close_date for t in trades] == sorted(t.close_date for t in trades)
+
+    assert len(LocalTrade.get_trades_proxy(is_open=False, close_date=start)) == 11
+    for pair in [None, *pairs]:
+        close_date = start + timedelta(hours=4)
+        trades = LocalTrade.get_trades_proxy(pair=pair, is_open=False, close_date=close_date)
+        records = LocalTrade.get_closed_records_proxy(pair=pair, close_date=close_date)
+        assert [r.close_date for r in records] == [t.close_date for t in trades]
+    assert len(LocalTrade.get_trades_proxy(is_open=True)) == 1
+    LocalTrade.reset_trades()
+    assert LocalTrade.get_trades_proxy(is_open=False, close_date=start) == []
+
+
 @pytest.mark.usefixtures("init_persistence")
 @pytest.mark.parametrize("is_short", [True, False])
 def test_get_trades__query(fee, is_short):
@@ -1947,6 +2019,39 @@ def test_get_best_pair(fee, is_short, pair, profit):
     assert pytest.approx(res[1]) == profit
 
 
+@pytest.mark.usefixtures("init_persistence")
+def test_get_closed_profit_summary(fee):
+    res = Trade.get_closed_profit_summary()
+    assert res.trade_count == 0
+    assert res.profit_abs_sum == 0
+    assert res.last_id is None
+
+    create_mock_trades_usdt(fee)
+    closed = Trade.get_trades([Trade.is_open.is_(False)]).all()
+    res = Trade.get_closed_profit_summary()
+    assert res.trade_count == len(closed) == 3
+    assert pytest.approx(res.profit_ratio_sum) == sum(t.close_profit for t in closed)
+    assert pytest.approx(res.profit_abs_sum) == sum(t.close_profit_abs for t in closed)
+    winning = [t for t in closed if t.close_profit >= 0]
+    assert res.winning_trades == len(winning)
+    assert pytest.approx(res.winning_profit) == sum(t.close_profit_abs for t in winning)
+    assert res.losing_trades == len(closed) - len(winning)
+    assert res.last_id == max(t.id for t in closed)
+
+    res = Trade.get_closed_profit_summary([Trade.pair == "XRP/USDT"])
+    assert res.trade_count == 1
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_get_exit_reason_summary(fee):
+    assert Trade.get_exit_reason_summary() == []
+
+    create_mock_trades_usdt(fee)
+    res = Trade.get_exit_reason_summary()
+    # Ordered by first occurrence
+    assert [tuple(r) for r in res] == [(None, 0, 1, 0), ("exit_signal", 1, 0, 0), ("roi", 1, 0, 0)]
+
+
 @pytest.mark.usefixtures("init_persistence")
 def test_get_best_pair_lev(fee):
     res = Trade.get_best_pair()
@@ -2137,6 +2242,8 @@ def test_Trade_object_idem():
         "get_enter_tag_performance",
         "get_mix_tag_performance",
         "get_trading_volume",
+        "get_closed_profit_summary",
+        "get_exit_reason_summary",
         "validate_string_len",
         "custom_data",
     )
@@ -2144,6 +2251,8 @@ def test_Trade_object_idem():
         "bt_trades",
         "bt_trades_open",
         "bt_trades_open_pp",
+        "bt_trades_closed",
+        "bt_trades_closed_pp",
         "bt_open_open_trade_count",
         "bt_total_profit",
         "from_json",
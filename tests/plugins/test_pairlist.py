@@ -1124,6 +1124,84 @@ def test_VolumePairList_range(
         assert whitelist == volumefilter_result
 
 
+def test_VolumePairList_range_incremental(
+    mocker, whitelist_conf, shitcoinmarkets, time_machine
+) -> None:
+    whitelist_conf["pairlists"] = [
+        {
+            "method": "VolumePairList",
+            "number_assets": 5,
+            "lookback_timeframe": "1d",
+            "lookback_period": 3,
+            "refresh_period": 86400,
+        }
+    ]
+    mocker.patch(f"{EXMS}.exchange_has", MagicMock(return_value=True))
+    freqtrade = get_patched_freqtradebot(mocker, whitelist_conf)
+    mocker.patch.multiple(EXMS, markets=PropertyMock(return_value=shitcoinmarkets))
+    start_dt = dt_utc(2024, 3, 10, 12)
+    time_machine.move_to(start_dt, tick=False)
+
+    pairs = ["ETH/BTC", "TKN/BTC", "LTC/BTC"]
+    history = {
+        pair: generate_test_data("1d", 20, "2024-02-20 00:00:00+00:00", random_seed=seed)
+        for seed, pair in enumerate(pairs)
+    }
+    # TKN/BTC misses the last candles
+    history["TKN/BTC"] = history["TKN/BTC"].iloc[:-4]
+
+    def refresh_ohlcv(pair_list, since_ms):
+        result = {}
+        for pair, timeframe, candle_type in pair_list:
+            df = history[pair]
+            # Only complete candles are returned
+            df = df[
+                (df["date"] >= pd.Timestamp(since_ms, unit="ms", tz="UTC"))
+                & (df["date"] < dt_now() - timedelta(days=1))
+            ]
+            result[(pair, timeframe, candle_type)] = df.reset_index(drop=True)
+        return result
+
+    def expected_volumes():
+        since = pd.Timestamp(dt_now() - timedelta(days=4)).floor("1D")
+        result = []
+        for pair in pairs:
+            candles = refresh_ohlcv([(pair, "1d", CandleType.SPOT)], since.value // 10**6)
+            df = candles[(pair, "1d", CandleType.SPOT)]
+            typical_price = (df["high"] + df["low"] + df["close"]) / 3
+            volume = (df["volume"] * typical_price).rolling(3).sum().fillna(0)
+            result.append(volume.iloc[-1] if len(df) else 0)
+        return result
+
+    refresh_mock = mocker.patch(f"{EXMS}.refresh_ohlcv_with_cache", side_effect=refresh_ohlcv)
+    pairlist = freqtrade.pairlists._pairlist_handlers[0]
+    since_ms = int(pd.Timestamp("2024-03-06", tz="UTC").timestamp() * 1000)
+
+    volumes = pairlist._range_quote_volumes(pairs, since_ms)
+    assert refresh_mock.call_count == 1
+    assert volumes == pytest.approx(expected_volumes())
+    assert volumes[1] == 0
+
+    # One day later, only candles after the cached ones are downloaded
+    time_machine.move_to(start_dt + timedelta(days=1), tick=False)
+    refresh_mock.reset_mock()
+    volumes = pairlist._range_quote_volumes(pairs, since_ms + 86400000)
+    # TKN/BTC has no cached candle in range anymore and is downloaded in full
+    assert refresh_mock.call_count == 2
+    assert [(len(c[0][0]), c[0][1]) for c in refresh_mock.call_args_list] == [
+        (2, since_ms + 4 * 86400000),
+        (1, since_ms + 86400000),
+    ]
+    assert volumes == pytest.approx(expected_volumes())
+    # Cached candles which left the range are dropped
+    assert len(pairlist._range_volumes["ETH/BTC"][0]) == 4
+    assert "TKN/BTC" not in pairlist._range_volumes
+
+    # Pairs not in the list anymore are dropped from the cache
+    pairlist._range_quote_volumes(pairs[:1], since_ms + 86400000)
+    assert list(pairlist._range_volumes) == ["ETH/BTC"]
+
+
 def test_PrecisionFilter_error(mocker, whitelist_conf) -> None:
     whitelist_conf["pairlists"] = [{"method": "StaticPairList"}, {"method": "PrecisionFilter"}]
     del whitelist_conf["stoploss"]
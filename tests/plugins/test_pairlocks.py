@@ -158,3 +158,52 @@ def test_PairLocks_reason(use_db):
 
     PairLocks.reset_locks()
     PairLocks.use_db = True
+
+
+def test_PairLocks_index_backtesting():
+    PairLocks.timeframe = "5m"
+    PairLocks.use_db = False
+    PairLocks.reset_locks()
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    pairs = ["XRP/USDT", "ETH/USDT", "*"]
+    sides = ["*", "long", "short"]
+
+    def scan(pair, now, side):
+        return [
+            lock
+            for lock in PairLocks.get_all_locks()
+            if lock.lock_end_time >= now
+            and lock.active
+            and (pair is None or lock.pair == pair)
+            and (side is None or lock.side in ("*", side))
+        ]
+
+    for i in range(200):
+        now = start + timedelta(minutes=5 * i)
+        PairLocks.lock_pair(
+            pairs[i % 3],
+            now + timedelta(minutes=5 * (i % 7)),
+            reason=f"reason{i % 4}",
+            now=now,
+            side=sides[i % 5 % 3],
+        )
+        if i % 11 == 0:
+            PairLocks.unlock_pair("ETH/USDT", now)
+        for pair in [None, *pairs]:
+            for side in [None, *sides]:
+                assert PairLocks.get_pair_locks(pair, now, side) == scan(pair, now, side)
+
+    # Expired locks are evicted from the index, but still returned for earlier dates
+    assert len(PairLocks._index) < len(pairs) * len(sides)
+    assert len(PairLocks.get_all_locks()) == 200
+    earlier = start + timedelta(minutes=5 * 50)
+    assert PairLocks.get_pair_locks(None, earlier) == scan(None, earlier, None)
+    assert PairLocks.get_pair_locks("XRP/USDT", earlier, "long") == scan(
+        "XRP/USDT", earlier, "long"
+    )
+    assert PairLocks.is_pair_locked("XRP/USDT", earlier)
+
+    PairLocks.reset_locks()
+    assert PairLocks._index == {}
+    assert PairLocks.get_pair_locks(None, start) == []
+    PairLocks.use_db = True
@@ -497,6 +497,37 @@ def test_rpc_trade_statistics(default_conf_usdt, ticker, fee, mocker) -> None:
     assert isnan(stats["profit_all_coin"])
 
 
+def test_rpc_trade_statistics_cache(default_conf_usdt, ticker, fee, mocker) -> None:
+    mocker.patch("freqtrade.rpc.telegram.Telegram", MagicMock())
+    mocker.patch.multiple(EXMS, fetch_ticker=ticker, get_fee=fee)
+    freqtradebot = get_patched_freqtradebot(mocker, default_conf_usdt)
+    create_mock_trades_usdt(fee)
+    rpc = RPC(freqtradebot)
+    expectancy_mock = mocker.patch(
+        "freqtrade.rpc.rpc.calculate_expectancy", return_value=(0.5, 0.1)
+    )
+
+    stats = rpc._rpc_trade_statistics("USDT", "USD")
+    assert stats["closed_trade_count"] == 3
+    assert expectancy_mock.call_count == 1
+
+    # Closed trades didn't change - cached
+    stats = rpc._rpc_trade_statistics("USDT", "USD")
+    assert expectancy_mock.call_count == 1
+    assert stats["expectancy"] == 0.5
+    # Other filters are cached separately
+    rpc._rpc_trade_statistics("USDT", "USD", direction="long")
+    assert expectancy_mock.call_count == 2
+
+    trade = Trade.session.scalars(select(Trade).filter(Trade.is_open.is_(True))).first()
+    trade.close(trade.open_rate * 1.1)
+    Trade.commit()
+
+    stats = rpc._rpc_trade_statistics("USDT", "USD")
+    assert stats["closed_trade_count"] == 4
+    assert expectancy_mock.call_count == 3
+
+
 def test_rpc_balance_handle_error(default_conf, mocker):
     mock_balance = {
         "BTC": {
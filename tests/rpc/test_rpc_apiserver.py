@@ -23,6 +23,7 @@ from freqtrade.__init__ import __version__
 from freqtrade.enums import CandleType, RunMode, State, TradingMode
 from freqtrade.exceptions import DependencyException, ExchangeError, OperationalException
 from freqtrade.loggers import setup_logging, setup_logging_pre
+from freqtrade.misc import json_to_dataframe
 from freqtrade.optimize.backtesting import Backtesting
 from freqtrade.persistence import CustomDataWrapper, Trade
 from freqtrade.rpc import RPC
@@ -30,6 +31,10 @@ from freqtrade.rpc.api_server import ApiServer
 from freqtrade.rpc.api_server.api_auth import create_token, get_user_from_token
 from freqtrade.rpc.api_server.uvicorn_threaded import UvicornServer
 from freqtrade.rpc.api_server.webserver_bgwork import ApiBG
+from freqtrade.rpc.api_server.ws.serializer import (
+    ARROW_WS_SUBPROTOCOL,
+    HybridArrowWebSocketSerializer,
+)
 from freqtrade.util.datetime_helpers import format_date
 from tests.conftest import (
     CURRENT_TEST_STRATEGY,
@@ -3170,6 +3175,104 @@ def test_api_ws_requests(botclient, caplog):
     assert response["type"] == "analyzed_df"
 
 
+def test_api_ws_analyzed_df_since(botclient, mocker):
+    _ftbot, client = botclient
+    ws_url = f"/api/v1/message/ws?token={_TEST_WS_TOKEN}"
+    df = generate_test_data("5m", 50, "2024-01-01 00:00:00+00:00")
+    mocker.patch(
+        "freqtrade.data.dataprovider.DataProvider.get_analyzed_dataframe",
+        return_value=(df, datetime.now(UTC)),
+    )
+    since = int(df["date"].iloc[45].timestamp() * 1000)
+
+    with client.websocket_connect(ws_url) as ws:
+        ws.send_json(
+            {"type": "analyzed_df", "data": {"pair": "XRP/BTC", "since": {"XRP/BTC": since}}}
+        )
+        response = ws.receive_json()
+
+    assert response["data"]["delta"] is True
+    result = json_to_dataframe(response["data"]["df"]["__value__"])
+    assert len(result) == 5
+    assert result["date"].iloc[0] == df["date"].iloc[45]
+
+    # The consumer's last candle is older than what we have - send everything
+    since = int((df["date"].iloc[0] - timedelta(minutes=5)).timestamp() * 1000)
+    with client.websocket_connect(ws_url) as ws:
+        ws.send_json(
+            {"type": "analyzed_df", "data": {"pair": "XRP/BTC", "since": {"XRP/BTC": since}}}
+        )
+        response = ws.receive_json()
+
+    assert response["data"]["delta"] is False
+    assert len(json_to_dataframe(response["data"]["df"]["__value__"])) == 50
+
+    # Gap request for the 4 missing candles - the consumer's last candle is still included
+    since = int(df["date"].iloc[45].timestamp() * 1000)
+    with client.websocket_connect(ws_url) as ws:
+        ws.send_json(
+            {
+                "type": "analyzed_df",
+                "data": {"pair": "XRP/BTC", "limit": 4, "since": {"XRP/BTC": since}},
+            }
+        )
+        response = ws.receive_json()
+
+    assert response["data"]["delta"] is True
+    result = json_to_dataframe(response["data"]["df"]["__value__"])
+    assert len(result) == 5
+    assert result["date"].iloc[0] == df["date"].iloc[45]
+
+    # Without the consumer's last candle, the limit applies
+    since = int((df["date"].iloc[0] - timedelta(minutes=5)).timestamp() * 1000)
+    with client.websocket_connect(ws_url) as ws:
+        ws.send_json(
+            {
+                "type": "analyzed_df",
+                "data": {"pair": "XRP/BTC", "limit": 4, "since": {"XRP/BTC": since}},
+            }
+        )
+        response = ws.receive_json()
+
+    assert response["data"]["delta"] is False
+    assert len(json_to_dataframe(response["data"]["df"]["__value__"])) == 4
+
+
+def test_api_ws_arrow_requests(botclient, ohlcv_history):
+    _ftbot, client = botclient
+    ws_url = f"/api/v1/message/ws?token={_TEST_WS_TOKEN}"
+    serializer = HybridArrowWebSocketSerializer(None)
+
+    with client.websocket_connect(ws_url, subprotocols=[ARROW_WS_SUBPROTOCOL]) as ws:
+        assert ws.accepted_subprotocol == ARROW_WS_SUBPROTOCOL
+        # Messages without dataframes stay JSON
+        ws.send_json({"type": "whitelist", "data": None})
+        response = ws.receive_json()
+        assert response["type"] == "whitelist"
+
+        ws.send_json({"type": "analyzed_df", "data": {}})
+        response = serializer._deserialize(ws.receive_bytes())
+
+    assert response["type"] == "analyzed_df"
+    assert isinstance(response["data"]["df"], pd.DataFrame)
+
+    df = ohlcv_history.iloc[10:].copy()
+    df["enter_tag"] = None
+    df.loc[12, "enter_tag"] = "tag"
+    message = {"type": "analyzed_df", "data": {"key": ("UNITTEST/BTC", "5m", "spot"), "df": df}}
+    data = serializer._serialize(message)
+    assert isinstance(data, bytes)
+    result = serializer._deserialize(data)
+    pd.testing.assert_frame_equal(result["data"]["df"], df)
+    assert result["data"]["key"] == ["UNITTEST/BTC", "5m", "spot"]
+
+    # Not convertible to Arrow, sent as JSON
+    mixed = pd.DataFrame({"value": [1, "a"]})
+    data = serializer._serialize({"df": mixed})
+    assert isinstance(data, str)
+    assert serializer._deserialize(data)["df"]["value"].tolist() == [1, "a"]
+
+
 def test_api_ws_send_msg(default_conf, mocker, caplog):
     try:
         caplog.set_level(logging.DEBUG)
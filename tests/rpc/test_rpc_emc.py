@@ -11,8 +11,10 @@ import pytest
 import websockets
 
 from freqtrade.data.dataprovider import DataProvider
+from freqtrade.enums import CandleType
+from freqtrade.rpc import external_message_consumer
 from freqtrade.rpc.external_message_consumer import ExternalMessageConsumer
-from tests.conftest import log_has, log_has_re, log_has_when
+from tests.conftest import generate_test_data, log_has, log_has_re, log_has_when
 
 
 _TEST_WS_TOKEN = "secret_Ws_t0ken"
@@ -160,7 +162,57 @@ def test_emc_handle_producer_message(patched_emc, caplog, ohlcv_history):
     assert log_has_re(r"Empty message .+", caplog)
 
 
-async def test_emc_create_connection_success(default_conf, caplog, mocker):
+def test_emc_delta_resync(patched_emc, mocker):
+    producer = {"name": "default"}
+    pair, timeframe = "BTC/USDT", "5m"
+    df = generate_test_data(timeframe, 300, "2024-01-01 00:00:00+00:00")
+    dp = patched_emc._dp
+    dp._replace_external_df(pair, df.iloc[:50], datetime.now(UTC), timeframe, CandleType.SPOT)
+    last_candle = int(df["date"].iloc[49].timestamp() * 1000)
+
+    initial_requests = patched_emc._get_initial_requests("default")
+    assert initial_requests[2].data == {"limit": 1500, "pair": None, "since": {pair: last_candle}}
+    assert patched_emc._get_initial_requests("other") == patched_emc._initial_requests
+
+    request_mock = mocker.patch(
+        "freqtrade.rpc.external_message_consumer.ExternalMessageConsumer.send_producer_request"
+    )
+
+    def df_message(dataframe, delta=False):
+        return {
+            "type": "analyzed_df",
+            "data": {
+                "key": (pair, timeframe, "spot"),
+                "df": dataframe,
+                "la": datetime.now(UTC),
+                "delta": delta,
+            },
+        }
+
+    # Missed candles - request from our last candle on
+    patched_emc.handle_producer_message(producer, df_message(df.iloc[260:261]))
+    assert request_mock.call_count == 1
+    request = request_mock.call_args[0][1]
+    assert request.data == {"limit": 1500, "pair": pair, "since": {pair: last_candle}}
+
+    # The delta is appended, even though it's longer than a full dataframe threshold
+    patched_emc.handle_producer_message(producer, df_message(df.iloc[49:261], delta=True))
+    assert request_mock.call_count == 1
+    result, _ = dp.get_producer_df(pair, timeframe, CandleType.SPOT)
+    assert len(result) == 261
+    assert result["date"].equals(df["date"].iloc[:261])
+
+
+@pytest.mark.parametrize(
+    "subprotocols,serializer",
+    [
+        (None, "HybridJSONWebSocketSerializer"),
+        (["freqtrade.arrow"], "HybridArrowWebSocketSerializer"),
+    ],
+)
+async def test_emc_create_connection_success(
+    default_conf, caplog, mocker, subprotocols, serializer
+):
     default_conf.update(
         {
             "external_message_consumer": {
@@ -194,11 +246,13 @@ async def test_emc_create_connection_success(default_conf, caplog, mocker):
     async def eat(websocket):
         emc._running = False
 
+    create_channel_spy = mocker.spy(external_message_consumer, "create_channel")
     try:
-        async with websockets.serve(eat, _TEST_WS_HOST, _TEST_WS_PORT):
+        async with websockets.serve(eat, _TEST_WS_HOST, _TEST_WS_PORT, subprotocols=subprotocols):
             await emc._create_connection(test_producer, lock)
 
         assert log_has_re(r"Connected to channel.+", caplog)
+        assert create_channel_spy.call_args.kwargs["serializer_cls"].__name__ == serializer
     finally:
         emc.shutdown()
 
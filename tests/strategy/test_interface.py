@@ -1,6 +1,8 @@
 # pragma pylint: disable=missing-docstring, C0103
 import logging
 import math
+import threading
+import time
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -17,6 +19,7 @@ from freqtrade.exceptions import OperationalException, StrategyError
 from freqtrade.persistence import PairLocks, Trade
 from freqtrade.resolvers import StrategyResolver
 from freqtrade.strategy.hyper import detect_parameters
+from freqtrade.strategy.interface import IStrategy
 from freqtrade.strategy.parameters import (
     IntParameter,
 )
@@ -855,6 +858,39 @@ def test__analyze_ticker_internal_skip_analyze(ohlcv_history, mocker, caplog) ->
     assert log_has("Skipping TA Analysis for already analyzed candle", caplog)
 
 
+@pytest.mark.parametrize("workers", [1, 3])
+def test_analyze_concurrent(ohlcv_history, mocker, workers) -> None:
+    pairs = ["ETH/BTC", "LTC/BTC", "XRP/BTC", "NEO/BTC", "TRX/BTC"]
+    threads = {}
+
+    def analyze_ticker(dataframe, metadata):
+        threads[metadata["pair"]] = threading.current_thread().name
+        # later pairs finish first
+        time.sleep(0.01 * (len(pairs) - pairs.index(metadata["pair"])))
+        return dataframe
+
+    mocker.patch.object(IStrategy, "analyze_ticker", side_effect=analyze_ticker)
+    strategy = StrategyTestV3({"analyze_workers": workers})
+    strategy.load_freqAI_model()
+    strategy.dp = DataProvider({}, None, None)
+    mocker.patch.object(strategy.dp, "ohlcv", return_value=ohlcv_history)
+    cached_mock = mocker.patch.object(strategy.dp, "_set_cached_df")
+    emit_mock = mocker.patch.object(strategy.dp, "_emit_df")
+
+    strategy.analyze(pairs)
+
+    assert [c[0][0] for c in cached_mock.call_args_list] == pairs
+    assert [c[0][0][0] for c in emit_mock.call_args_list] == pairs
+    assert set(strategy.analysis_durations) == set(pairs)
+    assert all(duration > 0 for duration in strategy.analysis_durations.values())
+    assert threads[pairs[0]] == threading.current_thread().name
+    on_workers = [p for p in pairs[1:] if threads[p] != threading.current_thread().name]
+    assert len(on_workers) == (len(pairs) - 1 if workers > 1 else 0)
+
+    strategy.ft_bot_cleanup()
+    assert strategy._analyze_executor is None
+
+
 @pytest.mark.usefixtures("init_persistence")
 def test_is_pair_locked(default_conf):
     PairLocks.timeframe = default_conf["timeframe"]
@@ -67,6 +67,20 @@ def test_load_config_incorrect_stake_amount(default_conf) -> None:
         validate_config_schema(default_conf)
 
 
+@pytest.mark.parametrize(
+    "analysis_jobs,match",
+    [
+        (0, r"0 should not be valid under"),
+        (-2, r"-2 is less than the minimum of -1"),
+    ],
+)
+def test_load_config_incorrect_analysis_jobs(default_conf, analysis_jobs, match) -> None:
+    default_conf["analysis_jobs"] = analysis_jobs
+
+    with pytest.raises(ConfigurationError, match=match):
+        validate_config_schema(default_conf)
+
+
 def test_load_config_file(default_conf, mocker, caplog) -> None:
     del default_conf["user_data_dir"]
     default_conf["datadir"] = str(default_conf["datadir"])